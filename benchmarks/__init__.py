@@ -0,0 +1,4 @@
+"""Performance benchmarks for the dashboard pages and simulation kernels.
+
+Run ``python -m benchmarks``; see ``benchmarks/__main__.py`` for options.
+"""
@@ -0,0 +1,160 @@
+"""Run the benchmarks, append them to a JSON history and gate on regressions.
+
+    python -m benchmarks                     # kernels and pages
+    python -m benchmarks --only kernels --filter grinding --threshold 0.1
+    python -m benchmarks --quick --no-record
+
+Each kernel size is timed as the best of ``--repeat`` runs. A kernel fails
+when it is slower than ``1 + threshold`` times its baseline, the median of
+its last ``--baseline-runs`` recorded timings on this host. Page timings are
+recorded and reported but only gated with ``--gate-pages``, which also
+fails the run when a page raises. The exit status is 1 on any gated
+failure.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HISTORY = Path(__file__).resolve().parent / "history.json"
+# Everything the pages persist on disk, redirected below one scratch directory
+SCRATCH_DIRS = {
+    'SIMULATION_CACHE': 'cache',
+    'SIMULATION_RESULTS': 'results',
+    'SIMULATION_CHECKPOINTS': 'checkpoints',
+    'SIMULATION_WITNESSES': 'witnesses',
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def time_kernels(name_filter, repeat, quick):
+    from .kernels import KERNELS
+
+    results = {}
+    for name, (sizes, setup) in KERNELS.items():
+        if name_filter and name_filter not in f"kernel:{name}":
+            continue
+        for size in sizes[:1] if quick else sizes:
+            fn = setup(size)
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - start)
+            key = f"kernel:{name}[{size}]"
+            results[key] = best
+            print(f"{key:<45} {best * 1000:>10.1f} ms", flush=True)
+    return results
+
+
+def time_pages(name_filter, scratch):
+    from .pages import page_names, time_page
+
+    results, failures = {}, []
+    for name in page_names():
+        if name_filter and name_filter not in f"page:{name}":
+            continue
+        # Every cold render starts without the runs earlier pages left on disk
+        shutil.rmtree(scratch, ignore_errors=True)
+        try:
+            cold, warm = time_page(name)
+        except RuntimeError as exc:
+            failures.append(str(exc))
+            print(f"page:{name:<40} FAILED ({exc})", flush=True)
+            continue
+        results[f"page:{name}[cold]"] = cold
+        results[f"page:{name}[warm]"] = warm
+        print(f"page:{name:<40} {cold * 1000:>10.1f} ms cold {warm * 1000:>8.1f} ms warm", flush=True)
+    return results, failures
+
+
+def load_history(path):
+    if not path.exists():
+        return []
+    return json.loads(path.read_text())
+
+
+def regressions(results, history, threshold, baseline_runs, gate_pages):
+    """``(key, seconds, baseline)`` for every gated timing slower than its baseline allows."""
+    host = platform.node()
+    found = []
+    for key, seconds in results.items():
+        if key.startswith('page:') and not gate_pages:
+            continue
+        past = [run['results'][key] for run in history if run['host'] == host and key in run['results']]
+        if not past:
+            continue
+        baseline = statistics.median(past[-baseline_runs:])
+        if seconds > baseline * (1 + threshold):
+            found.append((key, seconds, baseline))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument('--only', choices=['kernels', 'pages'], help="run only one group")
+    parser.add_argument('--filter', default='', help="run only timings whose key contains this text")
+    parser.add_argument('--repeat', type=int, default=3, help="kernel runs per size, best is kept (default: 3)")
+    parser.add_argument('--quick', action='store_true', help="smallest size of each kernel only")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed slowdown over the baseline, as a fraction (default: 0.25)")
+    parser.add_argument('--baseline-runs', type=int, default=5,
+                        help="recorded runs the baseline median is taken over (default: 5)")
+    parser.add_argument('--gate-pages', action='store_true', help="also fail on page regressions and page errors")
+    parser.add_argument('--history', type=Path, default=HISTORY, help=f"history file (default: {HISTORY})")
+    parser.add_argument('--no-record', action='store_true', help="do not append this run to the history")
+    args = parser.parse_args(argv)
+
+    # Pages must simulate, not hit the on-disk result cache or a precomputed sweep
+    scratch = tempfile.mkdtemp(prefix="bench-")
+    for variable, name in SCRATCH_DIRS.items():
+        os.environ[variable] = os.path.join(scratch, name)
+
+    results, failures = {}, []
+    try:
+        if args.only != 'pages':
+            results.update(time_kernels(args.filter, args.repeat, args.quick))
+        if args.only != 'kernels':
+            page_results, failures = time_pages(args.filter, scratch)
+            results.update(page_results)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    history = load_history(args.history)
+    slow = regressions(results, history, args.threshold, args.baseline_runs, args.gate_pages)
+    for key, seconds, baseline in slow:
+        print(f"REGRESSION {key}: {seconds * 1000:.1f} ms vs baseline {baseline * 1000:.1f} ms "
+              f"(+{(seconds / baseline - 1) * 100:.0f}%, allowed +{args.threshold * 100:.0f}%)")
+
+    if not args.no_record:
+        history.append({
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'host': platform.node(),
+            'python': platform.python_version(),
+            'cpus': os.cpu_count(),
+            'results': results,
+        })
+        args.history.write_text(json.dumps(history, indent=1) + "\n")
+
+    return 1 if slow or (failures and args.gate_pages) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Simulation kernels timed at several input sizes.
+
+Each entry maps a kernel name to ``(sizes, setup)``. ``setup(size)`` builds
+the inputs untimed and returns the zero-argument callable that is timed.
+"""
+
+import numpy as np
+
+from simulation import alias, bft, election, grinding, network, rollup, vdf, witness
+
+
+def _alias_sample(n):
+    sampler = alias.AliasSampler(np.random.default_rng(0).pareto(1.5, n) + 1.0)
+    rng = np.random.default_rng(1)
+    return lambda: sampler.sample(1_000_000, rng)
+
+
+def _election(slots):
+    region, stake, latency_ms = election.make_validators(10_000)
+    return lambda: election.simulate(region, stake, latency_ms, slots)
+
+
+def _network(nodes):
+    graph = network.make_gossip_graph(nodes)
+    return lambda: network.propagate(graph, 100, workers=1)
+
+
+def _bft(n):
+    return lambda: bft.simulate(n, heights=2, byzantine_fraction=0.2)
+
+
+def _rollup(transactions):
+    return lambda: rollup.run_pipeline(transactions=transactions)
+
+
+def _grinding(trials):
+    return lambda: grinding.simulate(trials, workers=1)
+
+
+def _witness_verify(blocks):
+    stakes = np.random.default_rng(0).pareto(1.5, 128) + 1.0
+    witnesses = witness.build_witnesses(range(blocks), stakes, b"bench")
+    return lambda: witness.verify_witnesses(witnesses, stakes, b"bench", workers=1)
+
+
+def _vdf_evaluate(T):
+    x = vdf.hash_to_group(b"bench", vdf.RSA_2048)
+    return lambda: vdf.evaluate(x, T, vdf.RSA_2048)
+
+
+KERNELS = {
+    'alias.sample_1M': ((1_000, 100_000, 1_000_000), _alias_sample),
+    'election.simulate': ((10_000, 100_000, 1_000_000), _election),
+    'network.propagate_100': ((1_000, 10_000), _network),
+    'bft.simulate': ((100, 500, 2_000), _bft),
+    'rollup.run_pipeline': ((20_000, 100_000), _rollup),
+    'grinding.simulate': ((100_000, 1_000_000, 10_000_000), _grinding),
+    'witness.verify': ((100, 1_000), _witness_verify),
+    'vdf.evaluate': ((10_000, 100_000), _vdf_evaluate),
+}
@@ -0,0 +1,48 @@
+"""Headless render timings of every sidebar page via Streamlit's AppTest."""
+
+import logging
+import time
+from pathlib import Path
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+import views
+
+APP = Path(__file__).resolve().parent.parent / "Demo.py"
+
+
+def time_page(name, timeout=300):
+    """``(cold, warm)`` seconds to render page ``name``.
+
+    Cold starts from empty Streamlit caches (the caller empties the on-disk
+    ones) and includes the page's simulations; warm is a rerun of the same
+    page with caches filled. The default page is timed on the app's first
+    run, any other page on the switch to it from the default page.
+    """
+    # Bare-mode warnings and app tracebacks would drown the report
+    logging.disable(logging.CRITICAL)
+    try:
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        at = AppTest.from_file(str(APP), default_timeout=timeout)
+        # The first run renders the default page, so that is its cold render
+        start = time.perf_counter()
+        at.run()
+        if name != page_names()[0]:
+            start = time.perf_counter()
+            at.sidebar.radio[0].set_value(name).run()
+        cold = time.perf_counter() - start
+        if at.exception:
+            raise RuntimeError(f"page {name!r} raised: {at.exception[0].value}")
+
+        start = time.perf_counter()
+        at.run()
+        warm = time.perf_counter() - start
+    finally:
+        logging.disable(logging.NOTSET)
+    return cold, warm
+
+
+def page_names():
+    return list(views.PAGES)
@@ -0,0 +1 @@
+"""Simulation engines behind the Verifiable Fairness dashboard."""
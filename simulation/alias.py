@@ -0,0 +1,128 @@
+"""Stake-weighted leader sampling with Walker/Vose alias tables.
+
+Alias tables give O(1) draws: pick a bucket uniformly, then keep it or jump
+to its alias with one comparison. Tables are built with a vectorized sweep
+(prefix sums over the light buckets' deficits and the heavy buckets'
+excess) instead of Vose's Python-level worklists, so building a table for a
+million validators is a handful of NumPy calls.
+
+``AliasSampler`` splits the validator set into fixed-size blocks with a
+top-level table over block totals. A stake change only rebuilds the blocks
+it touches plus the small top-level table.
+"""
+
+import numpy as np
+
+# Scaled weights this close to 1 count as full buckets; summing to n in floating
+# point can leave every one of them a rounding error short
+EPS = 1e-9
+
+
+def build_alias_table(weights):
+    """Return ``(prob, alias)`` for sampling index ``i`` with probability ∝ ``weights[i]``."""
+    weights = np.asarray(weights, dtype=np.float64)
+    n = len(weights)
+    total = weights.sum()
+    if n == 0 or total <= 0:
+        raise ValueError("alias table needs at least one positive weight")
+
+    q = weights * (n / total)
+    prob = np.ones(n)
+    alias = np.arange(n, dtype=np.int64)
+
+    light = np.flatnonzero(q < 1.0 - EPS)
+    heavy = np.flatnonzero(q >= 1.0 - EPS)
+    if len(light) == 0:
+        return prob, alias
+
+    # Sweep: heavy buckets hand out their excess in order. Light bucket k is
+    # served by the first heavy bucket whose cumulative excess exceeds the
+    # deficit handed out before k; a heavy bucket that can no longer cover
+    # the next deficit becomes light itself and aliases to the next heavy.
+    deficit = np.cumsum(1.0 - q[light])
+    excess = np.cumsum(np.maximum(q[heavy] - 1.0, 0.0))
+    before = np.concatenate(([0.0], deficit[:-1]))
+
+    donor = np.minimum(np.searchsorted(excess, before, side='right'), len(heavy) - 1)
+    prob[light] = q[light]
+    alias[light] = heavy[donor]
+    # Light buckets past the last of the excess are only short by rounding; they keep themselves
+    leftover = light[before >= excess[-1]]
+    prob[leftover] = 1.0
+    alias[leftover] = leftover
+
+    served = np.searchsorted(before, excess, side='left')
+    handed = np.where(served > 0, deficit[np.maximum(served - 1, 0)], 0.0)
+    remaining = np.clip(1.0 + excess - handed, 0.0, 1.0)
+    prob[heavy[:-1]] = remaining[:-1]
+    alias[heavy[:-1]] = heavy[1:]
+    return prob, alias
+
+
+def sample_alias(prob, alias, size, rng):
+    """Draw ``size`` indices from an alias table."""
+    buckets = rng.integers(len(prob), size=size)
+    keep = rng.random(size) < prob[buckets]
+    return np.where(keep, buckets, alias[buckets])
+
+
+class AliasSampler:
+    """Two-level alias sampler with incremental rebuilds on stake changes."""
+
+    def __init__(self, stakes, block_size=4096):
+        stakes = np.asarray(stakes, dtype=np.float64)
+        self.n = len(stakes)
+        self.block_size = block_size
+        self.blocks = -(-self.n // block_size)
+        self.stakes = np.zeros(self.blocks * block_size)
+        self.prob = np.ones(len(self.stakes))
+        self.alias = np.zeros(len(self.stakes), dtype=np.int64)
+        self.block_totals = np.zeros(self.blocks)
+        self.stakes[:self.n] = stakes
+        self._rebuild(np.arange(self.blocks))
+
+    def update(self, indices, stakes):
+        """Set new stakes for ``indices`` and rebuild only the affected blocks."""
+        indices = np.asarray(indices, dtype=np.int64)
+        if len(indices) and (indices.min() < 0 or indices.max() >= self.n):
+            raise IndexError("validator index out of range")
+        self.stakes[indices] = stakes
+        self._rebuild(np.unique(indices // self.block_size))
+
+    def set_stakes(self, stakes):
+        """Replace every stake, rebuilding only blocks whose stakes differ."""
+        stakes = np.asarray(stakes, dtype=np.float64)
+        if len(stakes) != self.n:
+            raise ValueError(f"expected {self.n} stakes, got {len(stakes)}")
+        changed = self.stakes[:self.n] != stakes
+        self.stakes[:self.n] = stakes
+        self._rebuild(np.unique(np.flatnonzero(changed) // self.block_size))
+
+    def _rebuild(self, blocks):
+        size = self.block_size
+        for b in blocks:
+            span = slice(b * size, (b + 1) * size)
+            total = self.stakes[span].sum()
+            self.block_totals[b] = total
+            if total > 0:
+                prob, alias = build_alias_table(self.stakes[span])
+                self.prob[span] = prob
+                self.alias[span] = alias
+        if self.block_totals.sum() <= 0:
+            raise ValueError("alias sampler needs at least one positive stake")
+        self.top_prob, self.top_alias = build_alias_table(self.block_totals)
+
+    def sample(self, size, rng):
+        """Draw ``size`` stake-weighted validator indices as int32."""
+        out = np.empty(size, dtype=np.int32)
+        return self.sample_into(out, rng)
+
+    def sample_into(self, out, rng, chunk=1 << 20):
+        """Fill a preallocated int32 array (e.g. a whole epoch of slots) in place."""
+        for start in range(0, len(out), chunk):
+            size = min(chunk, len(out) - start)
+            blocks = sample_alias(self.top_prob, self.top_alias, size, rng)
+            slots = rng.integers(self.block_size, size=size) + blocks * self.block_size
+            keep = rng.random(size) < self.prob[slots]
+            out[start:start + size] = np.where(keep, slots, self.alias[slots] + blocks * self.block_size)
+        return out
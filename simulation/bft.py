@@ -0,0 +1,177 @@
+"""Tendermint-style BFT consensus rounds with Byzantine validators.
+
+Each height runs propose / prevote / precommit rounds among ``n`` equally
+weighted validators until some honest validator commits. Votes are
+broadcast to everyone, and every message takes its own random delay.
+
+Votes are never materialised as message objects. For one step, the arrival
+times of every sender's vote at a block of receivers form an
+``(n, receivers)`` array. The moment a receiver holds a quorum of votes for
+a value is then the ``q``-th order statistic of that value's column
+(``np.partition``), so a step costs a few vectorized passes over ``n²``
+floats. Receivers are processed in column chunks to bound memory.
+
+Byzantine validators either stay silent or equivocate. An equivocator
+votes for block ``B`` towards one half of the network and ``B'`` towards
+the other, as early as possible. A Byzantine proposer also splits its
+proposal the same way. Locking across rounds is not modelled: a height
+stops at the first round in which an honest validator commits, and a safety
+violation means honest validators committed different blocks in that round.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+NIL, BLOCK, CONFLICTING_BLOCK = 0, 1, 2
+BEHAVIOURS = ("equivocate", "silent")
+
+
+@dataclass
+class BFTRun:
+    n: int
+    byzantine: int
+    rounds: np.ndarray
+    finalized: np.ndarray
+    finality_ms: np.ndarray
+    messages: np.ndarray
+    safety_violations: np.ndarray
+
+    @property
+    def quorum(self):
+        return 2 * self.n // 3 + 1
+
+
+def _delays(rng, n, receivers, delay_ms, jitter):
+    # Lognormal per-message delays with mean delay_ms; self-delivery is instant
+    d = rng.standard_normal(size=(n, len(receivers)), dtype=np.float32)
+    d *= jitter
+    d += np.float32(np.log(delay_ms) - jitter ** 2 / 2)
+    np.exp(d, out=d)
+    d[receivers, np.arange(len(receivers))] = 0.0
+    return d
+
+
+def _quorum_time(arrival, q):
+    if len(arrival) < q:
+        return np.inf
+    return np.partition(arrival, q - 1, axis=0)[q - 1]
+
+
+def _step(rng, send_ms, vote, byzantine, byzantine_vote, q, delay_ms, jitter, chunk):
+    """Quorum times at every receiver for one broadcast step.
+
+    ``vote`` is each honest sender's value, ``byzantine_vote`` the value each
+    receiver gets from Byzantine senders. Returns ``(any, block, conflicting)``
+    arrays: when each receiver holds ``q`` votes of any value, for ``B`` and
+    for ``B'`` (``inf`` if never).
+    """
+    n = len(send_ms)
+    quorum = np.empty((3, n))
+    # Only senders that can vote for a value take part in its order statistic
+    candidates = {value: np.flatnonzero(byzantine | (vote == value)) for value in (BLOCK, CONFLICTING_BLOCK)}
+    sent = np.isfinite(send_ms)
+    for lo in range(0, n, chunk):
+        receivers = np.arange(lo, min(n, lo + chunk))
+        arrival = _delays(rng, n, receivers, delay_ms, jitter)
+        arrival += send_ms[:, None].astype(np.float32)
+        quorum[0, receivers] = _quorum_time(arrival[sent], q)
+        for value, senders in candidates.items():
+            if len(senders) == n and sent.all() and not byzantine.any():
+                # Unanimous honest vote: same order statistic as any vote
+                quorum[value, receivers] = quorum[0, receivers]
+                continue
+            counted = arrival[senders]
+            counted[byzantine[senders][:, None] & (byzantine_vote[receivers] != value)[None, :]] = np.inf
+            quorum[value, receivers] = _quorum_time(counted, q)
+    return quorum
+
+
+def _height(rng, n, byzantine, proposer_offset, behaviour, delay_ms, jitter, timeouts, timeout_delta,
+            max_rounds, chunk):
+    q = 2 * n // 3 + 1
+    honest = ~byzantine
+    silent = behaviour == "silent"
+    start = 0.0
+    messages = 0
+    timeout_propose, timeout_prevote, timeout_precommit = timeouts
+
+    for round_ in range(max_rounds):
+        extra = round_ * timeout_delta
+        proposer = (proposer_offset + round_) % n
+        # Receivers Byzantine senders tell B; the rest hear B'
+        split = np.where(rng.random(n) < 0.5, BLOCK, CONFLICTING_BLOCK)
+        byzantine_vote = split if not silent else np.full(n, NIL)
+        byzantine_send = np.full(n, np.inf if silent else 0.0)
+
+        # Propose
+        if byzantine[proposer] and silent:
+            proposal_ms, proposal = np.full(n, np.inf), np.full(n, NIL)
+        else:
+            proposal_ms = delay_ms * rng.lognormal(-jitter ** 2 / 2, jitter, size=n)
+            proposal_ms[proposer] = 0.0
+            proposal = split if byzantine[proposer] else np.full(n, BLOCK)
+            messages += n - 1
+        on_time = proposal_ms <= timeout_propose + extra
+        prevote = np.where(on_time, proposal, NIL)
+        prevote_ms = np.where(byzantine, byzantine_send, np.minimum(proposal_ms, timeout_propose + extra))
+        messages += int(np.isfinite(prevote_ms).sum()) * (n - 1)
+
+        # Prevote: precommit the first polka, or nil once the prevote timeout expires
+        seen_any, seen_block, seen_conflicting = _step(rng, prevote_ms, prevote, byzantine, byzantine_vote,
+                                                       q, delay_ms, jitter, chunk)
+        polka = np.minimum(seen_block, seen_conflicting)
+        deadline = seen_any + timeout_prevote + extra
+        locked = polka <= deadline
+        precommit = np.where(locked, np.where(seen_block <= seen_conflicting, BLOCK, CONFLICTING_BLOCK), NIL)
+        precommit_ms = np.where(byzantine, byzantine_send, np.where(locked, polka, deadline))
+        messages += int(np.isfinite(precommit_ms).sum()) * (n - 1)
+
+        # Precommit: commit on a quorum of precommits for one block
+        seen_any, seen_block, seen_conflicting = _step(rng, precommit_ms, precommit, byzantine, byzantine_vote,
+                                                       q, delay_ms, jitter, chunk)
+        commit_ms = np.minimum(seen_block, seen_conflicting)[honest]
+        committed = np.isfinite(commit_ms)
+        if committed.any():
+            values = np.where(seen_block <= seen_conflicting, BLOCK, CONFLICTING_BLOCK)[honest][committed]
+            violation = len(np.unique(values)) > 1
+            return round_ + 1, True, start + commit_ms[committed].max(), messages, violation
+
+        round_end = (seen_any + timeout_precommit + extra)[honest]
+        if not np.isfinite(round_end).any():
+            break
+        start += round_end[np.isfinite(round_end)].max()
+    return max_rounds, False, np.inf, messages, False
+
+
+def simulate(n, heights=20, byzantine_fraction=0.0, behaviour="equivocate", delay_ms=100.0, jitter=0.5,
+             timeouts=(3000.0, 1000.0, 1000.0), timeout_delta=500.0, max_rounds=10, chunk=None, seed=0):
+    """Run ``heights`` consensus instances among ``n`` validators.
+
+    ``timeouts`` are the propose, prevote and precommit timeouts in ms; each
+    grows by ``timeout_delta`` per extra round, as in Tendermint.
+    """
+    if n < 4:
+        raise ValueError("BFT consensus needs at least four validators")
+    if not 0.0 <= byzantine_fraction < 1.0:
+        raise ValueError("byzantine_fraction must be in [0, 1)")
+    if behaviour not in BEHAVIOURS:
+        raise ValueError(f"unknown Byzantine behaviour {behaviour!r}, expected one of {BEHAVIOURS}")
+
+    rng = np.random.default_rng(seed)
+    byzantine = np.zeros(n, dtype=bool)
+    byzantine[rng.choice(n, int(round(byzantine_fraction * n)), replace=False)] = True
+    chunk = chunk or max(1, (1 << 22) // n)
+
+    rows = [_height(rng, n, byzantine, h, behaviour, delay_ms, jitter, timeouts, timeout_delta, max_rounds, chunk)
+            for h in range(heights)]
+    rounds, finalized, finality_ms, messages, violations = zip(*rows)
+    return BFTRun(
+        n=n,
+        byzantine=int(byzantine.sum()),
+        rounds=np.array(rounds),
+        finalized=np.array(finalized),
+        finality_ms=np.array(finality_ms),
+        messages=np.array(messages, dtype=np.int64),
+        safety_violations=np.array(violations),
+    )
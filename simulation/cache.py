@@ -0,0 +1,177 @@
+"""Content-addressed on-disk cache for simulation results.
+
+An entry's key hashes the simulation name, its parameters, the seed and the
+code version (a hash of this package's sources), so changing any of them
+misses. Each entry is a directory holding one ``.npy`` per array result,
+loaded memory-mapped, and a ``meta.json`` with the scalar results.
+
+Several server processes may share one cache directory:
+
+* Entries are written to a private temporary directory and renamed into
+  place, so readers never see a partial entry.
+* A per-key ``flock`` makes concurrent misses on the same key compute once.
+  Keys share ``LOCK_STRIPES`` lock files, picked by key prefix, so the
+  lock directory stays a fixed size however many keys were computed.
+* Eviction runs under a directory-wide ``flock``. It removes the least
+  recently used entries, by directory mtime (touched on every hit), until
+  the cache fits ``max_bytes``. Evicted entries are renamed away before
+  deletion, and open memory maps stay valid after the files are unlinked.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+CACHE_DIR = Path(os.environ.get('SIMULATION_CACHE', '.simulation-cache'))
+CACHE_BYTES = int(os.environ.get('SIMULATION_CACHE_BYTES', 1 << 30))
+# Keys hash onto this many lock files
+LOCK_STRIPES = 256
+
+_code_version = None
+
+
+def code_version():
+    """Hash of every source file of the ``simulation`` package."""
+    global _code_version
+    if _code_version is None:
+        h = hashlib.blake2s(person=b"sim-code")
+        for path in sorted(Path(__file__).parent.glob('*.py')):
+            h.update(path.name.encode() + b"\0" + path.read_bytes())
+        _code_version = h.hexdigest()
+    return _code_version
+
+
+def cache_key(name, params, seed=0):
+    """Hex key for a simulation run; ``params`` must be JSON-serialisable."""
+    blob = json.dumps({'name': name, 'params': params, 'seed': seed, 'code': code_version()},
+                      sort_keys=True, default=str)
+    return hashlib.blake2s(blob.encode(), person=b"sim-key").hexdigest()
+
+
+@contextmanager
+def _locked(path):
+    with open(path, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class ResultCache:
+    """Size-bounded LRU cache of ``{name: array or scalar}`` results."""
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / 'locks').mkdir(exist_ok=True)
+
+    def _entry(self, key):
+        return self.directory / key[:2] / key
+
+    def _lock(self, key):
+        # Unrelated keys of one stripe only wait on each other's misses
+        return self.directory / 'locks' / f"key-{int(key[:8], 16) % LOCK_STRIPES}"
+
+    def get(self, name, params, seed=0):
+        """Cached results, arrays memory-mapped read-only, or ``None`` on a miss."""
+        return self._load(self._entry(cache_key(name, params, seed)))
+
+    def _load(self, entry):
+        try:
+            meta = json.loads((entry / 'meta.json').read_text())
+            os.utime(entry)
+            result = dict(meta['scalars'])
+            for field in meta['arrays']:
+                result[field] = np.load(entry / f"{field}.npy", mmap_mode='r')
+        except FileNotFoundError:
+            # Missing, or evicted between the read and the loads
+            return None
+        return {field: result[field] for field in meta['order']}
+
+    def put(self, name, params, result, seed=0):
+        """Store ``result``; list and array values become ``.npy`` files."""
+        entry = self._entry(cache_key(name, params, seed))
+        entry.parent.mkdir(exist_ok=True)
+        tmp = self.directory / f".tmp-{uuid.uuid4().hex}"
+        tmp.mkdir()
+        try:
+            arrays, scalars = [], {}
+            for field, value in result.items():
+                if isinstance(value, (list, tuple, np.ndarray)):
+                    np.save(tmp / f"{field}.npy", np.asarray(value))
+                    arrays.append(field)
+                else:
+                    scalars[field] = value.item() if isinstance(value, np.generic) else value
+            meta = {'name': name, 'params': params, 'seed': seed, 'code': code_version(),
+                    'order': list(result), 'arrays': arrays, 'scalars': scalars}
+            (tmp / 'meta.json').write_text(json.dumps(meta, default=str))
+            os.rename(tmp, entry)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not entry.exists():
+                raise
+        self.evict()
+
+    def get_or_compute(self, name, params, compute, seed=0):
+        """Cached results for the run, calling ``compute()`` on a miss.
+
+        Concurrent misses on the same key wait for the first computation.
+        ``compute`` must not call back into the cache, whose lock it holds.
+        """
+        key = cache_key(name, params, seed)
+        result = self._load(self._entry(key))
+        if result is not None:
+            return result
+        with _locked(self._lock(key)):
+            result = self._load(self._entry(key))
+            if result is None:
+                computed = compute()
+                self.put(name, params, computed, seed)
+                # An entry larger than the whole cache is evicted at once
+                result = self._load(self._entry(key)) or computed
+        return result
+
+    def entries(self):
+        """``(mtime, bytes, path)`` of every entry."""
+        found = []
+        for entry in self.directory.glob('??/*'):
+            try:
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                found.append((entry.stat().st_mtime, size, entry))
+            except FileNotFoundError:
+                continue
+        return found
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits ``max_bytes``."""
+        with _locked(self.directory / 'locks' / 'evict'):
+            entries = sorted(self.entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in entries:
+                if total <= self.max_bytes:
+                    break
+                trash = self.directory / f".evict-{uuid.uuid4().hex}"
+                try:
+                    os.rename(entry, trash)
+                except FileNotFoundError:
+                    continue
+                shutil.rmtree(trash, ignore_errors=True)
+                total -= size
+
+    def clear(self):
+        with _locked(self.directory / 'locks' / 'evict'):
+            for _, _, entry in self.entries():
+                shutil.rmtree(entry, ignore_errors=True)
@@ -0,0 +1,166 @@
+"""Monte Carlo leader election with and without a VDF delay.
+
+Every slot draws a handful of stake-weighted candidates (the Poisson limit of
+per-validator VRF eligibility), samples each candidate's block propagation
+latency from its region, and races them:
+
+* Without a VDF the first block to reach the network wins, so low-latency
+  regions win a disproportionate share of the slots they are eligible for.
+* With a VDF the leader is the candidate with the lowest VDF output, which
+  nobody knows before the delay has elapsed. Latency only matters if a block
+  misses the grace window after the delay, so wins track stake.
+
+Slots are simulated in chunks of ``(chunk, max candidates)`` arrays, which
+keeps memory bounded and avoids Python-level loops over slots.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .alias import AliasSampler
+
+REGIONS = ['North America', 'Europe', 'Asia (Singapore)', 'South America', 'Africa', 'Oceania']
+
+# Share of validators hosted in each region
+REGION_SHARE = np.array([18, 18, 17, 16, 16, 15]) / 100
+
+# Median block propagation latency (ms) from a validator in each region to
+# the bulk of the network
+REGION_LATENCY_MS = np.array([50, 70, 150, 220, 320, 380], dtype=np.float64)
+
+
+@dataclass
+class ElectionResult:
+    region: np.ndarray
+    stake: np.ndarray
+    latency_ms: np.ndarray
+    slots: int
+    candidacies: np.ndarray
+    wins: np.ndarray
+    wins_vdf: np.ndarray
+    empty_slots: int
+    empty_slots_vdf: int
+
+
+def make_validators(n, region_share=REGION_SHARE, region_latency_ms=REGION_LATENCY_MS,
+                    stake_distribution='uniform', seed=0):
+    """Place ``n`` validators in regions and draw their stakes and base latencies.
+
+    Returns ``(region, stake, latency_ms)``; ``stake_distribution`` is one of
+    ``'uniform'`` (equal stake), ``'exponential'`` or ``'pareto'``.
+    """
+    rng = np.random.default_rng(seed)
+    region_share = np.asarray(region_share, dtype=np.float64)
+    region = rng.choice(len(region_share), size=n, p=region_share / region_share.sum()).astype(np.int8)
+
+    stake = draw_stakes(n, stake_distribution, rng)
+
+    # Each validator's own connectivity scatters around its region's median
+    latency_ms = np.asarray(region_latency_ms)[region] * rng.lognormal(0.0, 0.3, size=n)
+    return region, stake, latency_ms.astype(np.float32)
+
+
+def draw_stakes(n, stake_distribution, rng):
+    """``n`` stakes: ``'uniform'`` (equal stake), ``'exponential'`` or ``'pareto'``."""
+    if stake_distribution == 'uniform':
+        return np.ones(n)
+    if stake_distribution == 'exponential':
+        return rng.exponential(1.0, size=n)
+    if stake_distribution == 'pareto':
+        return rng.pareto(1.5, size=n) + 1.0
+    raise ValueError(f"unknown stake distribution {stake_distribution!r}")
+
+
+def simulate(region, stake, latency_ms, slots, candidates_per_slot=5.0, jitter=0.25,
+             vdf_delay_ms=5000.0, vdf_jitter=0.01, grace_ms=1000.0, chunk=1 << 17, seed=0):
+    """Race stake-weighted candidates over ``slots`` slots with and without a VDF.
+
+    ``jitter`` is the log-normal sigma of per-slot latency around each
+    validator's base latency, ``vdf_jitter`` the relative spread of VDF
+    evaluation speed, and ``grace_ms`` how long after the VDF delay a block is
+    still accepted.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(stake)
+    sampler = AliasSampler(stake)
+    latency_ms = np.asarray(latency_ms, dtype=np.float32)
+
+    candidacies = np.zeros(n, dtype=np.int64)
+    wins = np.zeros(n, dtype=np.int64)
+    wins_vdf = np.zeros(n, dtype=np.int64)
+    empty_slots = 0
+    empty_slots_vdf = 0
+
+    for start in range(0, slots, chunk):
+        size = min(chunk, slots - start)
+        candidates, mask, winner, winner_vdf = race_slots(
+            rng, sampler, latency_ms, size, candidates_per_slot, jitter, vdf_delay_ms, vdf_jitter, grace_ms)
+        candidacies += np.bincount(candidates[mask], minlength=n)
+        empty_slots += int((winner < 0).sum())
+        empty_slots_vdf += int((winner_vdf < 0).sum())
+        wins += np.bincount(winner[winner >= 0], minlength=n)
+        wins_vdf += np.bincount(winner_vdf[winner_vdf >= 0], minlength=n)
+
+    return ElectionResult(np.asarray(region), np.asarray(stake), latency_ms, slots,
+                          candidacies, wins, wins_vdf, empty_slots, empty_slots_vdf)
+
+
+def race_slots(rng, sampler, latency_ms, size, candidates_per_slot=5.0, jitter=0.25,
+               vdf_delay_ms=5000.0, vdf_jitter=0.01, grace_ms=1000.0):
+    """Race ``size`` consecutive slots; the per-chunk step of ``simulate``.
+
+    Returns ``(candidates, mask, winner, winner_vdf)``: the ``(size, width)``
+    candidate matrix, which of its entries are real, and each slot's winner
+    without and with VDF, ``-1`` where no block was produced.
+    """
+    counts = rng.poisson(candidates_per_slot, size=size)
+    empty = counts == 0
+    width = int(counts.max()) if size else 0
+    winner = np.full(size, -1, dtype=np.int64)
+    winner_vdf = np.full(size, -1, dtype=np.int64)
+    if width == 0:
+        return np.zeros((size, 0), dtype=np.int64), np.zeros((size, 0), dtype=bool), winner, winner_vdf
+
+    candidates = sampler.sample(size * width, rng).reshape(size, width)
+    mask = np.arange(width) < counts[:, None]
+    arrival = latency_ms[candidates] * rng.lognormal(0.0, jitter, size=(size, width)).astype(np.float32)
+    rows = np.flatnonzero(~empty)
+
+    # Without VDF: first block to arrive wins
+    race = np.where(mask, arrival, np.inf)
+    winner[rows] = candidates[rows, np.argmin(race[rows], axis=1)]
+
+    # With VDF: lowest VDF output among blocks that arrive within the grace window
+    finish = vdf_delay_ms * (1.0 + vdf_jitter * rng.standard_normal((size, width))) + arrival
+    on_time = mask & (finish <= vdf_delay_ms + grace_ms)
+    priority = np.where(on_time, rng.random((size, width)), np.inf)
+    # Slots where every candidate missed the window produce no block
+    produced = rows[np.isfinite(priority[rows].min(axis=1))]
+    winner_vdf[produced] = candidates[produced, np.argmin(priority[produced], axis=1)]
+    return candidates, mask, winner, winner_vdf
+
+
+def win_probability_curve(result, bins=10):
+    """Win probability (%) of an eligible validator, binned by base latency.
+
+    Returns ``(bin centres in ms, without VDF, with VDF)``.
+    """
+    edges = np.linspace(result.latency_ms.min(), result.latency_ms.max(), bins + 1)
+    which = np.clip(np.searchsorted(edges, result.latency_ms, side='right') - 1, 0, bins - 1)
+    candidacies = np.bincount(which, weights=result.candidacies, minlength=bins)
+    wins = np.bincount(which, weights=result.wins, minlength=bins)
+    wins_vdf = np.bincount(which, weights=result.wins_vdf, minlength=bins)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        curve = 100 * wins / candidacies
+        curve_vdf = 100 * wins_vdf / candidacies
+    keep = candidacies > 0
+    centres = (edges[:-1] + edges[1:]) / 2
+    return centres[keep], curve[keep], curve_vdf[keep]
+
+
+def region_win_shares(result, regions=len(REGIONS)):
+    """Share (%) of produced blocks won by each region, without and with VDF."""
+    wins = np.bincount(result.region, weights=result.wins, minlength=regions)
+    wins_vdf = np.bincount(result.region, weights=result.wins_vdf, minlength=regions)
+    return 100 * wins / max(wins.sum(), 1), 100 * wins_vdf / max(wins_vdf.sum(), 1)
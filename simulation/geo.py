@@ -0,0 +1,183 @@
+"""Geographic latency model: validators placed in cities across the regions.
+
+Cities are joined by a backbone topology, with each link's one-way delay
+taken from its great-circle distance at the speed of light in fibre:
+
+* every city links to its region's hub, the region's first city;
+* every city links to its nearest neighbours;
+* the hubs form a full mesh.
+
+All-pairs shortest delays over this topology are precomputed once with a
+vectorized Floyd–Warshall. A validator only adds its own last-mile access
+delay, so the delay between any two of 10^4+ validators is two lookups and
+one index into the city matrix.
+"""
+
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+
+from .election import REGION_SHARE, REGIONS, draw_stakes
+
+# (city, region index into ``REGIONS``, latitude, longitude)
+CITIES = [
+    ('Ashburn', 0, 39.04, -77.49), ('Chicago', 0, 41.88, -87.63), ('Dallas', 0, 32.78, -96.80),
+    ('San Jose', 0, 37.34, -121.89), ('Toronto', 0, 43.65, -79.38),
+    ('Frankfurt', 1, 50.11, 8.68), ('London', 1, 51.51, -0.13), ('Amsterdam', 1, 52.37, 4.90),
+    ('Paris', 1, 48.86, 2.35), ('Stockholm', 1, 59.33, 18.07),
+    ('Singapore', 2, 1.35, 103.82), ('Tokyo', 2, 35.68, 139.69), ('Hong Kong', 2, 22.32, 114.17),
+    ('Mumbai', 2, 19.08, 72.88), ('Seoul', 2, 37.57, 126.98),
+    ('São Paulo', 3, -23.55, -46.63), ('Buenos Aires', 3, -34.60, -58.38), ('Santiago', 3, -33.45, -70.67),
+    ('Bogotá', 3, 4.71, -74.07),
+    ('Johannesburg', 4, -26.20, 28.05), ('Lagos', 4, 6.52, 3.38), ('Nairobi', 4, -1.29, 36.82),
+    ('Cairo', 4, 30.04, 31.24),
+    ('Sydney', 5, -33.87, 151.21), ('Melbourne', 5, -37.81, 144.96), ('Auckland', 5, -36.85, 174.76),
+    ('Perth', 5, -31.95, 115.86),
+]
+
+EARTH_RADIUS_KM = 6371.0
+FIBRE_KM_PER_MS = 200.0
+# Cables don't follow great circles
+ROUTE_FACTOR = 1.5
+# Switching and queueing per backbone hop
+HOP_MS = 2.0
+
+
+@dataclass
+class GeoModel:
+    names: list
+    region: np.ndarray
+    link_ms: np.ndarray
+    delay_ms: np.ndarray
+
+    @property
+    def cities(self):
+        return len(self.names)
+
+    @property
+    def links(self):
+        return int(np.triu(np.isfinite(self.link_ms), 1).sum())
+
+
+@dataclass
+class Placement:
+    city: np.ndarray
+    region: np.ndarray
+    access_ms: np.ndarray
+    delay_ms: np.ndarray
+
+    def latency_ms(self, i, j):
+        """One-way delay between validators ``i`` and ``j``; any broadcastable index arrays."""
+        city_i, city_j = self.city[i], self.city[j]
+        same = np.asarray(i) == np.asarray(j)
+        return np.where(same, 0.0, self.access_ms[i] + self.delay_ms[city_i, city_j] + self.access_ms[j])
+
+
+def great_circle_km(lat, lon):
+    """Pairwise great-circle distances between points given in degrees."""
+    lat, lon = np.radians(lat), np.radians(lon)
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    h = np.sin(dlat / 2) ** 2 + np.cos(lat[:, None]) * np.cos(lat[None, :]) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0)))
+
+
+def floyd_warshall(weights):
+    """All-pairs shortest path lengths; ``inf`` marks a missing edge."""
+    dist = np.array(weights, dtype=np.float64)
+    np.fill_diagonal(dist, 0.0)
+    for k in range(len(dist)):
+        # Relax every pair through k at once
+        np.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+    return dist
+
+
+def make_model(cities=CITIES, neighbours=3):
+    """Backbone topology over ``cities`` and its all-pairs shortest delays."""
+    names = [c[0] for c in cities]
+    region = np.array([c[1] for c in cities], dtype=np.int8)
+    lat = np.array([c[2] for c in cities])
+    lon = np.array([c[3] for c in cities])
+    n = len(cities)
+
+    direct_ms = great_circle_km(lat, lon) * ROUTE_FACTOR / FIBRE_KM_PER_MS + HOP_MS
+    linked = np.zeros((n, n), dtype=bool)
+    nearest = np.argsort(direct_ms + np.diag(np.full(n, np.inf)), axis=1)[:, :neighbours]
+    linked[np.repeat(np.arange(n), neighbours), nearest.ravel()] = True
+    hubs = np.array([np.flatnonzero(region == r)[0] for r in np.unique(region)])
+    linked[np.arange(n), hubs[np.searchsorted(np.unique(region), region)]] = True
+    linked[np.ix_(hubs, hubs)] = True
+    linked |= linked.T
+    np.fill_diagonal(linked, False)
+
+    link_ms = np.where(linked, direct_ms, np.inf)
+    delay_ms = floyd_warshall(link_ms)
+    if not np.isfinite(delay_ms).all():
+        raise ValueError("backbone topology is disconnected")
+    return GeoModel(names, region, link_ms, delay_ms)
+
+
+@functools.lru_cache(maxsize=8)
+def default_model(neighbours=3):
+    """``make_model`` over ``CITIES``, computed once per process."""
+    return make_model(neighbours=neighbours)
+
+
+def place_validators(n, model=None, region_share=REGION_SHARE, access_ms=10.0, access_sigma=0.5, seed=0):
+    """Put ``n`` validators in cities, regions drawn by ``region_share``.
+
+    Cities are uniform within a region; each validator's last-mile delay is
+    log-normal around ``access_ms``.
+    """
+    model = model or default_model()
+    rng = np.random.default_rng(seed)
+    region_share = np.asarray(region_share, dtype=np.float64)
+    if len(region_share) != len(REGIONS):
+        raise ValueError(f"expected {len(REGIONS)} region shares, got {len(region_share)}")
+    region = rng.choice(len(region_share), size=n, p=region_share / region_share.sum()).astype(np.int8)
+
+    city = np.empty(n, dtype=np.int32)
+    for r in range(len(region_share)):
+        members = np.flatnonzero(region == r)
+        options = np.flatnonzero(model.region == r)
+        city[members] = rng.choice(options, size=len(members))
+    access = (access_ms * rng.lognormal(0.0, access_sigma, size=n)).astype(np.float32)
+    return Placement(city, region, access, model.delay_ms.astype(np.float32))
+
+
+def region_delays(model=None):
+    """Mean city-to-city delay (ms) between every pair of regions."""
+    model = model or default_model()
+    regions = len(REGIONS)
+    one_hot = np.eye(regions)[model.region]
+    totals = one_hot.T @ model.delay_ms @ one_hot
+    counts = np.outer(one_hot.sum(axis=0), one_hot.sum(axis=0))
+    return totals / counts
+
+
+def delay_to_network_ms(placement, q=50):
+    """Each validator's ``q``-th percentile delay to every other validator.
+
+    Computed per city, so the cost is cities x validators, not validators².
+    """
+    cities = len(placement.delay_ms)
+    out = np.empty(len(placement.city), dtype=np.float32)
+    for c in range(cities):
+        members = np.flatnonzero(placement.city == c)
+        if not len(members):
+            continue
+        reach = np.percentile(placement.delay_ms[c, placement.city] + placement.access_ms, q)
+        out[members] = placement.access_ms[members] + reach
+    return out
+
+
+def make_validators(n, stake_distribution='uniform', model=None, seed=0):
+    """``election.make_validators`` with latencies from the city model.
+
+    Returns ``(region, stake, latency_ms)``; each validator's latency is its
+    median delay to the rest of the network.
+    """
+    placement = place_validators(n, model, seed=seed)
+    stake = draw_stakes(n, stake_distribution, np.random.default_rng([seed, 1]))
+    return placement.region, stake, delay_to_network_ms(placement)
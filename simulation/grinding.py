@@ -0,0 +1,128 @@
+"""Monte Carlo of randomness-grinding attacks on leader selection.
+
+The next epoch's leader schedule is derived from a seed fixed by the last
+``tail_slots`` blocks of the current epoch. An adversary with stake fraction
+``stake`` leads each tail slot with that probability. It may withhold any
+subset of its ``j`` tail blocks (``2^j`` outcomes) and, where the protocol
+allows it, try ``alternatives`` seeds per outcome. Every candidate seed
+gives an independent schedule in which the adversary leads
+Binomial(``epoch_slots``, ``stake``) slots. Each withheld block costs one
+slot of reward.
+
+With plain VRF randomness the adversary sees every candidate seed at once
+and keeps the best. With VRF+VDF randomness a candidate is only known after
+a VDF evaluation, so within the ``window_s`` before it must publish the
+adversary can evaluate ``1 + window_s * adversary_speedup / vdf_delay_s``
+candidates, taking the honest outcome first and the cheapest withholdings
+next.
+
+A trial succeeds when the chosen candidate beats the honest seed for the
+adversary. The maximum over ``N`` candidates with the same withholding cost
+is drawn directly by inverting the binomial CDF at ``U^(1/N)``, so a trial
+costs O(tail_slots) vectorized operations however many seeds are ground.
+Trials run in fixed-size shards seeded by ``SeedSequence.spawn``, so a
+result depends only on ``seed`` and not on the worker count.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+SHARD_TRIALS = 1 << 20
+
+
+@dataclass
+class GrindingResult:
+    trials: int
+    successes: int
+    slot_gain: float
+    stake: float
+    epoch_slots: int
+
+    @property
+    def rate(self):
+        return self.successes / self.trials if self.trials else 0.0
+
+    @property
+    def slot_share(self):
+        """Adversary's expected share of next-epoch slots under the attack."""
+        return self.stake + self.slot_gain / self.epoch_slots
+
+    def confidence_interval(self, z=1.96):
+        """Wilson score interval for the success rate."""
+        return wilson_interval(self.successes, self.trials, z)
+
+
+def wilson_interval(successes, trials, z=1.96):
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denom = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def _binomial_cdf(n, p):
+    k = np.arange(n + 1)
+    log_pmf = np.array([math.lgamma(n + 1) - math.lgamma(i + 1) - math.lgamma(n - i + 1) for i in k])
+    with np.errstate(divide='ignore'):
+        log_pmf += k * np.log(p) + (n - k) * np.log1p(-p)
+    cdf = np.cumsum(np.exp(log_pmf))
+    cdf[-1] = 1.0
+    return cdf
+
+
+def _shard(seed, trials, stake, tail_slots, alternatives, epoch_slots, budget):
+    rng = np.random.default_rng(seed)
+    cdf = _binomial_cdf(epoch_slots, stake)
+    controlled = rng.binomial(tail_slots, stake, size=trials)
+    honest = np.searchsorted(cdf, rng.random(trials), side='right')
+
+    # Candidates still evaluable after the honest one (unbounded without VDF)
+    remaining = np.full(trials, budget - 1 if budget else np.iinfo(np.int64).max, dtype=np.int64)
+    best = np.full(trials, -1, dtype=np.int64)
+    # subsets[w, j]: ways to withhold w of j controlled tail blocks
+    subsets = np.array([[math.comb(j, w) for j in range(tail_slots + 1)] for w in range(tail_slots + 1)],
+                       dtype=np.int64)
+    for withheld in range(tail_slots + 1):
+        count = subsets[withheld][controlled] * alternatives - (1 if withheld == 0 else 0)
+        count = np.minimum(count, remaining)
+        remaining -= count
+        has = count > 0
+        if not has.any():
+            continue
+        # Max of `count` iid Binomial draws via the inverse CDF at U^(1/count)
+        u = rng.random(int(has.sum())) ** (1.0 / count[has])
+        slots = np.searchsorted(cdf, u, side='right') - withheld
+        best[has] = np.maximum(best[has], slots)
+
+    gain = np.maximum(best - honest, 0)
+    return int((gain > 0).sum()), int(gain.sum())
+
+
+def simulate(trials, stake=0.2, tail_slots=8, alternatives=1, epoch_slots=32, vdf=False,
+             vdf_delay_s=5.0, window_s=2.0, adversary_speedup=5.0, workers=None, seed=0):
+    """Run ``trials`` grinding attempts and return the success statistics."""
+    if not 0.0 < stake < 1.0:
+        raise ValueError("stake must be in (0, 1)")
+    if alternatives < 1 or tail_slots < 0 or epoch_slots < 1:
+        raise ValueError("alternatives and epoch_slots must be positive and tail_slots non-negative")
+    budget = 1 + int(window_s * adversary_speedup / vdf_delay_s) if vdf else 0
+
+    sizes = [min(SHARD_TRIALS, trials - lo) for lo in range(0, trials, SHARD_TRIALS)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(s, size, stake, tail_slots, alternatives, epoch_slots, budget) for s, size in zip(seeds, sizes)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(args) <= 1:
+        parts = [_shard(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_shard, *zip(*args)))
+    successes = sum(p[0] for p in parts)
+    gain = sum(p[1] for p in parts)
+    return GrindingResult(trials, successes, gain / trials if trials else 0.0, stake, epoch_slots)
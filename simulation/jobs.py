@@ -0,0 +1,142 @@
+"""Background execution of long simulations on a shared process pool.
+
+A job is any picklable function accepting a ``progress`` keyword. The
+function calls ``progress(fraction)`` as it works; the call writes the
+fraction into a slot of a shared-memory array the page polls, and raises
+``JobCancelled`` once the job's cancel flag is set in the same slot.
+
+One ``JobRunner`` is shared by every session of the server process. Its pool
+has a bounded number of workers and each owner (session) may only run a few
+jobs at once, so heavy runs queue instead of starving other users.
+"""
+
+import itertools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+# Shared progress array, installed in each worker by the pool initializer
+_shared = None
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when its cancellation has been requested."""
+
+
+class JobLimitError(RuntimeError):
+    """Raised when an owner already has the maximum number of active jobs."""
+
+
+def _init_worker(shared):
+    global _shared
+    _shared = shared
+
+
+class Progress:
+    """Progress reporter handed to a job function as ``progress``."""
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __call__(self, fraction):
+        _shared[2 * self.slot] = fraction
+        if _shared[2 * self.slot + 1]:
+            raise JobCancelled()
+
+    @property
+    def cancelled(self):
+        return bool(_shared[2 * self.slot + 1])
+
+
+def _run(fn, slot, args, kwargs):
+    return fn(*args, progress=Progress(slot), **kwargs)
+
+
+@dataclass
+class JobHandle:
+    id: int
+    label: str
+    owner: str
+    future: object = field(repr=False)
+    slot: int
+    runner: object = field(repr=False)
+    final_progress: float = field(default=None, init=False)
+
+    def progress(self):
+        """Last reported completion fraction in ``[0, 1]``."""
+        if self.final_progress is not None:
+            return 1.0 if self.status == 'done' else self.final_progress
+        return self.runner._shared[2 * self.slot]
+
+    def done(self):
+        return self.future.done()
+
+    def cancel(self):
+        """Request cancellation; queued jobs never start, running ones stop at their next report."""
+        if self.final_progress is not None:
+            return
+        self.runner._shared[2 * self.slot + 1] = 1.0
+        self.future.cancel()
+
+    @property
+    def status(self):
+        if not self.future.done():
+            return 'running' if self.future.running() else 'queued'
+        if self.future.cancelled() or isinstance(self.future.exception(), JobCancelled):
+            return 'cancelled'
+        return 'failed' if self.future.exception() is not None else 'done'
+
+    def result(self):
+        return self.future.result()
+
+
+class JobRunner:
+    """Bounded process pool that hands out pollable, cancellable job handles."""
+
+    def __init__(self, max_workers=None, max_jobs_per_owner=2, slots=256):
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        self.max_jobs_per_owner = max_jobs_per_owner
+        context = multiprocessing.get_context('spawn')
+        self._shared = context.Array('d', 2 * slots, lock=False)
+        self._free = list(range(slots))
+        self._active = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._pool = ProcessPoolExecutor(self.max_workers, mp_context=context,
+                                         initializer=_init_worker, initargs=(self._shared,))
+
+    def submit(self, fn, *args, owner='', label='', **kwargs):
+        """Run ``fn(*args, progress=..., **kwargs)`` in the pool and return its handle."""
+        with self._lock:
+            if sum(1 for h in self._active.values() if h.owner == owner) >= self.max_jobs_per_owner:
+                raise JobLimitError(f"at most {self.max_jobs_per_owner} simulations may run at once per session")
+            if not self._free:
+                raise JobLimitError("the simulation queue is full, try again shortly")
+            slot = self._free.pop()
+            self._shared[2 * slot] = 0.0
+            self._shared[2 * slot + 1] = 0.0
+            job_id = next(self._ids)
+            future = self._pool.submit(_run, fn, slot, args, kwargs)
+            handle = JobHandle(job_id, label or getattr(fn, '__name__', 'job'), owner, future, slot, self)
+            self._active[job_id] = handle
+        future.add_done_callback(lambda _: self._release(handle))
+        return handle
+
+    def _release(self, handle):
+        with self._lock:
+            if self._active.pop(handle.id, None) is not None:
+                # Freeze the last report before the slot is handed to another job
+                handle.final_progress = self._shared[2 * handle.slot]
+                self._free.append(handle.slot)
+
+    def active(self, owner=None):
+        """Handles of unfinished jobs, optionally only those of ``owner``."""
+        with self._lock:
+            return [h for h in self._active.values() if owner is None or h.owner == owner]
+
+    def shutdown(self):
+        for handle in self.active():
+            handle.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,90 @@
+"""Endless leader-election stream for the live chain view.
+
+``stream`` is a generator that races slots in fixed-size steps for as long as
+it is consumed. ``LiveWindow`` keeps only the last ``window`` slots' winners
+in NumPy ring buffers (``metrics.RingBuffer``). As slots enter and leave the window it adds and
+subtracts them from per-region win counts, so rolling metrics cost O(step)
+per update and memory stays constant however long the stream runs.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .alias import AliasSampler
+from .election import REGIONS, race_slots
+from .metrics import FairnessTracker, RingBuffer, geographic_gini
+
+
+@dataclass
+class SlotBatch:
+    first_slot: int
+    winner: np.ndarray
+    winner_vdf: np.ndarray
+
+
+def stream(region, stake, latency_ms, slots_per_step=50, vdf_delay_ms=5000.0, seed=0, **race):
+    """Race ``slots_per_step`` slots per iteration, forever; yields ``SlotBatch``."""
+    rng = np.random.default_rng(seed)
+    sampler = AliasSampler(stake)
+    latency_ms = np.asarray(latency_ms, dtype=np.float32)
+    slot = 0
+    while True:
+        _, _, winner, winner_vdf = race_slots(rng, sampler, latency_ms, slots_per_step,
+                                              vdf_delay_ms=vdf_delay_ms, **race)
+        yield SlotBatch(slot, winner, winner_vdf)
+        slot += slots_per_step
+
+
+class LiveWindow:
+    """Rolling fairness metrics over the last ``window`` slots.
+
+    Regional win shares and geographic Gini come from per-region counts;
+    per-validator Nakamoto coefficient and divergence from stake come from a
+    windowed ``FairnessTracker`` each, without and with VDF.
+
+    The ``history`` most recent readings of each metric are kept for charts.
+    """
+
+    METRICS = ('slot', 'gini', 'gini_vdf')
+
+    def __init__(self, region, stake, window=10_000, history=600):
+        self.region = np.asarray(region)
+        regions = len(REGIONS)
+        # Fair share of each region is its share of stake
+        self.stake_share = np.bincount(self.region, weights=stake, minlength=regions)
+        self.stake_share /= self.stake_share.sum()
+        # Region -1 marks an empty slot; counts are shifted by one to hold it
+        self.winners = RingBuffer(window, np.int8), RingBuffer(window, np.int8)
+        self.counts = np.zeros((2, regions + 1), dtype=np.int64)
+        self.trackers = FairnessTracker(stake, window), FairnessTracker(stake, window)
+        self.slot = 0
+        self.history = {name: RingBuffer(history) for name in self.METRICS}
+
+    def push(self, batch):
+        """Slide the window over ``batch`` and record the new metric readings."""
+        for i, winner in enumerate((batch.winner, batch.winner_vdf)):
+            won = np.where(winner >= 0, self.region[np.maximum(winner, 0)], -1)
+            evicted = self.winners[i].extend(won)
+            minlength = self.counts.shape[1]
+            self.counts[i] += np.bincount(won.astype(np.int64) + 1, minlength=minlength)
+            self.counts[i] -= np.bincount(evicted.astype(np.int64) + 1, minlength=minlength)
+            self.trackers[i].add(winner)
+        self.slot = batch.first_slot + len(batch.winner)
+        for name, value in zip(self.METRICS, (self.slot, self.gini(), self.gini(vdf=True))):
+            self.history[name].extend([value])
+
+    def region_share(self, vdf=False):
+        """Share (%) of the window's produced blocks won by each region."""
+        wins = self.counts[int(vdf), 1:]
+        return 100 * wins / max(wins.sum(), 1)
+
+    def empty_slots(self, vdf=False):
+        return int(self.counts[int(vdf), 0])
+
+    def tracker(self, vdf=False):
+        return self.trackers[int(vdf)]
+
+    def gini(self, vdf=False):
+        """Gini of the regions' win shares relative to their stake shares."""
+        return geographic_gini(self.region_share(vdf), self.stake_share)
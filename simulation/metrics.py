@@ -0,0 +1,237 @@
+"""Fairness metrics of block production, batch and incremental.
+
+``FairnessTracker`` follows a stream of block winners. It keeps validators
+in a list sorted by win count, where each count value occupies one
+contiguous block of positions. A win (or, with a sliding window, an eviction)
+moves a validator one count up (or down). To do that it swaps the validator
+with the last (or first) member of its block, so the list stays sorted in
+O(1). The validator's new position gives its rank, which updates:
+
+* the sum of pairwise absolute differences behind the Gini coefficient,
+  in O(1);
+* running sums behind the KL divergence and chi-square statistic of wins
+  against stake, in O(1);
+* a Fenwick tree of counts by sorted position, used for the Nakamoto
+  coefficient, in O(log n).
+
+No update ever re-sorts the validators.
+"""
+
+import math
+
+import numpy as np
+
+
+def gini(values):
+    """Gini coefficient of non-negative ``values``; 0 is perfect equality."""
+    values = np.sort(np.asarray(values, dtype=np.float64))
+    n = len(values)
+    total = values.sum()
+    if n == 0 or total == 0:
+        return 0.0
+    ranks = np.arange(1, n + 1)
+    return float((2 * ranks - n - 1) @ values / (n * total))
+
+
+def nakamoto(values, fraction=0.5):
+    """Fewest entities whose combined ``values`` exceed ``fraction`` of the total."""
+    values = np.sort(np.asarray(values, dtype=np.float64))[::-1]
+    if not len(values) or values.sum() == 0:
+        return 0
+    return int(np.searchsorted(np.cumsum(values), fraction * values.sum(), side='right')) + 1
+
+
+def kl_divergence(wins, stake):
+    """KL divergence (nats) of the win distribution from the stake distribution."""
+    wins = np.asarray(wins, dtype=np.float64)
+    stake = np.asarray(stake, dtype=np.float64)
+    p = wins / max(wins.sum(), 1)
+    q = stake / stake.sum()
+    won = p > 0
+    return float(np.sum(p[won] * np.log(p[won] / q[won])))
+
+
+def geographic_gini(region_share, stake_share):
+    """Gini of regions' block shares relative to their stake shares."""
+    region_share = np.asarray(region_share, dtype=np.float64)
+    stake_share = np.asarray(stake_share, dtype=np.float64)
+    present = stake_share > 0
+    return gini(region_share[present] / region_share.sum() / (stake_share[present] / stake_share.sum()))
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO holding the most recent values."""
+
+    def __init__(self, capacity, dtype=np.float64):
+        self.data = np.zeros(capacity, dtype=dtype)
+        self.capacity = capacity
+        self.start = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def extend(self, values):
+        """Append ``values``; returns every value pushed out, oldest first.
+
+        Inputs longer than the buffer push out their own first values too, so
+        adding all of ``values`` and removing the result leaves exactly the
+        buffer's contents.
+        """
+        values = np.asarray(values, dtype=self.data.dtype)
+        if len(values) >= self.capacity:
+            cut = len(values) - self.capacity
+            evicted = np.concatenate((self.values(), values[:cut]))
+            self.data[:] = values[cut:]
+            self.start, self.size = 0, self.capacity
+            return evicted
+
+        overflow = max(0, self.size + len(values) - self.capacity)
+        evicted = self.data[(self.start + np.arange(overflow)) % self.capacity].copy()
+        self.data[(self.start + self.size + np.arange(len(values))) % self.capacity] = values
+        self.start = (self.start + overflow) % self.capacity
+        self.size = min(self.capacity, self.size + len(values))
+        return evicted
+
+    def values(self):
+        """Contents, oldest first, as a new array."""
+        return self.data[(self.start + np.arange(self.size)) % self.capacity]
+
+
+class Fenwick:
+    """Prefix sums over a fixed-length array with O(log n) point updates."""
+
+    def __init__(self, n):
+        self.n = n
+        self.tree = [0] * (n + 1)
+
+    def add(self, i, delta):
+        i += 1
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, m):
+        """Sum of the first ``m`` entries."""
+        total = 0
+        while m > 0:
+            total += self.tree[m]
+            m -= m & -m
+        return total
+
+    def lower_count(self, target):
+        """Largest ``m`` with ``prefix(m) < target``; entries must be non-negative."""
+        m, step = 0, 1 << self.n.bit_length()
+        while step:
+            if m + step <= self.n and self.tree[m + step] < target:
+                m += step
+                target -= self.tree[m]
+            step >>= 1
+        return m
+
+
+class FairnessTracker:
+    """Incremental fairness metrics over a stream of block winners.
+
+    With ``window`` set, only the last ``window`` blocks count; older ones
+    are evicted as new ones arrive.
+    """
+
+    def __init__(self, stake, window=None):
+        stake = np.asarray(stake, dtype=np.float64)
+        self.n = n = len(stake)
+        self.share = (stake / stake.sum()).tolist()
+        self.wins = [0] * n
+        # Validators in ascending order of wins, and each one's position
+        self.order = list(range(n))
+        self.pos = list(range(n))
+        # first[c]: first position of the validators with c wins
+        self.first = [0]
+        self.counts = Fenwick(n)
+        self.total = 0
+        self.abs_sum = 0
+        self.log_sum = 0.0
+        self.sq_sum = 0.0
+        self.window = RingBuffer(window, np.int64) if window else None
+
+    def _end(self, c):
+        return self.first[c + 1] if c + 1 < len(self.first) else self.n
+
+    def _swap(self, v, p):
+        u = self.order[p]
+        q = self.pos[v]
+        self.order[p], self.order[q] = v, u
+        self.pos[v], self.pos[u] = p, q
+
+    def _term_change(self, v, before, after):
+        s = self.share[v]
+        self.log_sum += ((after * math.log(after / s) if after else 0.0)
+                         - (before * math.log(before / s) if before else 0.0))
+        self.sq_sum += (after * after - before * before) / s
+
+    def increment(self, v):
+        """Record a block won by validator ``v``."""
+        c = self.wins[v]
+        p = self._end(c) - 1
+        self._swap(v, p)
+        # p validators have at most c wins, n - p - 1 at least c + 1
+        self.abs_sum += p - (self.n - p - 1)
+        if c + 1 < len(self.first):
+            self.first[c + 1] = p
+        else:
+            self.first.append(p)
+        self.wins[v] = c + 1
+        self.counts.add(p, 1)
+        self.total += 1
+        self._term_change(v, c, c + 1)
+
+    def decrement(self, v):
+        """Remove a block previously won by validator ``v``."""
+        c = self.wins[v]
+        if c == 0:
+            raise ValueError(f"validator {v} has no blocks to remove")
+        p = self.first[c]
+        self._swap(v, p)
+        self.abs_sum += (self.n - p - 1) - p
+        self.first[c] = p + 1
+        while len(self.first) > 1 and self.first[-1] == self.n:
+            self.first.pop()
+        self.wins[v] = c - 1
+        self.counts.add(p, -1)
+        self.total -= 1
+        self._term_change(v, c, c - 1)
+
+    def add(self, winners):
+        """Record a sequence of block winners; negative entries are empty slots."""
+        winners = np.asarray(winners, dtype=np.int64)
+        evicted = self.window.extend(winners) if self.window is not None else ()
+        for v in winners.tolist():
+            if v >= 0:
+                self.increment(v)
+        for v in np.asarray(evicted).tolist():
+            if v >= 0:
+                self.decrement(v)
+
+    def gini(self):
+        """Gini coefficient of win counts, O(1)."""
+        return self.abs_sum / (self.n * self.total) if self.total else 0.0
+
+    def nakamoto(self, fraction=0.5):
+        """Fewest validators holding more than ``fraction`` of the blocks, O(log n)."""
+        if not self.total:
+            return 0
+        # The top k sorted positions exceed fraction * total exactly when the rest fall below
+        rest = self.counts.lower_count(self.total - fraction * self.total)
+        return self.n - rest
+
+    def kl_divergence(self):
+        """KL divergence (nats) of wins from stake, O(1)."""
+        if not self.total:
+            return 0.0
+        return max(self.log_sum / self.total - math.log(self.total), 0.0)
+
+    def chi_square(self):
+        """Pearson chi-square of wins against stake-proportional expectations, O(1)."""
+        if not self.total:
+            return 0.0
+        return self.sq_sum / self.total - self.total
@@ -0,0 +1,187 @@
+"""Discrete-event block propagation over a gossip graph.
+
+Validators form a random gossip graph whose links have a one-way latency and
+a bandwidth; a block reaching a node is validated and then forwarded to every
+neighbour, each hop adding a random queueing delay on top of the link's.
+
+The event queue is a calendar: a ``heapq`` of bucket numbers, each bucket
+holding its pending events as packed NumPy arrays (``block * nodes + node``
+keys and arrival times in microseconds) rather than per-event Python objects.
+Buckets are as wide as the shortest possible hop, so an event can never
+schedule another one into its own bucket and a whole bucket, across every
+block being simulated, is settled and relaxed in one vectorized step.
+
+Chunks of blocks are independent and are spread over a process pool.
+"""
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class GossipGraph:
+    indptr: np.ndarray
+    indices: np.ndarray
+    latency_ms: np.ndarray
+    bandwidth_mbps: np.ndarray
+    fast: np.ndarray
+
+    @property
+    def nodes(self):
+        return len(self.indptr) - 1
+
+
+@dataclass
+class PropagationResult:
+    origins: np.ndarray
+    see_ms: np.ndarray
+    fast: np.ndarray
+
+    def respond_ms(self, response_ms=50.0, vdf_delay_ms=0.0):
+        """Time each node responds: block seen, VDF evaluated, response computed."""
+        return self.see_ms + (vdf_delay_ms + response_ms)
+
+
+def make_gossip_graph(n, degree=8, fast_fraction=0.5, fast_latency_ms=50.0, slow_latency_ms=300.0,
+                      fast_bandwidth_mbps=1000.0, slow_bandwidth_mbps=50.0, seed=0):
+    """Random gossip graph of ``n`` nodes split into well- and poorly-connected classes.
+
+    A link's latency is the mean of its endpoints' access latencies and its
+    bandwidth the smaller of their bandwidths.
+    """
+    if n < 2:
+        raise ValueError("a gossip graph needs at least two nodes")
+    rng = np.random.default_rng(seed)
+    fast = rng.random(n) < fast_fraction
+    access = np.where(fast, fast_latency_ms, slow_latency_ms) * rng.lognormal(0.0, 0.2, size=n)
+    bandwidth = np.where(fast, fast_bandwidth_mbps, slow_bandwidth_mbps)
+
+    # Each node dials degree/2 random peers; links are undirected
+    src = np.repeat(np.arange(n), max(1, degree // 2))
+    dst = rng.integers(0, n - 1, size=len(src))
+    dst += dst >= src
+    edges = np.unique(np.concatenate([src * n + dst, dst * n + src]))
+    src, dst = edges // n, edges % n
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    return GossipGraph(
+        indptr=indptr,
+        indices=dst.astype(np.int32),
+        latency_ms=((access[src] + access[dst]) / 2).astype(np.float32),
+        bandwidth_mbps=np.minimum(bandwidth[src], bandwidth[dst]).astype(np.float32),
+        fast=fast,
+    )
+
+
+def _propagate_chunk(indptr, indices, delay_us, origins, validation_us, jitter, seed):
+    rng = np.random.default_rng(seed)
+    n = len(indptr) - 1
+    blocks = len(origins)
+    seen = np.full(blocks * n, np.iinfo(np.int32).max, dtype=np.int32)
+    width = max(1, validation_us + int(delay_us.min()))
+
+    keys = np.arange(blocks, dtype=np.int64) * n + origins
+    seen[keys] = 0
+    pending = {0: [(keys, np.zeros(blocks, dtype=np.int32))]}
+    calendar = [0]
+    while calendar:
+        bucket = heapq.heappop(calendar)
+        keys = np.concatenate([k for k, _ in pending[bucket]])
+        times = np.concatenate([t for _, t in pending.pop(bucket)])
+
+        # Drop events superseded by an earlier arrival, then duplicates
+        live = seen[keys] == times
+        keys, first = np.unique(keys[live], return_index=True)
+        times = times[live][first]
+        if not len(keys):
+            continue
+
+        # Fan every settled (block, node) out over its links
+        u = keys % n
+        start = indptr[u]
+        degree = indptr[u + 1] - start
+        owner = np.repeat(np.arange(len(keys)), degree)
+        edge = np.arange(len(owner)) - np.repeat(np.cumsum(degree) - degree, degree) + start[owner]
+        delay = delay_us[edge]
+        if jitter:
+            delay = delay * (1.0 + jitter * rng.exponential(size=len(edge)))
+        arrival = (times[owner] + validation_us + delay).astype(np.int32)
+        target = keys[owner] - u[owner] + indices[edge]
+
+        better = arrival < seen[target]
+        target, arrival = target[better], arrival[better]
+        np.minimum.at(seen, target, arrival)
+        best = arrival == seen[target]
+        target, arrival = target[best], arrival[best]
+
+        slots = arrival // width
+        order = np.argsort(slots, kind='stable')
+        target, arrival, slots = target[order], arrival[order], slots[order]
+        ids, starts = np.unique(slots, return_index=True)
+        for slot, lo, hi in zip(ids.tolist(), starts.tolist(), [*starts[1:].tolist(), len(slots)]):
+            if slot not in pending:
+                pending[slot] = []
+                heapq.heappush(calendar, slot)
+            pending[slot].append((target[lo:hi], arrival[lo:hi]))
+
+    return (seen.reshape(blocks, n) / 1000.0).astype(np.float32)
+
+
+def propagate(graph, blocks, block_bytes=1_000_000, validation_ms=5.0, jitter=0.1,
+              workers=None, chunk=250, seed=0):
+    """Propagate ``blocks`` blocks from random origins; returns per-node time-to-see."""
+    rng = np.random.default_rng(seed)
+    origins = rng.integers(0, graph.nodes, size=blocks)
+    transmit_ms = block_bytes * 8 / (graph.bandwidth_mbps.astype(np.float64) * 1e3)
+    delay_us = (graph.latency_ms + transmit_ms) * 1000.0
+    validation_us = int(validation_ms * 1000)
+
+    chunks = [origins[i:i + chunk] for i in range(0, blocks, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    args = [(graph.indptr, graph.indices, delay_us, c, validation_us, jitter, s)
+            for c, s in zip(chunks, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) == 1:
+        parts = [_propagate_chunk(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_propagate_chunk, *zip(*args)))
+    see = np.concatenate(parts) if parts else np.empty((0, graph.nodes), dtype=np.float32)
+    return PropagationResult(origins, see, graph.fast)
+
+
+def summarize(result, response_ms=50.0, vdf_delay_ms=0.0, percentiles=(50, 90, 99)):
+    """Per-class percentiles of time-to-see and time-to-respond.
+
+    Returns ``{'fast' | 'slow': {'see': [...], 'respond': [...], 'respond_vdf': [...]}}``.
+    """
+    respond = result.respond_ms(response_ms)
+    respond_vdf = result.respond_ms(response_ms, vdf_delay_ms)
+    summary = {}
+    for name, mask in (('fast', result.fast), ('slow', ~result.fast)):
+        if not mask.any():
+            continue
+        summary[name] = {
+            'see': np.percentile(result.see_ms[:, mask], percentiles),
+            'respond': np.percentile(respond[:, mask], percentiles),
+            'respond_vdf': np.percentile(respond_vdf[:, mask], percentiles),
+        }
+    return summary
+
+
+def see_histogram(result, bins=100):
+    """Per-class time-to-see histograms over shared equal-width bins.
+
+    Returns ``(edges in ms, {'fast' | 'slow': counts})``.
+    """
+    limits = (float(result.see_ms.min()), float(result.see_ms.max())) if result.see_ms.size else (0.0, 1.0)
+    counts = {}
+    for name, mask in (('fast', result.fast), ('slow', ~result.fast)):
+        counts[name], edges = np.histogram(result.see_ms[:, mask], bins=bins, range=limits)
+    return edges, counts
@@ -0,0 +1,237 @@
+"""L2 rollup sequencer pipeline: batching, state transition and state roots.
+
+Transactions (sender, recipient, amount) are cut into fixed-size batches by
+the sequencer. Each batch is applied to an account-balance array in a few
+vectorized passes: a sender whose total outflow in the batch exceeds its
+balance has all of that batch's transactions rejected, so no sequential
+replay is needed. The batch then commits to a new state root.
+
+The state root is a Merkle tree over ``H(index || balance)`` leaves, kept
+level by level so a batch only rehashes the paths above the accounts it
+touched. Accounts are split into contiguous shards, each owned by a worker
+process holding that shard's subtree; the sequencer sends each shard its
+dirty leaves, and the shard roots are combined into the state root (so the
+root's layout depends on the shard count).
+"""
+
+import hashlib
+import multiprocessing
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+TX_DTYPE = np.dtype([
+    ('sender', '<u4'),
+    ('recipient', '<u4'),
+    ('amount', '<i8'),
+])
+
+_LEAF_HASH = hashlib.blake2s(person=b"ru-leaf")
+_NODE_HASH = hashlib.blake2s(person=b"ru-node")
+
+
+def generate_transactions(count, accounts, max_amount=1_000, seed=0):
+    """Random transfers between distinct accounts."""
+    rng = np.random.default_rng(seed)
+    txs = np.empty(count, dtype=TX_DTYPE)
+    txs['sender'] = rng.integers(0, accounts, size=count)
+    recipient = rng.integers(0, accounts - 1, size=count)
+    txs['recipient'] = recipient + (recipient >= txs['sender'])
+    txs['amount'] = rng.integers(1, max_amount + 1, size=count)
+    return txs
+
+
+def apply_batch(balances, batch):
+    """Apply a batch in place; returns ``(touched accounts, applied count)``."""
+    senders = batch['sender'].astype(np.int64)
+    amounts = batch['amount']
+
+    spenders, inverse = np.unique(senders, return_inverse=True)
+    outflow = np.bincount(inverse, weights=amounts)
+    ok = (outflow <= balances[spenders])[inverse]
+
+    accounts = np.concatenate([senders[ok], batch['recipient'][ok].astype(np.int64)])
+    change = np.concatenate([-amounts[ok], amounts[ok]])
+    touched, inverse = np.unique(accounts, return_inverse=True)
+    balances[touched] += np.bincount(inverse, weights=change, minlength=len(touched)).astype(np.int64)
+    return touched, int(ok.sum())
+
+
+def _hash_pairs(level, parents):
+    # Rehash the given parents from their two adjacent children
+    buffer = memoryview(level).cast('B')
+    digests = []
+    for i in parents.tolist():
+        h = _NODE_HASH.copy()
+        h.update(buffer[i * 64:i * 64 + 64])
+        digests.append(h.digest())
+    return np.frombuffer(b''.join(digests), dtype=np.uint8).reshape(-1, 32)
+
+
+def _hash_leaves(indices, balances):
+    messages = np.empty((len(indices), 16), dtype=np.uint8)
+    messages[:, :8] = np.asarray(indices, dtype='<u8').view(np.uint8).reshape(-1, 8)
+    messages[:, 8:] = np.asarray(balances, dtype='<i8').view(np.uint8).reshape(-1, 8)
+    buffer = memoryview(messages).cast('B')
+    digests = []
+    for i in range(0, len(buffer), 16):
+        h = _LEAF_HASH.copy()
+        h.update(buffer[i:i + 16])
+        digests.append(h.digest())
+    return np.frombuffer(b''.join(digests), dtype=np.uint8).reshape(-1, 32)
+
+
+class StateTree:
+    """Merkle tree over account balances with incremental path updates."""
+
+    def __init__(self, balances, offset=0):
+        size = 1 << max(1, int(len(balances) - 1).bit_length())
+        leaves = np.zeros((size, 32), dtype=np.uint8)
+        leaves[:len(balances)] = _hash_leaves(np.arange(len(balances)) + offset, balances)
+        self.offset = offset
+        self.levels = [leaves]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            self.levels.append(_hash_pairs(level, np.arange(len(level) // 2)).copy())
+
+    @property
+    def root(self):
+        return bytes(self.levels[-1][0])
+
+    def update(self, indices, balances):
+        """Set the leaves of local ``indices`` and rehash their paths; returns the root."""
+        if len(indices):
+            nodes = np.asarray(indices, dtype=np.int64)
+            self.levels[0][nodes] = _hash_leaves(nodes + self.offset, balances)
+            for depth in range(1, len(self.levels)):
+                nodes = np.unique(nodes >> 1)
+                self.levels[depth][nodes] = _hash_pairs(self.levels[depth - 1], nodes)
+        return self.root
+
+
+def _shard_worker(conn, balances, offset):
+    tree = StateTree(balances, offset)
+    conn.send(tree.root)
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        conn.send(tree.update(*message))
+
+
+def combine_roots(roots):
+    """Merkle root over shard roots, duplicating an odd tail."""
+    level = list(roots)
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        parents = []
+        for left, right in zip(level[::2], level[1::2]):
+            h = _NODE_HASH.copy()
+            h.update(left + right)
+            parents.append(h.digest())
+        level = parents
+    return level[0]
+
+
+class ShardedState:
+    """Account balances whose state root is maintained by ``workers`` shard processes.
+
+    With one worker the single shard's tree lives in this process.
+    """
+
+    def __init__(self, balances, workers=1):
+        self.balances = np.asarray(balances, dtype=np.int64).copy()
+        self.shard_size = -(-len(self.balances) // workers)
+        self.bounds = list(range(0, len(self.balances), self.shard_size)) + [len(self.balances)]
+        self._processes = []
+        if workers == 1:
+            self._tree = StateTree(self.balances)
+            self.roots = [self._tree.root]
+            return
+
+        self._tree = None
+        context = multiprocessing.get_context('spawn')
+        self._conns = []
+        for lo, hi in zip(self.bounds[:-1], self.bounds[1:]):
+            parent, child = context.Pipe()
+            process = context.Process(target=_shard_worker, args=(child, self.balances[lo:hi], lo), daemon=True)
+            process.start()
+            self._conns.append(parent)
+            self._processes.append(process)
+        self.roots = [conn.recv() for conn in self._conns]
+
+    @property
+    def root(self):
+        return combine_roots(self.roots)
+
+    def commit(self, touched):
+        """Recompute the state root after ``touched`` (sorted) accounts changed."""
+        if self._tree is not None:
+            self.roots[0] = self._tree.update(touched, self.balances[touched])
+            return self.root
+        cuts = np.searchsorted(touched, self.bounds)
+        dirty = []
+        for shard, conn in enumerate(self._conns):
+            accounts = touched[cuts[shard]:cuts[shard + 1]]
+            if len(accounts):
+                conn.send((accounts - self.bounds[shard], self.balances[accounts]))
+                dirty.append(shard)
+        for shard in dirty:
+            self.roots[shard] = self._conns[shard].recv()
+        return self.root
+
+    def close(self):
+        for conn in getattr(self, '_conns', []):
+            conn.send(None)
+        for process in self._processes:
+            process.join()
+
+
+@dataclass
+class RollupRun:
+    batch_size: int
+    workers: int
+    transactions: int
+    applied: int
+    seconds: float
+    batch_latency_ms: np.ndarray
+    state_root: bytes
+
+    @property
+    def tps(self):
+        return self.applied / self.seconds if self.seconds else 0.0
+
+
+def run_pipeline(accounts=1 << 16, transactions=100_000, batch_size=2_000, workers=1,
+                 initial_balance=1_000_000, seed=0):
+    """Sequence, apply and commit ``transactions`` in batches; returns timings.
+
+    Transaction generation and the initial state tree are not timed.
+    """
+    if batch_size < 1 or workers < 1:
+        raise ValueError("batch_size and workers must be positive")
+    txs = generate_transactions(transactions, accounts, seed=seed)
+    state = ShardedState(np.full(accounts, initial_balance, dtype=np.int64), workers)
+    latencies = []
+    applied = 0
+    root = state.root
+    try:
+        start = time.perf_counter()
+        for lo in range(0, transactions, batch_size):
+            batch_start = time.perf_counter()
+            touched, count = apply_batch(state.balances, txs[lo:lo + batch_size])
+            root = state.commit(touched)
+            applied += count
+            latencies.append(time.perf_counter() - batch_start)
+        seconds = time.perf_counter() - start
+    finally:
+        state.close()
+    return RollupRun(batch_size, workers, transactions, applied, seconds,
+                     np.array(latencies) * 1000.0, root)
+
+
+def benchmark(batch_sizes=(500, 2_000, 8_000), worker_counts=(1, 2, 4), **kwargs):
+    """``run_pipeline`` over every batch size / worker count combination."""
+    return [run_pipeline(batch_size=b, workers=w, **kwargs) for w in worker_counts for b in batch_sizes]
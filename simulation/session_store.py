@@ -0,0 +1,241 @@
+"""Memory-budgeted result storage for dashboard sessions.
+
+Every session gets a ``SessionStore`` that maps keys to results and knows
+each value's byte size: NumPy arrays and pandas objects are measured
+exactly, containers and plain objects by walking their contents. A
+``MemoryLedger`` shared by the server process holds every store and
+enforces two budgets, one per session and one over all sessions. Each is
+enforced by evicting the least recently used values: the session's own
+values for the session budget, and any session's for the global one.
+
+An evicted array of at least ``SPILL_MIN_BYTES`` is spilled rather than
+dropped. It is saved as ``.npy`` and replaced by a read-only memory map of
+that file, so later reads return it as before while only the pages actually
+touched are resident, and in the OS page cache rather than on the heap.
+Other evicted values are dropped, and reading them raises ``KeyError`` (or
+``get`` returns its default), so callers rebuild them.
+
+Spill files of a store are deleted once the store is garbage collected,
+which happens when its session ends.
+
+The dashboard keeps each session's Live Chain stream and window, testbed
+results and witness audits here. None of them is a bare array of 1 MiB or
+more today, so over budget they are dropped rather than spilled.
+"""
+
+import dataclasses
+import inspect
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import uuid
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+SESSION_BYTES = int(os.environ.get('SESSION_MEMORY_BYTES', 256 << 20))
+TOTAL_BYTES = int(os.environ.get('SESSION_MEMORY_TOTAL_BYTES', 2 << 30))
+SPILL_DIR = Path(os.environ.get('SIMULATION_SPILL', Path(tempfile.gettempdir()) / 'simulation-spill'))
+SPILL_MIN_BYTES = 1 << 20
+
+
+def nbytes(value, _seen=None):
+    """Approximate resident bytes of ``value``; memory-mapped arrays count as zero."""
+    if isinstance(value, np.memmap):
+        return 0
+    if isinstance(value, np.ndarray):
+        # Views are charged to their base, which keeps the whole buffer alive
+        base = value.base if isinstance(value.base, np.ndarray) else value
+        return 0 if isinstance(base, np.memmap) else base.nbytes
+    module = type(value).__module__
+    if module.startswith('pandas') and hasattr(value, 'memory_usage'):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(nbytes(k, seen) + nbytes(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(nbytes(item, seen) for item in value)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        size += sum(nbytes(getattr(value, f.name), seen) for f in dataclasses.fields(value))
+    elif inspect.isgenerator(value):
+        # A suspended generator keeps its frame's locals alive
+        if value.gi_frame is not None:
+            size += nbytes(value.gi_frame.f_locals, seen)
+    elif hasattr(value, '__dict__') and not isinstance(value, type):
+        size += nbytes(vars(value), seen)
+    return size
+
+
+@dataclass
+class _Entry:
+    value: object
+    nbytes: int
+    used: int
+    path: Path = None
+
+
+class SessionStore:
+    """One session's results, bounded by ``ledger``'s budgets."""
+
+    def __init__(self, ledger, session, budget):
+        self.ledger = ledger
+        self.session = session
+        self.budget = budget
+        self.directory = ledger.directory / f"{os.getpid()}-{session}-{uuid.uuid4().hex[:8]}"
+        self._entries = {}
+        weakref.finalize(self, shutil.rmtree, self.directory, True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __getitem__(self, key):
+        with self.ledger.lock:
+            entry = self._entries[key]
+            entry.used = next(self.ledger.clock)
+            return entry.value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        size = nbytes(value)
+        with self.ledger.lock:
+            self._discard(key)
+            self._entries[key] = _Entry(value, size, next(self.ledger.clock))
+            # The value just stored stays resident, even alone over budget, until a later store
+            while self.usage > self.budget and self._evict_oldest(exclude=key):
+                pass
+            self.ledger.enforce(exclude=(self, key))
+
+    def __delitem__(self, key):
+        with self.ledger.lock:
+            if key not in self._entries:
+                raise KeyError(key)
+            self._discard(key)
+
+    def pop(self, key, default=None):
+        """Remove ``key`` and return its value, or ``default`` if it is absent or was evicted."""
+        with self.ledger.lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._discard(key)
+            return entry.value
+
+    def keys(self):
+        return list(self._entries)
+
+    @property
+    def usage(self):
+        """Resident bytes held by this session's values."""
+        with self.ledger.lock:
+            return sum(entry.nbytes for entry in self._entries.values())
+
+    @property
+    def spilled(self):
+        """Bytes of this session's values that live in spill files."""
+        with self.ledger.lock:
+            paths = [entry.path for entry in self._entries.values() if entry.path is not None]
+        total = 0
+        for path in paths:
+            # Files of values discarded since are already unlinked
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                pass
+        return total
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry.path is not None:
+            # Open memory maps stay valid after the unlink
+            entry.path.unlink(missing_ok=True)
+
+    def _oldest(self, exclude=None):
+        """``(used, key)`` of the least recently used resident value other than ``exclude``, or ``None``."""
+        resident = [(entry.used, key) for key, entry in self._entries.items() if entry.nbytes and key != exclude]
+        return min(resident, key=lambda item: item[0]) if resident else None
+
+    def _evict_oldest(self, exclude=None):
+        oldest = self._oldest(exclude)
+        if oldest is None:
+            return False
+        self._evict(oldest[1])
+        return True
+
+    def _evict(self, key):
+        entry = self._entries[key]
+        if isinstance(entry.value, np.ndarray) and entry.nbytes >= SPILL_MIN_BYTES:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{uuid.uuid4().hex}.npy"
+            np.save(path, entry.value)
+            entry.value = np.load(path, mmap_mode='r')
+            entry.nbytes = 0
+            entry.path = path
+        else:
+            del self._entries[key]
+
+
+class MemoryLedger:
+    """Every session store of this server process, under one global budget."""
+
+    def __init__(self, total_bytes=TOTAL_BYTES, session_bytes=SESSION_BYTES, directory=SPILL_DIR):
+        self.total_bytes = total_bytes
+        self.session_bytes = session_bytes
+        self.directory = Path(directory)
+        # Sessions run on separate script threads
+        self.lock = threading.RLock()
+        self.clock = itertools.count()
+        self._stores = weakref.WeakSet()
+
+    def store(self, session):
+        """A new store for ``session``, registered with this ledger."""
+        with self.lock:
+            store = SessionStore(self, session, self.session_bytes)
+            self._stores.add(store)
+            return store
+
+    @property
+    def sessions(self):
+        return len(self._stores)
+
+    @property
+    def usage(self):
+        """Resident bytes held by every session."""
+        with self.lock:
+            return sum(store.usage for store in self._stores)
+
+    def enforce(self, exclude=(None, None)):
+        """Evict least recently used values across sessions until under the global budget.
+
+        ``exclude`` is a ``(store, key)`` pair that is never evicted.
+        """
+        with self.lock:
+            stores = list(self._stores)
+            usage = sum(store.usage for store in stores)
+            while usage > self.total_bytes:
+                candidates = [(oldest, store) for store in stores
+                              if (oldest := store._oldest(exclude[1] if store is exclude[0] else None)) is not None]
+                if not candidates:
+                    break
+                (_, key), store = min(candidates, key=lambda item: item[0][0])
+                before = store.usage
+                store._evict(key)
+                usage -= before - store.usage
@@ -0,0 +1,238 @@
+"""Statistical tests of win counts against stake-proportional expectations.
+
+Input is a ``(windows, validators)`` matrix of blocks won per window. Every
+test is vectorized over all validators and windows, processing windows in
+chunks so memory stays bounded at 10^5 validators x 10^3 windows:
+
+* chi-square goodness of fit, one test per window;
+* Kolmogorov–Smirnov, one test per window: the distance between the
+  cumulative win and stake shares with validators in a given order (for
+  example by latency, which exposes a geographic bias);
+* two-sided binomial tail, one test per validator and window. It is exact
+  where the expected count is small and uses a continuity-corrected normal
+  approximation elsewhere.
+
+p-values of each family are adjusted for multiple testing with
+Benjamini–Hochberg. The distribution functions are written out in NumPy,
+so no SciPy is needed; their loops run over series terms, not over data.
+"""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+# Expected counts up to this use the exact binomial tail
+EXACT_MEAN = 50.0
+# Chi-square degrees of freedom above this use the Wilson–Hilferty approximation
+EXACT_DF = 200
+CHUNK_ELEMENTS = 1 << 22
+
+
+@dataclass
+class FairnessTests:
+    blocks: np.ndarray
+    chi2: np.ndarray
+    chi2_p: np.ndarray
+    chi2_q: np.ndarray
+    ks: np.ndarray
+    ks_p: np.ndarray
+    ks_q: np.ndarray
+    binomial_p: np.ndarray
+    binomial_q: np.ndarray
+
+    def unfair(self, alpha=0.05):
+        """``(windows, validators)`` mask of binomial tests rejected at false discovery rate ``alpha``."""
+        return self.binomial_q < alpha
+
+
+def erfc(x):
+    """Complementary error function, fractional error below 1.2e-7."""
+    x = np.asarray(x, dtype=np.float64)
+    z = np.abs(x)
+    t = 1.0 / (1.0 + 0.5 * z)
+    poly = -z * z - 1.26551223 + t * (1.00002368 + t * (0.37409196 + t * (0.09678418 + t * (
+        -0.18628806 + t * (0.27886807 + t * (-1.13520398 + t * (1.48851587 + t * (
+            -0.82215223 + t * 0.17087277))))))))
+    result = t * np.exp(poly)
+    return np.where(x >= 0, result, 2.0 - result)
+
+
+def normal_sf(z):
+    return 0.5 * erfc(np.asarray(z) / np.sqrt(2.0))
+
+
+def _gamma_q(a, x, iterations=400):
+    """Regularized upper incomplete gamma Q(a, x) for moderate ``a``."""
+    a = np.broadcast_to(np.asarray(a, dtype=np.float64), np.shape(x)).copy()
+    x = np.asarray(x, dtype=np.float64).copy()
+    # One lgamma per distinct degree of freedom, not per element
+    shapes, inverse = np.unique(a, return_inverse=True)
+    log_gamma = np.array([math.lgamma(v) for v in shapes])[inverse].reshape(a.shape)
+    log_prefix = a * np.log(np.maximum(x, 1e-300)) - x - log_gamma
+    series = x < a + 1
+
+    # Series for P(a, x) below a + 1; the elements above it are discarded
+    xs = np.where(series, x, 0.0)
+    term = 1.0 / a
+    total = term.copy()
+    for n in range(1, iterations):
+        term = term * xs / (a + n)
+        total += term
+    p_series = np.exp(log_prefix) * total
+
+    # Lentz continued fraction for Q(a, x) above it
+    tiny = 1e-300
+    b = np.where(series, a + 2.0, x) + 1.0 - a
+    c = np.full_like(x, 1.0 / tiny)
+    d = 1.0 / np.where(b == 0, tiny, b)
+    h = d.copy()
+    for i in range(1, iterations):
+        an = -i * (i - a)
+        b = b + 2.0
+        d = an * d + b
+        d = 1.0 / np.where(np.abs(d) < tiny, tiny, d)
+        c = b + an / c
+        c = np.where(np.abs(c) < tiny, tiny, c)
+        h *= d * c
+    q_fraction = np.exp(log_prefix) * h
+
+    q = np.where(series, 1.0 - p_series, q_fraction)
+    return np.clip(np.where(x <= 0, 1.0, q), 0.0, 1.0)
+
+
+def chi2_sf(x, df):
+    """Survival function of the chi-square distribution with ``df`` degrees of freedom."""
+    x = np.asarray(x, dtype=np.float64)
+    df = np.broadcast_to(np.asarray(df, dtype=np.float64), x.shape)
+    out = np.empty(x.shape)
+    exact = df <= EXACT_DF
+    if exact.any():
+        out[exact] = _gamma_q(df[exact] / 2, x[exact] / 2)
+    if (~exact).any():
+        k = df[~exact]
+        # Wilson–Hilferty: the cube root of chi2 / df is close to normal
+        z = ((x[~exact] / k) ** (1 / 3) - (1 - 2 / (9 * k))) / np.sqrt(2 / (9 * k))
+        out[~exact] = normal_sf(z)
+    return out
+
+
+def kolmogorov_sf(lam, terms=100):
+    """Asymptotic Kolmogorov distribution tail ``P(K > lam)``."""
+    lam = np.asarray(lam, dtype=np.float64)
+    j = np.arange(1, terms + 1).reshape((-1,) + (1,) * lam.ndim)
+    series = 2 * np.sum((-1.0) ** (j - 1) * np.exp(-2 * j ** 2 * lam ** 2), axis=0)
+    # The alternating series only converges away from zero, where the tail is 1 anyway
+    return np.clip(np.where(lam < 0.2, 1.0, series), 0.0, 1.0)
+
+
+def binomial_two_sided(k, n, p):
+    """Two-sided binomial tail p-values, ``2 * min(P(X <= k), P(X >= k))``."""
+    k, n, p = np.broadcast_arrays(np.asarray(k, dtype=np.float64), np.asarray(n, dtype=np.float64),
+                                  np.asarray(p, dtype=np.float64))
+    mean = n * p
+    lower = np.empty(k.shape)
+    upper = np.empty(k.shape)
+
+    exact = mean <= EXACT_MEAN
+    if exact.any():
+        ke, ne, pe = k[exact], n[exact], p[exact]
+        # Beyond this both tails are negligible; clipping bounds the loop
+        ke = np.minimum(ke, np.floor(EXACT_MEAN + 10 * np.sqrt(EXACT_MEAN) + 20))
+        with np.errstate(divide='ignore'):
+            log_pmf = ne * np.log1p(-pe)
+            log_ratio = np.log(pe) - np.log1p(-pe)
+        le = np.empty(ke.shape)
+        lt = np.empty(ke.shape)
+        # Walk the pmf up from zero; an entry leaves the working set once j reaches its k,
+        # so the work is the sum of the counts rather than the largest count times the entries
+        active = np.arange(len(ke))
+        below = np.zeros(len(ke))
+        for j in range(int(ke.max()) + 1):
+            pmf = np.exp(log_pmf)
+            done = ke == j
+            if done.any():
+                lt[active[done]] = below[done]
+                le[active[done]] = below[done] + pmf[done]
+                keep = ~done
+                active, below, pmf, log_pmf, log_ratio, ke, ne = (
+                    a[keep] for a in (active, below, pmf, log_pmf, log_ratio, ke, ne))
+            below += pmf
+            with np.errstate(divide='ignore', invalid='ignore'):
+                log_pmf = log_pmf + np.log(np.maximum(ne - j, 0)) - np.log(j + 1) + log_ratio
+        lower[exact] = le
+        upper[exact] = 1.0 - lt
+
+    if (~exact).any():
+        kn, mn = k[~exact], mean[~exact]
+        sd = np.sqrt(mn * (1 - p[~exact]))
+        lower[~exact] = 1.0 - normal_sf((kn + 0.5 - mn) / sd)
+        upper[~exact] = normal_sf((kn - 0.5 - mn) / sd)
+
+    return np.clip(2 * np.minimum(lower, upper), 0.0, 1.0)
+
+
+def benjamini_hochberg(p):
+    """Benjamini–Hochberg adjusted p-values (q-values) over every entry of ``p``."""
+    p = np.asarray(p)
+    flat = p.ravel()
+    m = flat.size
+    if m == 0:
+        return p.copy()
+    order = np.argsort(flat)
+    q = flat[order] * (m / np.arange(1, m + 1, dtype=np.float64))
+    # Running minimum from the largest p-value down; tied p-values come out equal
+    q = np.minimum(np.minimum.accumulate(q[::-1])[::-1], 1.0)
+    out = np.empty_like(flat)
+    out[order] = q
+    return out.reshape(p.shape)
+
+
+def window_counts(winners, validators, window):
+    """``(windows, validators)`` win counts of a winner sequence cut into ``window``-block windows.
+
+    Negative winners (empty slots) are skipped; a trailing partial window is dropped.
+    """
+    winners = np.asarray(winners, dtype=np.int64)
+    windows = len(winners) // window
+    winners = winners[:windows * window]
+    produced = winners >= 0
+    keys = np.flatnonzero(produced) // window * validators + winners[produced]
+    return np.bincount(keys, minlength=windows * validators).reshape(windows, validators)
+
+
+def run_tests(wins, stake, order=None, chunk_elements=CHUNK_ELEMENTS):
+    """All tests for a ``(windows, validators)`` win-count matrix.
+
+    ``order`` permutes validators for the Kolmogorov–Smirnov test; by default
+    they are taken as given.
+    """
+    wins = np.atleast_2d(np.asarray(wins))
+    stake = np.asarray(stake, dtype=np.float64)
+    windows, n = wins.shape
+    if len(stake) != n:
+        raise ValueError(f"wins has {n} validators but stake has {len(stake)}")
+    share = stake / stake.sum()
+    ks_share = np.cumsum(share[order] if order is not None else share)
+
+    blocks = wins.sum(axis=1)
+    chi2 = np.empty(windows)
+    ks = np.empty(windows)
+    binomial_p = np.empty((windows, n), dtype=np.float32)
+    step = max(1, chunk_elements // max(n, 1))
+    for start in range(0, windows, step):
+        part = wins[start:start + step].astype(np.float64)
+        m = blocks[start:start + step, None].astype(np.float64)
+        expected = m * share
+        with np.errstate(divide='ignore', invalid='ignore'):
+            chi2[start:start + step] = np.where(m[:, 0] > 0, ((part - expected) ** 2 / expected).sum(axis=1), 0.0)
+            cumulative = np.cumsum(part[:, order] if order is not None else part, axis=1) / m
+        ks[start:start + step] = np.where(m[:, 0] > 0, np.abs(cumulative - ks_share).max(axis=1), 0.0)
+        binomial_p[start:start + step] = binomial_two_sided(part, m, share)
+
+    chi2_p = chi2_sf(chi2, n - 1)
+    # Stephens' small-sample correction of the KS statistic
+    root = np.sqrt(np.maximum(blocks, 1))
+    ks_p = kolmogorov_sf((root + 0.12 + 0.11 / root) * ks)
+    return FairnessTests(blocks, chi2, chi2_p, benjamini_hochberg(chi2_p), ks, ks_p, benjamini_hochberg(ks_p),
+                         binomial_p, benjamini_hochberg(binomial_p))
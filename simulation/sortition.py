@@ -0,0 +1,228 @@
+"""Algorand-style cryptographic sortition.
+
+Every round, each validator evaluates a keyed hash of the round seed. The
+hash is read as a uniform ``u``, and the validator's number of selected
+sub-users is the inverse binomial CDF at ``u`` over its stake units, with
+success probability ``committee_size / total units``. Committees are the
+validators with at least one sub-user, and each member's priority is its
+best sub-user's hash. A proposer round picks the highest-priority proposal
+that arrives within the wait window.
+
+Evaluations run over whole ``(rounds, validators)`` blocks at once:
+
+* ``method='mix'`` is a SplitMix64-style keyed mix in NumPy. It is not a
+  VRF, but its outputs are statistically indistinguishable for
+  simulation, and it reaches thousands of rounds per second at 10^5
+  validators.
+* ``method='blake2s'`` computes real keyed BLAKE2s evaluations over a
+  contiguous seed buffer (``witness.evaluations``). It is slower, for
+  runs that need cryptographic outputs.
+
+Almost every validator draws zero sub-users. Its hash is compared as an
+integer against ``P(j = 0) * 2^64``, and only the validators above that go
+through the inverse CDF. The inverse CDF walks the binomial pmf upward,
+dropping each validator once its count is settled. One round is hashed at a
+time into reused buffers, which stay in cache.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from . import witness
+
+# SplitMix64 finaliser constants
+_M1 = np.uint64(0xBF58476D1CE4E5B9)
+_M2 = np.uint64(0x94D049BB133111EB)
+_GAMMA = 0x9E3779B97F4A7C15
+_S30, _S27, _S31, _S11 = (np.uint64(s) for s in (30, 27, 31, 11))
+
+
+@dataclass
+class Committees:
+    rounds: np.ndarray
+    indptr: np.ndarray
+    members: np.ndarray
+    votes: np.ndarray
+    priority: np.ndarray
+
+    def __len__(self):
+        return len(self.rounds)
+
+    def committee(self, i):
+        """``(members, votes)`` index arrays of the ``i``-th round."""
+        span = slice(self.indptr[i], self.indptr[i + 1])
+        return self.members[span], self.votes[span]
+
+    def sizes(self):
+        """Sub-users selected per round."""
+        return np.add.reduceat(self.votes, self.indptr[:-1]) if len(self.votes) else np.zeros(len(self.rounds))
+
+
+@dataclass
+class SortitionResult:
+    rounds: int
+    wins: np.ndarray
+    empty_rounds: int
+    proposers: np.ndarray
+
+
+def mix(x, scratch=None):
+    """SplitMix64 finaliser over a uint64 array, in place; ``scratch`` is a same-shape buffer."""
+    tmp = np.empty_like(x) if scratch is None else scratch
+    np.right_shift(x, _S30, out=tmp)
+    x ^= tmp
+    x *= _M1
+    np.right_shift(x, _S27, out=tmp)
+    x ^= tmp
+    x *= _M2
+    np.right_shift(x, _S31, out=tmp)
+    x ^= tmp
+    return x
+
+
+def _constant(value):
+    return np.uint64(value % 2**64)
+
+
+def to_unit(h):
+    """Uniform floats in [0, 1) from the top 53 bits of uint64 hashes."""
+    return (h >> _S11).astype(np.float64) * 2.0 ** -53
+
+
+def binomial_quantile(u, n, p):
+    """Smallest ``j`` with ``u < F(j; n, p)``, elementwise; ``n`` broadcasts against ``u``."""
+    u = np.asarray(u, dtype=np.float64)
+    n = np.broadcast_to(np.asarray(n, dtype=np.float64), u.shape)
+    j = np.zeros(u.shape, dtype=np.int32)
+    log_ratio = np.log(p) - np.log1p(-p)
+
+    log_pmf = n * np.log1p(-p)
+    cdf = np.exp(log_pmf)
+    active = np.flatnonzero(u >= cdf)
+    u_a, n_a, log_pmf, cdf = u.ravel()[active], n.ravel()[active], log_pmf.ravel()[active], cdf.ravel()[active]
+    k = 0
+    flat = j.reshape(-1)
+    while len(active):
+        with np.errstate(divide='ignore'):
+            log_pmf = log_pmf + np.log(np.maximum(n_a - k, 0)) - np.log(k + 1) + log_ratio
+        cdf = cdf + np.exp(log_pmf)
+        flat[active] += 1
+        k += 1
+        # Rounding can leave the CDF a hair below 1 at j = n
+        more = (u_a >= cdf) & (k < n_a)
+        active, u_a, n_a, log_pmf, cdf = active[more], u_a[more], n_a[more], log_pmf[more], cdf[more]
+    return j
+
+
+class Sortition:
+    """Sortition over fixed validator stakes, counted in whole ``unit``s."""
+
+    def __init__(self, stake, unit=None, method='mix', seed=0):
+        stake = np.asarray(stake, dtype=np.float64)
+        if method not in ('mix', 'blake2s'):
+            raise ValueError(f"unknown method {method!r}, expected 'mix' or 'blake2s'")
+        # By default the smallest stake is 1,000 units
+        unit = unit or stake.min() / 1000
+        self.units = np.maximum(np.round(stake / unit), 1)
+        self.total_units = self.units.sum()
+        self.method = method
+        rng = np.random.default_rng(seed)
+        self.keys = rng.integers(0, 2**63, size=len(stake), dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self.chain_seed = rng.integers(0, 2**63, dtype=np.uint64)
+
+    @property
+    def validators(self):
+        return len(self.units)
+
+    def round_seeds(self, rounds, role=0):
+        rounds = np.asarray(rounds, dtype=np.uint64)
+        return mix(rounds * _constant(_GAMMA) + _constant(int(self.chain_seed) + role * int(_M2)))
+
+    def hashes(self, rounds, role=0):
+        """``(len(rounds), validators)`` uint64 evaluations for ``rounds``."""
+        seeds = self.round_seeds(rounds, role)
+        out = np.empty((len(seeds), self.validators), dtype=np.uint64)
+        scratch = np.empty(self.validators, dtype=np.uint64)
+        for i, seed in enumerate(seeds):
+            self._evaluate(seed, out[i], scratch)
+        return out
+
+    def _evaluate(self, seed, out, scratch):
+        if self.method == 'blake2s':
+            evals = witness.evaluations(seed.tobytes() * 4, self.validators)
+            out[:] = evals[:, :8].copy().view('>u8').ravel()
+        else:
+            np.bitwise_xor(self.keys, seed, out=out)
+            mix(out, scratch)
+
+    def select(self, rounds, committee_size, role=0):
+        """Committees of expected ``committee_size`` sub-users for each of ``rounds``."""
+        rounds = np.atleast_1d(np.asarray(rounds, dtype=np.int64))
+        p = committee_size / self.total_units
+        # A validator draws no sub-users when its hash is below P(j = 0) * 2^64. Comparing the
+        # raw hashes against that leaves the quantile walk only the few that may be selected
+        zero = np.exp(self.units * np.log1p(-p))
+        threshold = np.minimum(zero * 2.0 ** 64, 2.0 ** 64 - 2048).astype(np.uint64)
+        h = np.empty(self.validators, dtype=np.uint64)
+        scratch = np.empty_like(h)
+        above = np.empty(self.validators, dtype=bool)
+
+        rows, members, hashes = [], [], []
+        for i, seed in enumerate(self.round_seeds(rounds, role)):
+            self._evaluate(seed, h, scratch)
+            np.greater_equal(h, threshold, out=above)
+            col = np.flatnonzero(above)
+            rows.append(np.full(len(col), i))
+            members.append(col)
+            hashes.append(h[col])
+        row, col, selected = (np.concatenate(a) if a else np.empty(0, dtype=np.int64)
+                              for a in (rows, members, hashes))
+        selected = selected.astype(np.uint64)
+
+        votes = binomial_quantile(to_unit(selected), self.units[col], p)
+        picked = votes > 0
+        row, col, selected, votes = row[picked], col[picked], selected[picked], votes[picked]
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(row, minlength=len(rounds)))))
+        return Committees(rounds, indptr, col.astype(np.int64), votes, self._priority(selected, votes))
+
+    @staticmethod
+    def _priority(h, counts):
+        # Each sub-user i hashes (evaluation, i); a member's priority is its best sub-user's
+        best = np.full(len(h), np.iinfo(np.uint64).max, dtype=np.uint64)
+        for i in range(int(counts.max()) if len(counts) else 0):
+            has = counts > i
+            candidate = mix(h[has] + _constant((i + 1) * _GAMMA))
+            best[has] = np.minimum(best[has], candidate)
+        return best
+
+
+def simulate(region, stake, latency_ms, rounds, proposers=26, jitter=0.25, wait_ms=5000.0,
+             method='mix', chunk=1 << 12, seed=0):
+    """Proposer sortition over ``rounds`` rounds with Algorand's priority rule.
+
+    Each round selects about ``proposers`` proposer sub-users; the block is
+    the highest-priority proposal whose propagation (validator latency with
+    log-normal ``jitter``) beats ``wait_ms``. Returns per-validator wins.
+    """
+    sortition = Sortition(stake, method=method, seed=seed)
+    rng = np.random.default_rng([seed, 1])
+    latency_ms = np.asarray(latency_ms, dtype=np.float64)
+    wins = np.zeros(len(stake), dtype=np.int64)
+    proposer_counts = np.zeros(rounds, dtype=np.int64)
+    empty_rounds = 0
+    for start in range(0, rounds, chunk):
+        committees = sortition.select(np.arange(start, min(start + chunk, rounds)), proposers, role=1)
+        sizes = np.diff(committees.indptr)
+        proposer_counts[start:start + len(committees)] = sizes
+        round_of = np.repeat(np.arange(len(committees)), sizes)
+        arrival = latency_ms[committees.members] * rng.lognormal(0.0, jitter, size=len(committees.members))
+        on_time = arrival <= wait_ms
+        # Highest priority (lowest hash) among the on-time proposals of each round
+        order = np.lexsort((committees.priority[on_time], round_of[on_time]))
+        candidates = committees.members[on_time][order]
+        candidate_round = round_of[on_time][order]
+        first = np.flatnonzero(np.r_[True, candidate_round[1:] != candidate_round[:-1]]) if len(order) else order
+        wins += np.bincount(candidates[first], minlength=len(stake))
+        empty_rounds += len(committees) - len(first)
+    return SortitionResult(rounds, wins, empty_rounds, proposer_counts)
@@ -0,0 +1,185 @@
+"""Epoch-level stake dynamics: how concentration evolves as rewards compound.
+
+Validators are held as parallel arrays (stake, region), and every epoch
+applies its rules to all of them in bulk:
+
+* attestation rewards, a fixed fraction of every stake;
+* proposer rewards for ``blocks_per_epoch`` blocks, each won with
+  probability proportional to stake times the winner's regional advantage.
+  The advantage is the region's win share over its stake share from the
+  leader-election simulation, so latency bias compounds into stake;
+* slashing, which burns a fraction of a few random validators' stake;
+* churn: random exits, plus ejection below ``min_stake``, replaced by fresh
+  validators with ``draw_stakes`` stakes and regions in ``REGION_SHARE``.
+
+Per-validator random events are drawn as a binomial count and then that many
+indices, so an epoch costs a few O(n) array passes. The stake Gini, the
+Nakamoto coefficient and the regional stake shares are recorded every
+``record_every`` epochs, from a single sort each.
+
+Long runs write ``.npz`` checkpoints of the state, the generator state and
+the trajectories so far. A rerun with the same checkpoint path resumes
+where the last checkpoint left off.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .election import REGION_SHARE, REGIONS, draw_stakes
+
+CHECKPOINT_DIR = Path(os.environ.get('SIMULATION_CHECKPOINTS', '.stake-checkpoints'))
+
+
+@dataclass(frozen=True)
+class Rules:
+    blocks_per_epoch: int = 32
+    # Rewards as fractions of the initial mean stake (per block) or of each stake (per epoch)
+    block_reward: float = 0.01
+    attestation_rate: float = 1e-5
+    slash_probability: float = 1e-5
+    slash_fraction: float = 0.05
+    churn_rate: float = 1e-4
+    # Ejection threshold, as a fraction of the initial mean stake
+    min_stake: float = 0.01
+    stake_distribution: str = 'uniform'
+
+
+@dataclass
+class DynamicsResult:
+    epochs: np.ndarray
+    stake_gini: np.ndarray
+    nakamoto: np.ndarray
+    geographic_gini: np.ndarray
+    region_share: np.ndarray
+    stake: np.ndarray
+    region: np.ndarray
+    slashed: int
+    replaced: int
+
+
+def concentration(stake, region, regions=len(REGIONS)):
+    """``(stake Gini, Nakamoto coefficient, regional stake shares, geographic Gini)`` of one epoch.
+
+    The geographic Gini compares each region's stake share with its share
+    of validators, so it is 0 while stake is spread evenly across regions.
+    """
+    ordered = np.sort(stake)
+    n = len(ordered)
+    total = ordered.sum()
+    ranks = np.arange(1, n + 1)
+    stake_gini = float((2 * ranks - n - 1) @ ordered / (n * total))
+    # Fewest validators holding more than half: the rest, from the bottom, stay at or below half
+    nakamoto = n - int(np.searchsorted(np.cumsum(ordered), total - 0.5 * total, side='left'))
+    share = np.bincount(region, weights=stake, minlength=regions) / total
+    ratio = share / np.maximum(np.bincount(region, minlength=regions) / n, 1e-12)
+    ratio = np.sort(ratio[share > 0])
+    k = len(ratio)
+    geographic = float((2 * np.arange(1, k + 1) - k - 1) @ ratio / (k * ratio.sum())) if k else 0.0
+    return stake_gini, nakamoto, share, geographic
+
+
+def checkpoint_path(name, directory=None):
+    return Path(directory or CHECKPOINT_DIR) / f"{name}.npz"
+
+
+def _fingerprint(rules, region_advantage, stake, region, record_every, seed):
+    return json.dumps({'rules': asdict(rules), 'advantage': np.asarray(region_advantage).tolist(),
+                       'validators': len(stake), 'stake': float(stake.sum()), 'regions': np.bincount(region).tolist(),
+                       'record_every': record_every, 'seed': seed}, sort_keys=True)
+
+
+def _save(path, **arrays):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Written beside the target and renamed over it, so a crash keeps the previous checkpoint
+    tmp = path.with_suffix(f".{os.getpid()}.tmp.npz")
+    np.savez(tmp, **arrays)
+    os.replace(tmp, path)
+
+
+def simulate(region, stake, epochs, rules=Rules(), region_advantage=None, record_every=1,
+             checkpoint=None, checkpoint_every=1000, seed=0):
+    """Run ``epochs`` epochs from the given validators.
+
+    With ``checkpoint`` set, state is saved there every ``checkpoint_every``
+    epochs and a matching earlier checkpoint is resumed from. A checkpoint
+    written under different rules or validators raises ``ValueError``.
+    """
+    region = np.array(region, dtype=np.int8)
+    stake = np.array(stake, dtype=np.float64)
+    n = len(stake)
+    if n == 0 or epochs < 0 or record_every < 1:
+        raise ValueError("need validators, epochs >= 0 and record_every >= 1")
+    advantage = np.ones(len(REGIONS)) if region_advantage is None else np.asarray(region_advantage, dtype=np.float64)
+    fingerprint = _fingerprint(rules, advantage, stake, region, record_every, seed)
+    rng = np.random.default_rng(seed)
+    mean_stake = stake.mean()
+    block_reward = rules.block_reward * mean_stake
+    min_stake = rules.min_stake * mean_stake
+
+    recorded = epochs // record_every + 1
+    epoch_index = np.arange(recorded) * record_every
+    stake_gini = np.empty(recorded)
+    nakamoto = np.empty(recorded, dtype=np.int64)
+    geographic = np.empty(recorded)
+    region_share = np.empty((recorded, len(REGIONS)))
+    start, slashed, replaced = 0, 0, 0
+
+    checkpoint = Path(checkpoint) if checkpoint is not None else None
+    if checkpoint is not None and checkpoint.exists():
+        with np.load(checkpoint) as saved:
+            if str(saved['fingerprint']) != fingerprint:
+                raise ValueError(f"checkpoint {checkpoint} was written by a different run")
+            start = int(saved['epoch'])
+            if start > epochs:
+                raise ValueError(f"checkpoint {checkpoint} is already at epoch {start}, past {epochs}")
+            stake, region = saved['stake'], saved['region']
+            rng.bit_generator.state = json.loads(str(saved['rng_state']))
+            slashed, replaced = int(saved['slashed']), int(saved['replaced'])
+            done = start // record_every + 1
+            stake_gini[:done] = saved['stake_gini'][:done]
+            nakamoto[:done] = saved['nakamoto'][:done]
+            geographic[:done] = saved['geographic_gini'][:done]
+            region_share[:done] = saved['region_share'][:done]
+    else:
+        stake_gini[0], nakamoto[0], region_share[0], geographic[0] = concentration(stake, region)
+
+    last_saved = start
+
+    def save(epoch):
+        done = epoch // record_every + 1
+        _save(checkpoint, fingerprint=fingerprint, epoch=epoch, stake=stake, region=region,
+              rng_state=json.dumps(rng.bit_generator.state), slashed=slashed, replaced=replaced,
+              stake_gini=stake_gini[:done], nakamoto=nakamoto[:done], geographic_gini=geographic[:done],
+              region_share=region_share[:done])
+
+    for epoch in range(start + 1, epochs + 1):
+        stake *= 1.0 + rules.attestation_rate
+
+        weight = np.cumsum(stake * advantage[region])
+        winners = np.searchsorted(weight, rng.random(rules.blocks_per_epoch) * weight[-1], side='right')
+        np.add.at(stake, np.minimum(winners, n - 1), block_reward)
+
+        hit = rng.integers(0, n, size=rng.binomial(n, rules.slash_probability))
+        stake[hit] *= 1.0 - rules.slash_fraction
+        slashed += len(hit)
+
+        leaving = rng.integers(0, n, size=rng.binomial(n, rules.churn_rate))
+        leaving = np.union1d(leaving, np.flatnonzero(stake < min_stake))
+        if len(leaving):
+            stake[leaving] = draw_stakes(len(leaving), rules.stake_distribution, rng)
+            region[leaving] = rng.choice(len(REGIONS), size=len(leaving), p=REGION_SHARE)
+            replaced += len(leaving)
+
+        if epoch % record_every == 0:
+            i = epoch // record_every
+            stake_gini[i], nakamoto[i], region_share[i], geographic[i] = concentration(stake, region)
+            if checkpoint is not None and (epoch - last_saved >= checkpoint_every or epoch == epochs):
+                save(epoch)
+                last_saved = epoch
+
+    return DynamicsResult(epoch_index, stake_gini, nakamoto, geographic, region_share, stake, region,
+                          slashed, replaced)
@@ -0,0 +1,239 @@
+"""Parameter sweeps over the dashboard's simulations, without Streamlit.
+
+A sweep is the Cartesian product of parameter lists for one simulation kind.
+Every grid point runs in a process pool and yields one row: its parameters,
+the ``code_version`` of the simulation package that produced it, and its
+results, with vector results as Arrow list columns. Rows are merged into
+``<results dir>/<kind>.parquet``. A later sweep over the same points
+replaces their rows.
+
+The dashboard computes its own points through ``run_point`` and looks them
+up in these tables first, so precomputed nightly sweeps are served directly.
+Rows written by other code, or missing any result, are not served.
+"""
+
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import cache, election, metrics, network, sortition, stake_dynamics
+
+RESULTS_DIR = Path(os.environ.get('SIMULATION_RESULTS', 'results'))
+
+PERCENTILES = (50, 90, 99)
+MEASURES = ('see', 'respond', 'respond_vdf')
+HISTOGRAM_BINS = 100
+# Election slots behind the regional advantage fed to stake dynamics
+ADVANTAGE_SLOTS = 50_000
+# Stake dynamics trajectories keep at most this many points
+TRAJECTORY_POINTS = 1_000
+
+
+def election_point(validators, slots, stake_distribution, vdf_time, seed):
+    """Leader-election Monte Carlo behind the "Fairness Problem" page."""
+    region, stake, latency_ms = election.make_validators(validators, stake_distribution=stake_distribution, seed=seed)
+    result = election.simulate(region, stake, latency_ms, slots, vdf_delay_ms=vdf_time * 1000.0, seed=seed)
+    share, share_vdf = election.region_win_shares(result)
+    centres, curve, curve_vdf = election.win_probability_curve(result)
+    region_stake = np.bincount(region, weights=stake, minlength=len(election.REGIONS))
+    return {
+        'region_share': share.tolist(),
+        'region_share_vdf': share_vdf.tolist(),
+        'curve_latency_ms': centres.tolist(),
+        'curve': curve.tolist(),
+        'curve_vdf': curve_vdf.tolist(),
+        'empty_slots': result.empty_slots,
+        'empty_slots_vdf': result.empty_slots_vdf,
+        'geographic_gini': metrics.geographic_gini(share, region_stake),
+        'geographic_gini_vdf': metrics.geographic_gini(share_vdf, region_stake),
+        'nakamoto': metrics.nakamoto(result.wins),
+        'nakamoto_vdf': metrics.nakamoto(result.wins_vdf),
+        'kl_divergence': metrics.kl_divergence(result.wins, stake),
+        'kl_divergence_vdf': metrics.kl_divergence(result.wins_vdf, stake),
+    }
+
+
+def network_point(nodes, blocks, fast_latency, slow_latency, vdf_time, seed, workers=1):
+    """Gossip propagation behind the "VDF Simulation" page.
+
+    Results are ``<class>_<measure>_p<q>`` percentile columns, plus the
+    time-to-see histogram binned here so rows stay small.
+    """
+    graph = network.make_gossip_graph(nodes, fast_latency_ms=fast_latency, slow_latency_ms=slow_latency, seed=seed)
+    result = network.propagate(graph, blocks, workers=workers, seed=seed)
+    summary = network.summarize(result, vdf_delay_ms=vdf_time * 1000.0, percentiles=PERCENTILES)
+    row = {f"{node_class}_{measure}_p{q}": float(value)
+           for node_class, stats in summary.items()
+           for measure in MEASURES
+           for q, value in zip(PERCENTILES, stats[measure])}
+    edges, counts = network.see_histogram(result, bins=HISTOGRAM_BINS)
+    row['see_hist_edges_ms'] = edges.tolist()
+    for node_class, hist in counts.items():
+        row[f"{node_class}_see_hist"] = hist.tolist()
+    return row
+
+
+def sortition_point(validators, rounds, stake_distribution, wait_time, seed):
+    """Algorand proposer sortition over the leader-election validators."""
+    region, stake, latency_ms = election.make_validators(validators, stake_distribution=stake_distribution, seed=seed)
+    result = sortition.simulate(region, stake, latency_ms, rounds, wait_ms=wait_time * 1000.0, seed=seed)
+    share = np.bincount(region, weights=result.wins, minlength=len(election.REGIONS)) / max(result.wins.sum(), 1)
+    region_stake = np.bincount(region, weights=stake, minlength=len(election.REGIONS))
+    return {
+        'region_share': share.tolist(),
+        'empty_rounds': result.empty_rounds,
+        'proposers_mean': float(result.proposers.mean()),
+        'geographic_gini': metrics.geographic_gini(share, region_stake),
+        'nakamoto': metrics.nakamoto(result.wins),
+        'kl_divergence': metrics.kl_divergence(result.wins, stake),
+    }
+
+
+def stake_dynamics_point(validators, epochs, stake_distribution, vdf_time, seed):
+    """Epoch stake dynamics with each protocol's regional advantage compounding."""
+    region, stake, latency_ms = election.make_validators(validators, stake_distribution=stake_distribution, seed=seed)
+    result = election.simulate(region, stake, latency_ms, ADVANTAGE_SLOTS, vdf_delay_ms=vdf_time * 1000.0, seed=seed)
+    region_stake = np.bincount(region, weights=stake, minlength=len(election.REGIONS))
+    region_stake = region_stake / region_stake.sum()
+    rules = stake_dynamics.Rules(stake_distribution=stake_distribution)
+    record_every = max(1, epochs // TRAJECTORY_POINTS)
+    row = {}
+    for suffix, share in zip(('', '_vdf'), election.region_win_shares(result)):
+        advantage = np.where(region_stake > 0, share / 100 / np.maximum(region_stake, 1e-12), 1.0)
+        # Long runs resume from their checkpoint if a sweep is interrupted
+        key = cache.cache_key('stake_dynamics' + suffix, [validators, epochs, stake_distribution, vdf_time], seed)
+        checkpoint = stake_dynamics.checkpoint_path(key)
+        run = stake_dynamics.simulate(region, stake, epochs, rules, region_advantage=advantage,
+                                      record_every=record_every, checkpoint=checkpoint, seed=seed)
+        # Finished runs live on as result rows
+        checkpoint.unlink(missing_ok=True)
+        row['epoch'] = run.epochs.tolist()
+        row.update({
+            f'stake_gini{suffix}': run.stake_gini.tolist(),
+            f'nakamoto{suffix}': run.nakamoto.tolist(),
+            f'geographic_gini{suffix}': run.geographic_gini.tolist(),
+        })
+    return row
+
+
+# kind -> (point function, default parameters); the defaults are the page's
+SIMULATIONS = {
+    'election': (election_point, {
+        'validators': 10_000, 'slots': 200_000, 'stake_distribution': 'uniform', 'vdf_time': 5.0, 'seed': 0,
+    }),
+    'network': (network_point, {
+        'nodes': 2_000, 'blocks': 200, 'fast_latency': 50, 'slow_latency': 300, 'vdf_time': 5.0, 'seed': 0,
+    }),
+    # Algorand's proposal wait (lambda_priority) is 5 s
+    'sortition': (sortition_point, {
+        'validators': 10_000, 'rounds': 50_000, 'stake_distribution': 'uniform', 'wait_time': 5.0, 'seed': 0,
+    }),
+    'stake_dynamics': (stake_dynamics_point, {
+        'validators': 10_000, 'epochs': 10_000, 'stake_distribution': 'uniform', 'vdf_time': 5.0, 'seed': 0,
+    }),
+}
+
+
+def point_params(kind, **params):
+    """Complete ``params`` with the kind's defaults, in canonical order."""
+    if kind not in SIMULATIONS:
+        raise ValueError(f"unknown simulation {kind!r}, expected one of {sorted(SIMULATIONS)}")
+    defaults = SIMULATIONS[kind][1]
+    unknown = set(params) - set(defaults)
+    if unknown:
+        raise ValueError(f"unknown {kind} parameters: {sorted(unknown)}")
+    return {name: params.get(name, default) for name, default in defaults.items()}
+
+
+def grid(kind, **values):
+    """Every combination of the given parameter lists, other parameters at their defaults."""
+    params = point_params(kind, **{name: None for name in values})
+    names = list(params)
+    axes = [values[name] if name in values else [params[name]] for name in names]
+    return [dict(zip(names, combo)) for combo in itertools.product(*axes)]
+
+
+def run_point(kind, params):
+    """Parameters and results of one grid point as a flat row."""
+    fn = SIMULATIONS[kind][0]
+    return {**params, 'code_version': cache.code_version(), **fn(**params)}
+
+
+def run_sweep(kind, points, workers=None, log=None):
+    """Run every point across a process pool; returns the rows as a DataFrame."""
+    workers = workers or os.cpu_count() or 1
+    rows = []
+    start = time.perf_counter()
+    if workers == 1:
+        completed = (run_point(kind, p) for p in points)
+        for i, row in enumerate(completed, 1):
+            rows.append(row)
+            if log:
+                log(f"[{i}/{len(points)}] {kind} {row_params(kind, row)} ({time.perf_counter() - start:.1f} s)")
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_point, kind, p) for p in points]
+            for i, future in enumerate(as_completed(futures), 1):
+                rows.append(future.result())
+                if log:
+                    log(f"[{i}/{len(points)}] {kind} {row_params(kind, rows[-1])} "
+                        f"({time.perf_counter() - start:.1f} s)")
+    return pd.DataFrame(rows)
+
+
+def row_params(kind, row):
+    return {name: row[name] for name in SIMULATIONS[kind][1]}
+
+
+def results_path(kind, directory=None):
+    return Path(directory or RESULTS_DIR) / f"{kind}.parquet"
+
+
+def write_results(kind, frame, directory=None):
+    """Merge ``frame`` into the kind's Parquet table, replacing rows for the same points."""
+    path = results_path(kind, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    existing = load_results(kind, directory)
+    if existing is not None:
+        frame = pd.concat([existing, frame], ignore_index=True)
+    frame = frame.drop_duplicates(subset=list(SIMULATIONS[kind][1]), keep='last')
+    # Readers never see a half-written table
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    frame.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+    return path
+
+
+def load_results(kind, directory=None):
+    """The kind's precomputed table, or ``None`` if no sweep has been written."""
+    path = results_path(kind, directory)
+    if not path.exists():
+        return None
+    return pd.read_parquet(path)
+
+
+def lookup(frame, params, version=None):
+    """Row of ``frame`` matching ``params`` exactly, as a dict, or ``None``.
+
+    Only rows written by ``version`` of the code (by default the running
+    one) with every column filled in match, so stale tables are recomputed.
+    """
+    if frame is None or frame.empty or 'code_version' not in frame:
+        return None
+    match = frame['code_version'] == (version or cache.code_version())
+    for name, value in params.items():
+        if name not in frame:
+            return None
+        match &= frame[name] == value
+    if not match.any():
+        return None
+    row = frame[match].iloc[-1]
+    # Columns added by a newer schema are null in rows merged from an older table
+    if row.isna().any():
+        return None
+    return row.to_dict()
@@ -0,0 +1,259 @@
+"""End-to-end VDF + BFT rounds among asyncio validator nodes in one process.
+
+Every node is a set of callbacks on one event loop. A message to another node
+is delivered after that pair's one-way delay: the ``geo`` city-model latency
+times log-normal jitter. So the injected latency is real wall-clock time.
+Pending messages sit in one heap of ``(delivery time, sequence, node,
+message)`` tuples, drained by a single loop timer. That compares plain
+tuples in C, where a ``call_later`` per message would spend most of its
+time ordering asyncio timer handles. Each slot runs as follows:
+
+1. A node enters the slot when it commits the previous one, and starts the
+   slot's VDF on a seed derived from the previous output.
+2. When the VDF finishes, every node knows the slot's leader. The leader
+   broadcasts its proposal.
+3. A node prevotes once its VDF is done and it holds a proposal carrying
+   the same output. It precommits on 2f+1 prevotes, and commits on 2f+1
+   precommits.
+
+The VDF is real repeated squaring (``vdf.evaluate``), calibrated to
+``vdf_seconds`` on this host, always off the event loop's GIL in worker
+processes. By default nodes model identical hardware: the first node to
+reach a slot evaluates it, and every node then waits until its own start
+time plus the measured evaluation time. A host with fewer cores than nodes
+can still run hundreds of them that way. With ``each_node``, every node
+evaluates its own VDF from its own previous output, and a node only
+prevotes for a proposal that matches its output. That is bounded to
+``EACH_NODE_MAX`` nodes: evaluations beyond the host's cores queue, so slot
+times then include waiting for a core.
+
+A monitor coroutine samples event-loop lag, the overshoot of a short sleep.
+Lag that stays well below the injected latencies means the host kept up,
+so the measured slot times reflect the network and not the CPU.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from . import geo, vdf
+
+PROPOSAL, PREVOTE, PRECOMMIT = 0, 1, 2
+MONITOR_INTERVAL_S = 0.05
+EACH_NODE_MAX = 50
+
+
+@dataclass
+class TestbedResult:
+    region: np.ndarray
+    commit_s: np.ndarray
+    vdf_s: np.ndarray
+    messages: int
+    duration_s: float
+    loop_lag_ms: np.ndarray
+
+    @property
+    def slot_s(self):
+        """Median wall-clock time per slot across nodes."""
+        starts = np.concatenate((np.zeros((len(self.commit_s), 1)), self.commit_s[:, :-1]), axis=1)
+        return np.median(self.commit_s - starts, axis=0)
+
+    @property
+    def messages_per_second(self):
+        return self.messages / self.duration_s if self.duration_s else 0.0
+
+    def region_lag_ms(self, regions=len(geo.REGIONS)):
+        """Mean delay (ms) of each region's commits behind each slot's first commit."""
+        lag = (self.commit_s - self.commit_s.min(axis=0)) * 1000
+        per_node = lag.mean(axis=1)
+        counts = np.bincount(self.region, minlength=regions)
+        return np.bincount(self.region, weights=per_node, minlength=regions) / np.maximum(counts, 1)
+
+
+@dataclass
+class _Slot:
+    proposal: bytes = None
+    prevotes: int = 0
+    precommits: int = 0
+
+
+@dataclass
+class _Node:
+    id: int
+    slot: int = 0
+    output: bytes = None
+    vdf_done: bool = False
+    prevoted: bool = False
+    precommitted: bool = False
+    slots: dict = field(default_factory=dict)
+
+
+class Testbed:
+    """``n`` validator nodes on the running event loop."""
+
+    def __init__(self, n, slots, vdf_iterations, jitter=0.25, each_node=False, seed=0):
+        if n < 4 or slots < 1:
+            raise ValueError("need at least 4 nodes and 1 slot")
+        if each_node and n > EACH_NODE_MAX:
+            raise ValueError(f"each_node evaluation is limited to {EACH_NODE_MAX} nodes, got {n}")
+        self.n = n
+        self.each_node = each_node
+        self.target = slots
+        self.iterations = vdf_iterations
+        self.jitter = jitter
+        self.quorum = 2 * n // 3 + 1
+        self.rng = np.random.default_rng(seed)
+        placement = geo.place_validators(n, seed=seed)
+        self.region = placement.region
+        index = np.arange(n)
+        self.delay_s = placement.latency_ms(index[:, None], index[None, :]) / 1000.0
+        self.nodes = [_Node(i) for i in range(n)]
+        self.commit_s = np.full((n, slots), np.nan)
+        self.vdf_s = np.zeros(slots)
+        self.messages = 0
+        self.committed = 0
+        self._pending = []
+        self._sequence = itertools.count()
+        self._pump = None
+        self._pump_at = 0.0
+        self._outputs = {}
+        self._seed = hashlib.blake2s(seed.to_bytes(8, 'big'), person=b"tb-seed").digest()
+
+    # Network
+
+    def broadcast(self, sender, message):
+        arrival = self.loop.time() + self.delay_s[sender] * self.rng.lognormal(0.0, self.jitter, size=self.n)
+        pending, sequence, push = self._pending, self._sequence, heapq.heappush
+        for node, at in enumerate(arrival.tolist()):
+            push(pending, (at, next(sequence), node, message))
+        self.messages += self.n
+        self._schedule()
+
+    def _schedule(self):
+        if not self._pending:
+            return
+        head = self._pending[0][0]
+        if self._pump is None or head < self._pump_at:
+            if self._pump is not None:
+                self._pump.cancel()
+            self._pump_at = head
+            self._pump = self.loop.call_at(head, self._deliver)
+
+    def _deliver(self):
+        self._pump = None
+        now = self.loop.time()
+        pending, nodes = self._pending, self.nodes
+        while pending and pending[0][0] <= now:
+            _, _, node, message = heapq.heappop(pending)
+            self.receive(nodes[node], message)
+        self._schedule()
+
+    def receive(self, node, message):
+        kind, slot, value = message
+        if slot < node.slot:
+            return
+        state = node.slots.setdefault(slot, _Slot())
+        if kind == PROPOSAL:
+            state.proposal = value
+        elif kind == PREVOTE:
+            state.prevotes += 1
+        else:
+            state.precommits += 1
+        if slot == node.slot:
+            self.advance(node)
+
+    # Protocol
+
+    def leader(self, output):
+        return int.from_bytes(hashlib.blake2s(output, person=b"tb-lead").digest()[:8], 'big') % self.n
+
+    def vdf_output(self, slot):
+        """Future of ``(output bytes, seconds)`` for ``slot``, evaluated once in the worker process."""
+        if slot not in self._outputs:
+            seed = self._seed if slot == 0 else self._outputs[slot - 1].result()[0]
+            self._outputs[slot] = self.loop.run_in_executor(self.pool, _evaluate, seed, self.iterations)
+        return self._outputs[slot]
+
+    async def start_slot(self, node):
+        slot = node.slot
+        started = self.loop.time()
+        if self.each_node:
+            seed = self._seed if node.output is None else node.output
+            output, seconds = await self.loop.run_in_executor(self.pool, _evaluate, seed, self.iterations)
+        else:
+            output, seconds = await self.vdf_output(slot)
+            # This node finishes its own evaluation `seconds` after it started
+            await asyncio.sleep(max(0.0, started + seconds - self.loop.time()))
+        self.vdf_s[slot] = max(self.vdf_s[slot], seconds)
+        if node.slot != slot:
+            return
+        node.output = output
+        node.vdf_done = True
+        if self.leader(output) == node.id:
+            self.broadcast(node.id, (PROPOSAL, slot, output))
+        self.advance(node)
+
+    def advance(self, node):
+        state = node.slots.get(node.slot)
+        if state is None or not node.vdf_done:
+            return
+        if state.proposal == node.output and not node.prevoted:
+            node.prevoted = True
+            self.broadcast(node.id, (PREVOTE, node.slot, state.proposal))
+        if state.prevotes >= self.quorum and not node.precommitted:
+            node.precommitted = True
+            self.broadcast(node.id, (PRECOMMIT, node.slot, state.proposal))
+        if state.precommits >= self.quorum:
+            self.commit(node)
+
+    def commit(self, node):
+        self.commit_s[node.id, node.slot] = self.loop.time() - self.started
+        self.committed += 1
+        del node.slots[node.slot]
+        node.slot += 1
+        node.vdf_done = node.prevoted = node.precommitted = False
+        if node.slot < self.target:
+            self.loop.create_task(self.start_slot(node))
+
+    async def run(self, pool, progress=None):
+        """Run every node to ``slots`` commits, evaluating VDFs on ``pool``; returns a ``TestbedResult``."""
+        self.loop = asyncio.get_running_loop()
+        self.pool = pool
+        self.started = self.loop.time()
+        wall = time.perf_counter()
+        tasks = [self.loop.create_task(self.start_slot(node)) for node in self.nodes]
+        total = self.n * self.target
+        lag = []
+        # Sample loop lag and report progress until every node has committed every slot
+        while self.committed < total:
+            before = self.loop.time()
+            await asyncio.sleep(MONITOR_INTERVAL_S)
+            lag.append((self.loop.time() - before - MONITOR_INTERVAL_S) * 1000)
+            if progress is not None:
+                progress(self.committed / total)
+        await asyncio.gather(*tasks)
+        return TestbedResult(self.region, self.commit_s, self.vdf_s, self.messages,
+                             time.perf_counter() - wall, np.array(lag))
+
+
+def _evaluate(seed, iterations):
+    start = time.perf_counter()
+    y = vdf.evaluate(vdf.hash_to_group(seed), iterations)
+    output = hashlib.blake2s(y.to_bytes(256, 'big'), person=b"tb-vdf").digest()
+    return output, time.perf_counter() - start
+
+
+def run(nodes=100, slots=5, vdf_seconds=1.0, jitter=0.25, each_node=False, seed=0, progress=None):
+    """Run a testbed to completion with a VDF calibrated to ``vdf_seconds`` on this host."""
+    iterations = vdf.iterations_for(vdf_seconds, vdf.calibrate()) if vdf_seconds > 0 else 0
+    testbed = Testbed(nodes, slots, iterations, jitter=jitter, each_node=each_node, seed=seed)
+    workers = min(nodes, os.cpu_count() or 1) if each_node else 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return asyncio.run(testbed.run(pool, progress))
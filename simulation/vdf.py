@@ -0,0 +1,220 @@
+"""Verifiable Delay Function: repeated squaring in an RSA group.
+
+Evaluation computes ``y = x^(2^T) mod N`` with T sequential squarings. Two
+proof schemes let a verifier check ``y`` in about log T group operations
+instead of redoing the squarings:
+
+* Wesolowski: one group element, checked with ``pi^l * x^(2^T mod l) == y``
+  for a 128-bit Fiat-Shamir prime ``l``.
+* Pietrzak: one group element per halving round, log2(T) rounds.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass, field
+
+# RSA Factoring Challenge modulus RSA-2048; its factorisation is unknown, so
+# the group order is hidden from every party.
+RSA_2048 = int(
+    "25195908475657893494027183240048398571429282126204032027777137836043662020707595556264018525880784406"
+    "91829064124951508218929855914917618450280848912007284499268739280728777673597141834727026189637501497"
+    "18246911650776133798590957000973304597488084284017974291006424586918171951187461215151726546322822168"
+    "69987549182422433637259085141865462043576798423387184774447920739934236584823824281198163815010674810"
+    "45166037730605620161967625613384414360383390441495263443219011465754445417842402092461651572335077870"
+    "77498171257724679629263863563732899121548314381678998850404453640235273819513786365643912120103971228"
+    "22120720357"
+)
+
+SCHEMES = ("wesolowski", "pietrzak")
+
+# Squarings per pow() call while evaluating; small enough to report progress
+# several times a second, large enough that call overhead is negligible.
+_CHUNK = 4096
+
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71)
+
+
+def _to_bytes(value):
+    if isinstance(value, bytes):
+        return value
+    value = int(value)
+    return value.to_bytes(max(1, (value.bit_length() + 7) // 8), "big")
+
+
+def _hash_to_int(*parts, bits=256):
+    h = hashlib.sha256()
+    for part in parts:
+        data = _to_bytes(part)
+        h.update(len(data).to_bytes(4, "big"))
+        h.update(data)
+    digest = h.digest()
+    while len(digest) * 8 < bits:
+        digest += hashlib.sha256(digest).digest()
+    return int.from_bytes(digest, "big") >> (len(digest) * 8 - bits)
+
+
+def _is_probable_prime(n):
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _SMALL_PRIMES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def hash_to_prime(*parts, bits=128):
+    """Deterministic Fiat-Shamir prime of ``bits`` bits derived from ``parts``."""
+    candidate = _hash_to_int(b"prime", *parts, bits=bits) | (1 << (bits - 1)) | 1
+    while not _is_probable_prime(candidate):
+        candidate += 2
+    return candidate
+
+
+def hash_to_group(seed, modulus=RSA_2048):
+    """Map a seed onto a group element in ``[2, N - 2]``."""
+    bits = modulus.bit_length() + 128
+    return 2 + _hash_to_int(b"group", seed, bits=bits) % (modulus - 3)
+
+
+def evaluate(x, T, modulus=RSA_2048, progress=None):
+    """Compute ``x^(2^T) mod N`` by T sequential squarings.
+
+    ``progress`` is called with the completed fraction after every chunk;
+    it may raise to abort a long evaluation.
+    """
+    y = x % modulus
+    done = 0
+    while done < T:
+        step = min(_CHUNK, T - done)
+        y = pow(y, 1 << step, modulus)
+        done += step
+        if progress is not None:
+            progress(done / T)
+    return y
+
+
+def prove_wesolowski(x, y, T, modulus=RSA_2048):
+    """Wesolowski proof ``pi = x^floor(2^T / l)``."""
+    l = hash_to_prime(x, y, T)
+    return pow(x, (1 << T) // l, modulus)
+
+
+def verify_wesolowski(x, y, T, proof, modulus=RSA_2048):
+    """Check a Wesolowski proof with two short exponentiations."""
+    if not 0 < proof < modulus:
+        return False
+    l = hash_to_prime(x, y, T)
+    r = pow(2, T, l)
+    return pow(proof, l, modulus) * pow(x, r, modulus) % modulus == y % modulus
+
+
+def prove_pietrzak(x, y, T, modulus=RSA_2048):
+    """Pietrzak proof: the list of midpoints ``mu`` of each halving round."""
+    proof = []
+    while T > 1:
+        if T % 2:
+            # x^(2^(T+1)) = y^2 keeps the claim valid with an even exponent.
+            y = y * y % modulus
+            T += 1
+        half = T // 2
+        mu = pow(x, 1 << half, modulus)
+        r = _hash_to_int(x, y, mu, T, bits=128)
+        x = pow(x, r, modulus) * mu % modulus
+        y = pow(mu, r, modulus) * y % modulus
+        T = half
+        proof.append(mu)
+    return proof
+
+
+def verify_pietrzak(x, y, T, proof, modulus=RSA_2048):
+    """Replay the halving rounds of a Pietrzak proof and check ``y == x^2``."""
+    rounds = iter(proof)
+    while T > 1:
+        mu = next(rounds, None)
+        if mu is None or not 0 < mu < modulus:
+            return False
+        if T % 2:
+            y = y * y % modulus
+            T += 1
+        r = _hash_to_int(x, y, mu, T, bits=128)
+        x = pow(x, r, modulus) * mu % modulus
+        y = pow(mu, r, modulus) * y % modulus
+        T //= 2
+    if next(rounds, None) is not None:
+        return False
+    return pow(x, 1 << T, modulus) == y % modulus
+
+
+def calibrate(modulus=RSA_2048, duration=0.25):
+    """Measure sequential squarings per second on this host."""
+    x = hash_to_group(b"calibrate", modulus)
+    T = _CHUNK
+    while True:
+        start = time.perf_counter()
+        evaluate(x, T, modulus)
+        elapsed = time.perf_counter() - start
+        if elapsed >= duration:
+            return T / elapsed
+        T *= 2
+
+
+def iterations_for(seconds, rate):
+    """Number of squarings that take ``seconds`` at ``rate`` squarings/s."""
+    return max(1, int(seconds * rate))
+
+
+@dataclass
+class VDFRun:
+    scheme: str
+    T: int
+    x: int
+    y: int
+    proof: object = field(repr=False)
+    eval_seconds: float
+    prove_seconds: float
+    verify_seconds: float
+    valid: bool
+
+    @property
+    def speedup(self):
+        """How many times faster verification is than evaluation."""
+        return self.eval_seconds / max(self.verify_seconds, 1e-9)
+
+
+def run(seed, T, scheme="wesolowski", modulus=RSA_2048, progress=None):
+    """Evaluate, prove and verify a VDF on ``seed``, timing each phase."""
+    if scheme not in SCHEMES:
+        raise ValueError(f"unknown VDF proof scheme {scheme!r}, expected one of {SCHEMES}")
+    prove, verify = {
+        "wesolowski": (prove_wesolowski, verify_wesolowski),
+        "pietrzak": (prove_pietrzak, verify_pietrzak),
+    }[scheme]
+
+    x = hash_to_group(seed, modulus)
+    start = time.perf_counter()
+    y = evaluate(x, T, modulus, progress)
+    eval_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    proof = prove(x, y, T, modulus)
+    prove_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    valid = verify(x, y, T, proof, modulus)
+    verify_seconds = time.perf_counter() - start
+
+    return VDFRun(scheme, T, x, y, proof, eval_seconds, prove_seconds, verify_seconds, valid)
@@ -0,0 +1,251 @@
+"""Append-only on-disk log of Fairness Witnesses, indexed by block number.
+
+A store directory holds three files:
+
+* ``records.bin``: fixed-width ``RECORD_DTYPE`` records in append order.
+  Each record is a witness plus its beacon VDF output and the location of
+  its proof.
+* ``proofs.bin``: variable-length proof blobs, addressed by each record's
+  ``proof_offset`` and ``proof_length``.
+* ``index/<segment>.bin``: the block index, split into segments of
+  ``SEGMENT_BLOCKS`` consecutive block numbers. Each holds an int64 per
+  block, the record's slot plus one, where 0 means the block is absent. A
+  segment exists only once one of its blocks is stored, and is written
+  sparse, so the index grows with the blocks stored rather than with the
+  highest block number.
+
+Records and index segments are memory-mapped. A lookup is one index read
+and one record read, whatever the chain length, and nothing is loaded up
+front. Range scans over blocks that were appended in order return
+views of the mapped records, without copying.
+
+Appends take a directory-wide ``flock``. Records are written before the
+index, so a crash leaves at worst a torn record tail or unindexed records.
+The next writer truncates and re-indexes them.
+"""
+
+import fcntl
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+from numpy.lib import recfunctions
+
+from .witness import WITNESS_DTYPE
+
+STORE_DIR = Path(os.environ.get('SIMULATION_WITNESSES', '.witness-store'))
+SEGMENT_BLOCKS = 1 << 16
+
+RECORD_DTYPE = np.dtype(WITNESS_DTYPE.descr + [
+    ('vdf_output', 'u1', 32),
+    ('proof_offset', '<u8'),
+    ('proof_length', '<u4'),
+])
+
+
+class BlocksStoredError(ValueError):
+    """Raised by ``WitnessStore.append`` when some of the blocks are already stored."""
+
+
+def as_witnesses(records):
+    """Copy of ``records`` as plain ``WITNESS_DTYPE`` witnesses, e.g. for ``verify_witnesses``."""
+    return recfunctions.repack_fields(records[list(WITNESS_DTYPE.names)]).astype(WITNESS_DTYPE)
+
+
+@contextmanager
+def _locked(path):
+    with open(path, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _map(path, dtype, count, mode='r'):
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode, shape=(count,))
+
+
+class WitnessStore:
+    """Witness log in ``directory``; safe to share between processes."""
+
+    def __init__(self, directory=STORE_DIR):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.records_path = self.directory / 'records.bin'
+        self.proofs_path = self.directory / 'proofs.bin'
+        self.index_dir = self.directory / 'index'
+        self.index_dir.mkdir(exist_ok=True)
+        for path in (self.records_path, self.proofs_path):
+            path.touch(exist_ok=True)
+        self._records = None
+        # Segments are never resized, so their maps stay valid once made
+        self._segments = {}
+        self._remap()
+
+    def _remap(self):
+        count = self.records_path.stat().st_size // RECORD_DTYPE.itemsize
+        self._records = _map(self.records_path, RECORD_DTYPE, count)
+
+    def _segment_path(self, number):
+        return self.index_dir / f"{number:012d}.bin"
+
+    def _segment(self, number):
+        """Index map of segment ``number``, or ``None`` while none of its blocks is stored."""
+        segment = self._segments.get(number)
+        if segment is None:
+            path = self._segment_path(number)
+            if not path.exists():
+                return None
+            segment = self._segments[number] = _map(path, np.int64, SEGMENT_BLOCKS)
+        return segment
+
+    def __len__(self):
+        self._refresh()
+        return len(self._records)
+
+    def _refresh(self):
+        # Another process may have appended since the maps were made
+        if self.records_path.stat().st_size // RECORD_DTYPE.itemsize != len(self._records):
+            self._remap()
+
+    def _indexed(self, blocks):
+        slots = np.full(blocks.shape, -1, dtype=np.int64)
+        numbers = np.where(blocks >= 0, blocks // SEGMENT_BLOCKS, -1)
+        for number in np.unique(numbers[numbers >= 0]).tolist():
+            segment = self._segment(number)
+            if segment is not None:
+                within = numbers == number
+                slots[within] = segment[blocks[within] % SEGMENT_BLOCKS] - 1
+        return slots
+
+    def _slots(self, blocks):
+        blocks = np.asarray(blocks, dtype=np.int64)
+        while True:
+            slots = self._indexed(blocks)
+            # Slots past the record map were indexed after it was made
+            if not (slots >= len(self._records)).any():
+                return slots
+            self._remap()
+
+    def _slot(self, block):
+        segment = self._segment(block // SEGMENT_BLOCKS) if block >= 0 else None
+        if segment is None:
+            return -1
+        while True:
+            slot = int(segment[block % SEGMENT_BLOCKS]) - 1
+            if slot < len(self._records):
+                return slot
+            self._remap()
+
+    def get(self, block):
+        """The record of ``block`` as a read-only ``np.void``, or ``None``."""
+        slot = self._slot(block)
+        if slot < 0:
+            self._refresh()
+            slot = self._slot(block)
+        return self._records[slot] if slot >= 0 else None
+
+    def missing(self, blocks):
+        """The entries of ``blocks`` that have no record."""
+        self._refresh()
+        blocks = np.asarray(blocks, dtype=np.int64)
+        return blocks[self._slots(blocks) < 0]
+
+    def range(self, start, stop):
+        """Records of blocks ``start <= block < stop`` that are present, in block order.
+
+        A zero-copy view of the record map when those blocks were appended
+        consecutively, which is the case for a chain written in order.
+        """
+        self._refresh()
+        slots = self._slots(np.arange(start, stop))
+        slots = slots[slots >= 0]
+        if not len(slots):
+            return self._records[:0]
+        if slots[-1] - slots[0] == len(slots) - 1 and (np.diff(slots) == 1).all():
+            return self._records[slots[0]:slots[-1] + 1]
+        return self._records[slots]
+
+    def proof(self, record):
+        """Proof blob of ``record``."""
+        length = int(record['proof_length'])
+        if not length:
+            return b''
+        with open(self.proofs_path, 'rb') as f:
+            f.seek(int(record['proof_offset']))
+            return f.read(length)
+
+    def append(self, witnesses, vdf_outputs=None, proofs=None):
+        """Append witness records, with optional ``(n, 32)`` VDF outputs and proof blobs.
+
+        Raises ``BlocksStoredError`` if any block is already stored, and
+        ``ValueError`` if a block appears twice in ``witnesses``.
+        """
+        witnesses = np.asarray(witnesses, dtype=WITNESS_DTYPE).ravel()
+        records = np.zeros(len(witnesses), dtype=RECORD_DTYPE)
+        for name in WITNESS_DTYPE.names:
+            records[name] = witnesses[name]
+        if vdf_outputs is not None:
+            records['vdf_output'] = vdf_outputs
+        blocks = records['block'].astype(np.int64)
+        if len(np.unique(blocks)) != len(blocks):
+            raise ValueError("duplicate blocks in one append")
+
+        with _locked(self.directory / 'lock'):
+            self._recover()
+            absent = self.missing(blocks)
+            if len(absent) != len(blocks):
+                taken = np.setdiff1d(blocks, absent)
+                raise BlocksStoredError(f"blocks already stored: {taken[:10].tolist()}")
+
+            if proofs is not None:
+                lengths = np.array([len(blob) for blob in proofs], dtype=np.uint64)
+                with open(self.proofs_path, 'ab') as f:
+                    records['proof_offset'] = f.tell() + np.cumsum(lengths) - lengths
+                    records['proof_length'] = lengths
+                    f.write(b''.join(proofs))
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            with open(self.records_path, 'ab') as f:
+                first = f.tell() // RECORD_DTYPE.itemsize
+                f.write(records.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            self._index_records(blocks, first + np.arange(len(blocks)))
+        self._remap()
+
+    def _index_records(self, blocks, slots):
+        numbers = blocks // SEGMENT_BLOCKS
+        for number in np.unique(numbers).tolist():
+            path = self._segment_path(number)
+            if not path.exists():
+                # Sized beside the target and renamed over it, so readers never map a short file;
+                # the segment stays a hole until written
+                tmp = path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp, 'wb') as f:
+                    f.truncate(SEGMENT_BLOCKS * 8)
+                os.replace(tmp, path)
+            within = numbers == number
+            index = _map(path, np.int64, SEGMENT_BLOCKS, mode='r+')
+            index[blocks[within] % SEGMENT_BLOCKS] = slots[within] + 1
+            index.flush()
+
+    def _recover(self):
+        """Drop a torn record tail and index records a crash left unindexed."""
+        size = self.records_path.stat().st_size
+        if size % RECORD_DTYPE.itemsize:
+            with open(self.records_path, 'r+b') as f:
+                f.truncate(size - size % RECORD_DTYPE.itemsize)
+        self._remap()
+        if not len(self._records):
+            return
+        if self._slot(int(self._records[-1]['block'])) == len(self._records) - 1:
+            return
+        blocks = self._records['block'].astype(np.int64)
+        self._index_records(blocks, np.arange(len(blocks)))
+        self._remap()
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from simulation.alias import AliasSampler, build_alias_table
+
+
+def table_distribution(prob, alias):
+    mass = prob.copy()
+    np.add.at(mass, alias, 1.0 - prob)
+    return mass / len(prob)
+
+
+@pytest.mark.parametrize('weights', [[0.7] * 7, [0.1] * 3, [2.7366], [1.0, 2.0, 3.0, 4.0]])
+def test_alias_table_is_exact(weights):
+    prob, alias = build_alias_table(weights)
+    assert ((prob >= 0) & (prob <= 1)).all()
+    np.testing.assert_allclose(table_distribution(prob, alias), np.asarray(weights) / np.sum(weights), atol=1e-12)
+
+
+def test_sampler_builds_for_single_blocks():
+    rng = np.random.default_rng(1)
+    for _ in range(500):
+        stakes = rng.pareto(1.5, size=rng.integers(1, 300)) + 1.0
+        sampler = AliasSampler(stakes)
+        assert sampler.sample(100, rng).max() < len(stakes)
@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+
+from simulation import cache
+
+
+def test_round_trip(tmp_path):
+    results = cache.ResultCache(tmp_path)
+    stored = {'winners': np.arange(10), 'mean': np.float64(1.5), 'latency': [1.0, 2.0], 'label': "x"}
+    results.put('election', {'validators': 10}, stored, seed=3)
+
+    loaded = results.get('election', {'validators': 10}, seed=3)
+    assert list(loaded) == list(stored)
+    assert isinstance(loaded['winners'], np.memmap)
+    np.testing.assert_array_equal(loaded['winners'], stored['winners'])
+    np.testing.assert_array_equal(loaded['latency'], stored['latency'])
+    assert loaded['mean'] == 1.5 and loaded['label'] == "x"
+
+
+def test_key_covers_params_and_seed(tmp_path):
+    results = cache.ResultCache(tmp_path)
+    results.put('election', {'validators': 10}, {'x': 1})
+    assert results.get('election', {'validators': 11}) is None
+    assert results.get('election', {'validators': 10}, seed=1) is None
+    assert results.get('network', {'validators': 10}) is None
+
+
+def test_get_or_compute_computes_once(tmp_path):
+    results = cache.ResultCache(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'values': np.ones(4)}
+
+    for _ in range(3):
+        np.testing.assert_array_equal(results.get_or_compute('run', {}, compute)['values'], np.ones(4))
+    assert len(calls) == 1
+
+
+def test_eviction_keeps_recently_used(tmp_path):
+    results = cache.ResultCache(tmp_path, max_bytes=1 << 20)
+    for i in range(5):
+        results.put('run', {'i': i}, {'values': np.zeros(1000)})
+        # Entries older by a second each, the first one touched last
+        entry = results._entry(cache.cache_key('run', {'i': i}))
+        os.utime(entry, (1000 + i, 1000 + i))
+    results.get('run', {'i': 0})
+
+    results.max_bytes = 20_000
+    results.evict()
+    assert results.size() <= results.max_bytes
+    kept = [i for i in range(5) if results.get('run', {'i': i}) is not None]
+    assert kept == [0, 4]
+
+
+def test_entry_larger_than_cache_is_still_returned(tmp_path):
+    results = cache.ResultCache(tmp_path, max_bytes=100)
+    computed = results.get_or_compute('run', {}, lambda: {'values': np.arange(1000)})
+    np.testing.assert_array_equal(computed['values'], np.arange(1000))
+    assert results.size() <= 100
+
+
+def test_lock_files_are_striped(tmp_path):
+    results = cache.ResultCache(tmp_path, max_bytes=0)
+    for i in range(2 * cache.LOCK_STRIPES):
+        results.get_or_compute('run', {'i': i}, lambda: {'x': 1})
+    assert len(list((tmp_path / 'locks').iterdir())) <= cache.LOCK_STRIPES + 1
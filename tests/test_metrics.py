@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from simulation import metrics
+
+STAKE = np.random.default_rng(0).pareto(1.5, 50) + 1.0
+
+
+def winner_stream(size, seed=1):
+    rng = np.random.default_rng(seed)
+    winners = rng.choice(len(STAKE), size=size, p=STAKE / STAKE.sum())
+    # Some empty slots
+    winners[rng.random(size) < 0.05] = -1
+    return winners
+
+
+def assert_matches_batch(tracker, winners):
+    wins = np.bincount(winners[winners >= 0], minlength=len(STAKE))
+    assert tracker.gini() == pytest.approx(metrics.gini(wins), abs=1e-12)
+    assert tracker.kl_divergence() == pytest.approx(metrics.kl_divergence(wins, STAKE), abs=1e-9)
+    for fraction in (0.33, 0.5, 0.67):
+        assert tracker.nakamoto(fraction) == metrics.nakamoto(wins, fraction)
+    expected = wins.sum() * STAKE / STAKE.sum()
+    assert tracker.chi_square() == pytest.approx(((wins - expected) ** 2 / expected).sum(), rel=1e-9)
+
+
+def test_batch_metrics():
+    assert metrics.gini([1, 1, 1, 1]) == 0.0
+    assert metrics.gini([0, 0, 0, 4]) == pytest.approx(0.75)
+    assert metrics.nakamoto([5, 3, 2]) == 2
+    assert metrics.nakamoto([6, 3, 1]) == 1
+    assert metrics.nakamoto([4, 3, 3]) == 2
+    assert metrics.kl_divergence([1, 1], [1, 1]) == 0.0
+    assert metrics.kl_divergence([2, 0], [1, 1]) == pytest.approx(np.log(2))
+
+
+def test_tracker_matches_batch():
+    tracker = metrics.FairnessTracker(STAKE)
+    winners = winner_stream(3000)
+    for end in range(0, len(winners), 250):
+        tracker.add(winners[end:end + 250])
+        assert_matches_batch(tracker, winners[:end + 250])
+
+
+@pytest.mark.parametrize('batch', [1, 37, 500, 2500])
+def test_windowed_tracker_matches_last_window(batch):
+    window = 400
+    tracker = metrics.FairnessTracker(STAKE, window=window)
+    winners = winner_stream(5000)
+    for end in range(batch, len(winners) + 1, batch):
+        tracker.add(winners[end - batch:end])
+        if end % 1000 < batch:
+            assert_matches_batch(tracker, winners[max(0, end - window):end])
+
+
+def test_empty_tracker():
+    tracker = metrics.FairnessTracker(STAKE)
+    tracker.add([-1, -1])
+    assert tracker.gini() == tracker.kl_divergence() == tracker.chi_square() == 0.0
+    assert tracker.nakamoto() == 0
+
+
+def test_decrement_without_wins_is_rejected():
+    with pytest.raises(ValueError):
+        metrics.FairnessTracker(STAKE).decrement(0)
+
+
+def test_ring_buffer_evicts_oldest():
+    ring = metrics.RingBuffer(4, np.int64)
+    assert ring.extend([1, 2, 3]).tolist() == []
+    assert ring.extend([4, 5]).tolist() == [1]
+    assert ring.values().tolist() == [2, 3, 4, 5]
+    assert ring.extend([6, 7, 8, 9, 10, 11]).tolist() == [2, 3, 4, 5, 6, 7]
+    assert ring.values().tolist() == [8, 9, 10, 11]
+
+
+def test_fenwick_prefix_and_search():
+    values = [3, 0, 2, 5, 1]
+    tree = metrics.Fenwick(len(values))
+    for i, v in enumerate(values):
+        tree.add(i, v)
+    assert [tree.prefix(m) for m in range(6)] == [0, 3, 3, 5, 10, 11]
+    assert tree.lower_count(4) == 2
+    assert tree.lower_count(6) == 3
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from simulation import session_store
+
+MIB = 1 << 20
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return session_store.MemoryLedger(total_bytes=16 * MIB, session_bytes=4 * MIB, directory=tmp_path)
+
+
+def test_nbytes():
+    array = np.zeros(1000)
+    assert session_store.nbytes(array) == 8000
+    assert session_store.nbytes(array[::2]) == 8000
+    assert session_store.nbytes({'a': array}) > 8000
+    assert session_store.nbytes(pd.Series(np.zeros(1000))) >= 8000
+
+
+def test_generator_counts_its_locals():
+    def stream(buffer):
+        while True:
+            yield buffer.sum()
+
+    running = stream(np.zeros(1000))
+    next(running)
+    assert session_store.nbytes(running) >= 8000
+
+
+def test_large_arrays_spill_and_read_back(ledger):
+    store = ledger.store('a')
+    first = np.arange(3 * MIB // 8, dtype=np.float64)
+    store['first'] = first
+    store['second'] = np.ones(3 * MIB // 8)
+
+    assert store.usage <= store.budget
+    spilled = store['first']
+    assert isinstance(spilled, np.memmap)
+    np.testing.assert_array_equal(spilled, first)
+    assert store.spilled >= first.nbytes
+    assert not isinstance(store['second'], np.memmap)
+
+
+def test_small_values_are_dropped(ledger):
+    store = ledger.store('a')
+    store['small'] = list(range(1000))
+    store['big'] = np.ones(5 * MIB // 8)
+    assert 'small' not in store and store.get('small') is None
+    with pytest.raises(KeyError):
+        store['small']
+    # The value just stored stays resident even alone over budget
+    assert store.usage > store.budget and not isinstance(store['big'], np.memmap)
+
+
+def test_least_recently_used_is_evicted_first(ledger):
+    store = ledger.store('a')
+    store['a'] = np.zeros(MIB // 8)
+    store['b'] = np.zeros(MIB // 8)
+    store['c'] = np.zeros(MIB // 8)
+    store['a']
+    store['d'] = np.zeros(2 * MIB // 8)
+    assert [isinstance(store[key], np.memmap) for key in 'abcd'] == [False, True, False, False]
+
+
+def test_global_budget_spans_sessions(ledger):
+    stores = [ledger.store(f"s{i}") for i in range(6)]
+    for store in stores:
+        store['values'] = np.zeros(3 * MIB // 8)
+    assert ledger.sessions == 6
+    assert ledger.usage <= ledger.total_bytes
+    # The oldest sessions' values were spilled, and still read back
+    assert isinstance(stores[0]['values'], np.memmap)
+    assert not isinstance(stores[-1]['values'], np.memmap)
+    assert all(store['values'].sum() == 0 for store in stores)
+
+
+def test_pop_and_delete_remove_spill_files(ledger):
+    store = ledger.store('a')
+    store['first'] = np.zeros(3 * MIB // 8)
+    store['second'] = np.zeros(3 * MIB // 8)
+    assert store.spilled
+    assert store.pop('first').sum() == 0
+    assert store.pop('first', 'gone') == 'gone'
+    assert store.spilled == 0 and not list(store.directory.iterdir())
+    del store['second']
+    assert len(store) == 0
+    with pytest.raises(KeyError):
+        del store['second']
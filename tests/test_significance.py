@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+import pytest
+
+from simulation import significance
+
+
+def chi2_sf_even(x, df):
+    # For even df the tail is a Poisson cdf: exp(-x/2) * sum_{k < df/2} (x/2)^k / k!
+    half = x / 2
+    return sum(math.exp(k * math.log(half) - half - math.lgamma(k + 1)) for k in range(df // 2))
+
+
+def binomial_exact(k, n, p):
+    pmf = [math.comb(n, j) * p ** j * (1 - p) ** (n - j) for j in range(n + 1)]
+    return min(1.0, 2 * min(sum(pmf[:k + 1]), sum(pmf[k:])))
+
+
+@pytest.mark.parametrize('df', [2, 4, 10, 50, 200])
+def test_chi2_sf_matches_closed_form(df):
+    x = np.linspace(0.1, 3 * df, 25)
+    expected = [chi2_sf_even(v, df) for v in x]
+    np.testing.assert_allclose(significance.chi2_sf(x, df), expected, rtol=1e-7, atol=1e-12)
+
+
+def test_chi2_sf_odd_df():
+    x = np.array([0.5, 1.0, 3.84, 10.0])
+    expected = [math.erfc(math.sqrt(v / 2)) for v in x]
+    np.testing.assert_allclose(significance.chi2_sf(x, 1), expected, rtol=1e-6)
+
+
+def test_chi2_sf_wilson_hilferty():
+    df = 1000
+    x = np.linspace(850, 1150, 13)
+    np.testing.assert_allclose(significance.chi2_sf(x, df), [chi2_sf_even(v, df) for v in x], atol=2e-3)
+
+
+def test_erfc_matches_math():
+    x = np.linspace(-4, 4, 41)
+    np.testing.assert_allclose(significance.erfc(x), [math.erfc(v) for v in x], rtol=2e-7)
+
+
+@pytest.mark.parametrize('n, p', [(10, 0.5), (40, 0.1), (100, 0.3), (60, 0.02)])
+def test_binomial_exact_branch(n, p):
+    k = np.arange(n + 1)
+    expected = [binomial_exact(int(v), n, p) for v in k]
+    np.testing.assert_allclose(significance.binomial_two_sided(k, n, p), expected, rtol=1e-9, atol=1e-13)
+
+
+def test_binomial_normal_branch():
+    n, p = 1000, 0.3
+    k = np.arange(240, 361, 10)
+    expected = [binomial_exact(int(v), n, p) for v in k]
+    np.testing.assert_allclose(significance.binomial_two_sided(k, n, p), expected, atol=5e-3)
+
+
+def test_benjamini_hochberg():
+    p = np.array([[0.01, 0.04], [0.03, 0.20]])
+    expected = [[0.04, 0.16 / 3], [0.16 / 3, 0.20]]
+    np.testing.assert_allclose(significance.benjamini_hochberg(p), expected)
+    assert significance.benjamini_hochberg(np.array([])).size == 0
+
+
+def test_window_counts_skip_empty_slots():
+    winners = np.array([0, 1, -1, 1, 2, 2, 0])
+    np.testing.assert_array_equal(significance.window_counts(winners, 3, 3), [[1, 1, 0], [0, 1, 2]])
+
+
+def test_run_tests():
+    stake = np.array([1.0, 2.0, 3.0, 4.0])
+    wins = np.array([[12, 18, 35, 35], [10, 20, 30, 40], [0, 0, 0, 0]])
+    tests = significance.run_tests(wins, stake, chunk_elements=4)
+
+    expected = wins[:2].sum(axis=1, keepdims=True) * stake / stake.sum()
+    chi2 = ((wins[:2] - expected) ** 2 / expected).sum(axis=1)
+    np.testing.assert_allclose(tests.chi2, [*chi2, 0.0])
+    assert tests.chi2[1] == 0.0 and tests.chi2_p[1] == 1.0
+    np.testing.assert_allclose(tests.chi2_p, significance.chi2_sf(tests.chi2, 3))
+    assert tests.binomial_p[0, 0] == pytest.approx(binomial_exact(12, 100, 0.1), rel=1e-5)
+    assert not tests.unfair().any()
+
+
+def test_run_tests_flags_bias():
+    stake = np.ones(5)
+    tests = significance.run_tests([[300, 50, 50, 50, 50]], stake)
+    assert tests.unfair()[0, 0] and tests.chi2_p[0] < 1e-10
+
+
+def test_run_tests_rejects_mismatched_stake():
+    with pytest.raises(ValueError):
+        significance.run_tests([[1, 2, 3]], [1.0, 1.0])
@@ -0,0 +1,65 @@
+import pytest
+
+from simulation import vdf
+
+T = 1000
+
+
+@pytest.fixture(scope='module')
+def evaluation():
+    x = vdf.hash_to_group(b"test-seed")
+    return x, vdf.evaluate(x, T)
+
+
+def test_evaluate_is_repeated_squaring():
+    x = vdf.hash_to_group(b"small")
+    assert vdf.evaluate(x, 10_000) == pow(x, 2 ** 10_000, vdf.RSA_2048)
+
+
+def test_evaluate_reports_progress():
+    seen = []
+    vdf.evaluate(3, 3 * vdf._CHUNK + 5, progress=seen.append)
+    assert seen[-1] == 1.0 and seen == sorted(seen)
+
+
+@pytest.mark.parametrize('T', [1, 2, 7, T])
+def test_wesolowski_proof_verifies(T):
+    x = vdf.hash_to_group(b"w")
+    y = vdf.evaluate(x, T)
+    assert vdf.verify_wesolowski(x, y, T, vdf.prove_wesolowski(x, y, T))
+
+
+def test_wesolowski_rejects_tampering(evaluation):
+    x, y = evaluation
+    proof = vdf.prove_wesolowski(x, y, T)
+    assert not vdf.verify_wesolowski(x, y, T, proof * 2 % vdf.RSA_2048)
+    assert not vdf.verify_wesolowski(x, y + 1, T, proof)
+    assert not vdf.verify_wesolowski(x, y, T + 1, proof)
+    assert not vdf.verify_wesolowski(x, y, T, 0)
+
+
+@pytest.mark.parametrize('T', [1, 2, 7, 33, T])
+def test_pietrzak_proof_verifies(T):
+    x = vdf.hash_to_group(b"p")
+    y = vdf.evaluate(x, T)
+    assert vdf.verify_pietrzak(x, y, T, vdf.prove_pietrzak(x, y, T))
+
+
+def test_pietrzak_rejects_tampering(evaluation):
+    x, y = evaluation
+    proof = vdf.prove_pietrzak(x, y, T)
+    assert not vdf.verify_pietrzak(x, y + 1, T, proof)
+    assert not vdf.verify_pietrzak(x, y, T, [proof[0] + 1] + proof[1:])
+    assert not vdf.verify_pietrzak(x, y, T, proof[:-1])
+    assert not vdf.verify_pietrzak(x, y, T, proof + [proof[-1]])
+
+
+@pytest.mark.parametrize('scheme', vdf.SCHEMES)
+def test_run_verifies(scheme):
+    run = vdf.run(b"run", 500, scheme)
+    assert run.valid and run.y == vdf.evaluate(run.x, 500)
+
+
+def test_run_rejects_unknown_scheme():
+    with pytest.raises(ValueError):
+        vdf.run(b"run", 10, "sloth")
@@ -0,0 +1,64 @@
+import hashlib
+
+import numpy as np
+import pytest
+
+from simulation import witness
+
+CHAIN_SEED = b"test-chain"
+STAKES = np.random.default_rng(0).pareto(1.5, 37) + 1.0
+
+
+@pytest.fixture(scope='module')
+def witnesses():
+    return witness.build_witnesses(np.arange(1, 41), STAKES, CHAIN_SEED)
+
+
+def node(left, right):
+    return hashlib.blake2s(left + right, person=b"fw-node").digest()
+
+
+def test_merkle_root_matches_hand_built_tree():
+    leaves = np.random.default_rng(1).integers(0, 256, size=(3, 32), dtype=np.uint8)
+    a, b, c = (bytes(leaf) for leaf in leaves)
+    assert witness.merkle_root(leaves) == node(node(a, b), node(c, c))
+    assert witness.merkle_root(leaves[:1]) == a
+    assert witness.merkle_root(leaves[:0]) == bytes(32)
+
+
+def test_winner_has_lowest_score(witnesses):
+    for record in witnesses[:5]:
+        evals = witness.evaluations(witness.block_seed(CHAIN_SEED, int(record['block'])), len(STAKES))
+        assert int(record['winner']) == int(np.argmin(witness.scores(evals, STAKES)))
+
+
+def test_witnesses_verify(witnesses):
+    assert witness.verify_witnesses(witnesses, STAKES, CHAIN_SEED, workers=1).all()
+
+
+@pytest.mark.parametrize('field', ['block', 'winner', 'seed', 'winner_eval', 'loser_root'])
+def test_tampered_witness_is_rejected(witnesses, field):
+    record = witnesses[3].copy()
+    if record[field].shape:
+        record[field][0] ^= 1
+    else:
+        record[field] = (int(record[field]) + 1) % len(STAKES)
+    assert not witness.verify_witness(record, STAKES, CHAIN_SEED)
+
+
+def test_batch_verification_flags_only_tampered(witnesses):
+    batch = witnesses.copy()
+    batch['loser_root'][[2, 17]] ^= 0xFF
+    verified = witness.verify_witnesses(batch, STAKES, CHAIN_SEED, workers=2, chunk=8)
+    assert np.flatnonzero(~verified).tolist() == [2, 17]
+
+
+def test_wrong_stakes_or_chain_are_rejected(witnesses):
+    assert not witness.verify_witness(witnesses[0], STAKES, b"other-chain")
+    assert not witness.verify_witnesses(witnesses, STAKES[::-1], CHAIN_SEED, workers=1).all()
+
+
+def test_wins_are_stake_proportional():
+    stakes = np.array([1.0, 3.0])
+    winners = witness.build_witnesses(np.arange(4000), stakes, CHAIN_SEED)['winner']
+    assert abs(np.mean(winners == 1) - 0.75) < 0.03
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from simulation import witness, witness_store
+
+CHAIN_SEED = b"test-chain"
+STAKES = np.random.default_rng(0).pareto(1.5, 16) + 1.0
+ITERATIONS = 64
+
+
+def build(blocks):
+    return witness.build_witnesses(np.asarray(blocks), STAKES, CHAIN_SEED)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return witness_store.WitnessStore(tmp_path / 'log')
+
+
+def test_append_and_read(store):
+    built = build(np.arange(10, 20))
+    outputs, proofs = witness.beacon_vdfs(built['seed'], ITERATIONS)
+    store.append(built, outputs, proofs)
+
+    assert len(store) == 10
+    record = store.get(13)
+    assert int(record['block']) == 13 and int(record['winner']) == int(built['winner'][3])
+    np.testing.assert_array_equal(record['vdf_output'], outputs[3])
+    assert store.proof(record) == proofs[3]
+    assert store.get(9) is None and store.get(20) is None and store.get(-1) is None
+    np.testing.assert_array_equal(store.missing([5, 10, 19, 20]), [5, 20])
+
+    records = store.range(0, 15)
+    assert isinstance(records, np.memmap)
+    assert records['block'].tolist() == list(range(10, 15))
+    assert witness.verify_witnesses(witness_store.as_witnesses(records), STAKES, CHAIN_SEED, workers=1).all()
+
+
+def test_range_out_of_order(store):
+    store.append(build([5, 3]))
+    store.append(build([4]))
+    assert store.range(0, 10)['block'].tolist() == [3, 4, 5]
+    assert len(store.range(100, 200)) == 0
+
+
+def test_stored_blocks_are_rejected(store):
+    store.append(build([1, 2, 3]))
+    with pytest.raises(witness_store.BlocksStoredError):
+        store.append(build([3, 4]))
+    assert len(store) == 3 and store.get(4) is None
+
+
+def test_duplicate_within_append_is_rejected(store):
+    with pytest.raises(ValueError):
+        store.append(build([7, 7]))
+    assert len(store) == 0
+
+
+def test_torn_tail_is_truncated(store):
+    store.append(build([1, 2]))
+    with open(store.records_path, 'ab') as f:
+        f.write(b"\0" * (witness_store.RECORD_DTYPE.itemsize // 2))
+    store.append(build([3]))
+    assert store.records_path.stat().st_size == 3 * witness_store.RECORD_DTYPE.itemsize
+    assert [int(store.get(b)['block']) for b in (1, 2, 3)] == [1, 2, 3]
+
+
+def test_unindexed_records_are_recovered(store, tmp_path):
+    # A crash between writing records and indexing them
+    built = build([8, 9])
+    records = np.zeros(len(built), dtype=witness_store.RECORD_DTYPE)
+    for name in built.dtype.names:
+        records[name] = built[name]
+    with open(store.records_path, 'ab') as f:
+        f.write(records.tobytes())
+    assert store.get(8) is None
+    store.append(build([10]))
+
+    reopened = witness_store.WitnessStore(tmp_path / 'log')
+    assert [int(reopened.get(b)['block']) for b in (8, 9, 10)] == [8, 9, 10]
+
+
+def test_index_grows_with_stored_blocks(store):
+    blocks = [5, 900_000_000, 900_000_001]
+    store.append(build(blocks))
+    assert len(list(store.index_dir.iterdir())) == 2
+    assert [int(store.get(b)['block']) for b in blocks] == blocks
+    assert store.get(900_000_002) is None
+
+
+def test_appends_seen_by_other_handles(store, tmp_path):
+    other = witness_store.WitnessStore(tmp_path / 'log')
+    assert other.get(1) is None
+    store.append(build([1]))
+    assert int(other.get(1)['block']) == 1 and len(other) == 1
+
+
+def test_beacon_vdf_verifies():
+    seed = build([1])['seed'][0]
+    output, proof = witness.beacon_vdf(seed, ITERATIONS)
+    assert witness.verify_beacon_vdf(seed, output, proof, ITERATIONS)
+    assert not witness.verify_beacon_vdf(seed, output, proof, ITERATIONS + 1)
+    assert not witness.verify_beacon_vdf(build([2])['seed'][0], output, proof, ITERATIONS)
+    assert not witness.verify_beacon_vdf(seed, bytes(32), proof, ITERATIONS)
+    assert not witness.verify_beacon_vdf(seed, output, proof[:-1] + bytes([proof[-1] ^ 1]), ITERATIONS)
+    assert not witness.verify_beacon_vdf(seed, output, proof[:-1], ITERATIONS)
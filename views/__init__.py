@@ -0,0 +1,44 @@
+"""Dashboard pages, one module per sidebar entry.
+
+A page module is imported the first time its page is selected, so the app
+starts without loading Plotly, pandas or the simulation engines, and
+text-only pages never load them at all. The first import of each page is
+timed for the sidebar's startup report.
+"""
+
+import importlib
+import sys
+import time
+
+PAGES = {
+    "Overview": "views.overview",
+    "Blockchain Trilemma": "views.trilemma",
+    "Fairness Problem": "views.fairness_problem",
+    "Architecture": "views.architecture",
+    "VDF Simulation": "views.vdf_simulation",
+    "Fairness Witnesses": "views.fairness_witnesses",
+    "Live Chain": "views.live_chain",
+    "Comparison Matrix": "views.comparison_matrix",
+    "Results": "views.results",
+    "Research Impact": "views.research_impact",
+}
+
+# Page name -> (import seconds, modules loaded by that first import)
+IMPORT_TIMES = {}
+
+
+def load(name):
+    """Import the module behind page ``name``, timing its first import."""
+    module_name = PAGES[name]
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    before = len(sys.modules)
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    IMPORT_TIMES[name] = (time.perf_counter() - start, len(sys.modules) - before)
+    return module
+
+
+def render(name):
+    load(name).render()
@@ -0,0 +1,93 @@
+"""Architecture page."""
+
+import numpy as np
+import streamlit as st
+
+from simulation import bft
+
+from . import profiling
+
+BFT_HEIGHTS = 10
+
+
+@profiling.timed("simulation")
+@st.cache_data(max_entries=32, show_spinner="Running consensus rounds...")
+def run_bft_simulation(validators, byzantine_fraction, behaviour, delay_ms):
+    return bft.simulate(validators, heights=BFT_HEIGHTS, byzantine_fraction=byzantine_fraction,
+                        behaviour=behaviour, delay_ms=delay_ms)
+
+
+def render():
+    st.header("Proposed Hybrid Architecture")
+    
+    # Create architecture diagram using layout
+    col1, col2, col3 = st.columns([1, 3, 1])
+    
+    with col2:
+        st.markdown("### Layer 4: L2 Rollups")
+        st.progress(100, text="Scalability: 10,000+ TPS")
+        st.caption("Bundles transactions off-chain, submits proofs to L1")
+        
+        st.markdown("Proposed WorkProposed WorkProposed Work")
+        
+        st.markdown("### Layer 3: BFT Consensus")
+        st.progress(100, text="Security: ≤⅓ fault tolerance")
+        st.caption("Byzantine Fault Tolerance with instant finality")
+        
+        st.markdown("Proposed WorkProposed WorkProposed Work")
+        
+        st.markdown("### Layer 2: VDF Fairness")
+        st.progress(100, text="Decentralization: Gini 0.15-0.25")
+        st.caption("Verifiable Delay Functions neutralize latency advantage")
+        
+        st.markdown("Proposed WorkProposed WorkProposed Work")
+        
+        st.markdown("### Layer 1: PoS Base")
+        st.progress(100, text="Foundation: Stake-weighted validator set")
+        st.caption("Economic security and Sybil resistance")
+    
+    st.markdown("---")
+    
+    # How it works
+    st.subheader("How the Layers Work Together")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.info("**1. Stake**\n\nValidators stake tokens to participate")
+        
+    with col2:
+        st.info("**2. VDF**\n\nAll validators compute VDF for Δt seconds\n→ Level playing field")
+        
+    with col3:
+        st.info("**3. BFT**\n\nValidators reach consensus\n→ Safety & liveness")
+        
+    with col4:
+        st.info("**4. L2**\n\nTransactions processed in rollups\n→ High throughput")
+
+    st.markdown("---")
+
+    # Layer 3 under load: Tendermint rounds with equivocating or silent validators
+    st.subheader("BFT Consensus Simulation")
+    c1, c2, c3, c4 = st.columns(4)
+    validators = c1.select_slider("Validators", [100, 250, 500, 1000, 2000, 4000], value=500)
+    byzantine_fraction = c2.slider("Byzantine Fraction", 0.0, 0.5, 0.2, step=0.05)
+    behaviour = c3.selectbox("Byzantine Behaviour", ["Equivocate", "Silent"])
+    delay_ms = c4.slider("Network Delay (ms)", 10, 500, 100, step=10)
+
+    run = run_bft_simulation(validators, byzantine_fraction, behaviour.lower(), delay_ms)
+    finality = run.finality_ms[run.finalized]
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Mean Rounds to Finality", f"{run.rounds[run.finalized].mean():.2f}" if len(finality) else "—")
+    m2.metric("Median Finality", f"{np.median(finality):,.0f} ms" if len(finality) else "No finality")
+    m3.metric("Messages per Height", f"{run.messages.mean():,.0f}")
+    m4.metric("Safety Violations", f"{run.safety_violations.sum()} / {BFT_HEIGHTS}")
+
+    if run.safety_violations.any():
+        st.error(f"{run.byzantine} Byzantine validators exceed the ⅓ bound: honest validators finalized conflicting blocks.")
+    elif not run.finalized.all():
+        st.warning(f"{BFT_HEIGHTS - run.finalized.sum()} of {BFT_HEIGHTS} heights never finalized: with "
+                   f"{run.byzantine} of {validators} validators Byzantine no ⅔ quorum formed in time.")
+    else:
+        st.success(f"Every height finalized safely with {run.byzantine} of {validators} validators Byzantine "
+                   f"(quorum {run.quorum:,}).")
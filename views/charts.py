@@ -0,0 +1,72 @@
+"""Plotly traces whose payload stays bounded however large the data.
+
+Every point of a figure is serialised to the browser on each render, so
+large simulation outputs are reduced server-side first:
+
+* ``line_trace`` downsamples a series to at most ``MAX_POINTS`` points with
+  largest-triangle-three-buckets (LTTB), which keeps peaks and troughs that
+  plain striding would drop. It switches to WebGL (``Scattergl``) above
+  ``WEBGL_THRESHOLD`` points.
+* ``histogram_trace`` draws counts binned in NumPy as bars, so a histogram
+  costs one bar per bin rather than one value per sample.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+MAX_POINTS = 2_000
+WEBGL_THRESHOLD = 1_000
+
+
+def lttb(x, y, threshold):
+    """Indices of the ``threshold`` points LTTB keeps from the series ``(x, y)``.
+
+    ``x`` must be sorted. The first and last points are always kept; every
+    bucket in between keeps the point forming the largest triangle with the
+    previously kept point and the next bucket's mean.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # threshold - 2 buckets over the interior points
+    bounds = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    starts, ends = bounds[:-1], bounds[1:]
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    counts = ends - starts
+    mean_x = (cum_x[ends] - cum_x[starts]) / counts
+    mean_y = (cum_y[ends] - cum_y[starts]) / counts
+    # The last bucket looks ahead to the final point
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(len(starts)):
+        lo, hi = starts[i], ends[i]
+        # Twice the triangle area; the factor doesn't change the argmax
+        area = np.abs((x[a] - next_x[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y[i] - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def line_trace(x, y, max_points=MAX_POINTS, **kwargs):
+    """Line trace over at most ``max_points`` points, WebGL above ``WEBGL_THRESHOLD``."""
+    y = np.asarray(y)
+    x = np.arange(len(y)) if x is None else np.asarray(x)
+    keep = lttb(x, y, max_points)
+    if len(keep) < len(y):
+        x, y = x[keep], y[keep]
+    trace = go.Scattergl if len(y) > WEBGL_THRESHOLD else go.Scatter
+    return trace(x=x, y=y, **kwargs)
+
+
+def histogram_trace(edges, counts, **kwargs):
+    """Bar trace of pre-binned counts, one bar per bin."""
+    edges = np.asarray(edges, dtype=np.float64)
+    return go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=np.asarray(counts), width=np.diff(edges), **kwargs)
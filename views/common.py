@@ -0,0 +1,188 @@
+"""Data and simulations shared by several pages."""
+
+import streamlit as st
+
+from . import profiling
+
+# Define comparison data
+comparison_data = {
+    'Algorithm': [
+        'Traditional PoS', 'Algorand', 'Tendermint', 'Ethereum 2.0', 
+        'Solana', 'Avalanche', 'Cardano', 'Polkadot', 'Near Protocol', 
+        'Tezos', 'Proposed Work'
+    ],
+
+    'Geographic Gini': [0.75, 0.40, 0.55, 0.50, 0.70, 0.60, 0.60, 0.55, 0.65, 0.60, 0.20],
+    'TPS (thousands)': [1.5, 12, 2.5, 50, 57, 5, 0.6, 2, 7.5, 0.12, 12],
+    'Grinding Attack %': [70, 15, 25, 20, 35, 30, 25, 25, 40, 30, 8]
+}
+
+# Leader-election Monte Carlo behind the "Fairness Problem" page
+ELECTION_VALIDATORS = 10_000
+ELECTION_SLOTS = 200_000
+
+# Proposer sortition behind Algorand's Geographic Gini
+SORTITION_ROUNDS = 50_000
+
+# Epoch stake dynamics behind the "Decentralization Over Time" trajectories
+STAKE_EPOCHS = 10_000
+
+# Rollup configuration behind the headline TPS figure
+ROLLUP_BATCH_SIZE = 2_000
+
+# Grinding Monte Carlo behind the "Grinding Attack %" figures
+GRINDING_TRIALS = 1_000_000
+
+
+# Page data and figures are built through parameter-keyed caches so a rerun
+# only rebuilds what the changed widget feeds into; entry limits bound memory.
+# Heavy libraries are imported inside the builders so text-only pages never
+# pay for them.
+@profiling.timed("data")
+@st.cache_data
+def comparison_frame():
+    import pandas as pd
+
+    df = pd.DataFrame(comparison_data)
+    # Proposed Work's throughput and both grinding rates are measured, not quoted
+    plain, with_vdf = grinding_results()
+    df.loc[df['Algorithm'] == 'Proposed Work', 'TPS (thousands)'] = round(rollup_tps() / 1000, 1)
+    df.loc[df['Algorithm'] == 'Traditional PoS', 'Grinding Attack %'] = round(plain.rate * 100, 1)
+    df.loc[df['Algorithm'] == 'Proposed Work', 'Grinding Attack %'] = round(with_vdf.rate * 100, 1)
+    # Geographic Gini of both is measured by the leader-election simulation
+    plain_gini, vdf_gini = geographic_gini()
+    df.loc[df['Algorithm'] == 'Traditional PoS', 'Geographic Gini'] = round(plain_gini, 2)
+    df.loc[df['Algorithm'] == 'Proposed Work', 'Geographic Gini'] = round(vdf_gini, 2)
+    df.loc[df['Algorithm'] == 'Algorand', 'Geographic Gini'] = round(algorand_gini(), 2)
+    return df
+
+
+@profiling.timed("simulation")
+@st.cache_data(show_spinner="Simulating grinding attacks...")
+def grinding_results(trials=GRINDING_TRIALS):
+    from simulation import grinding
+
+    # Same adversary against plain VRF randomness and against VRF+VDF
+    return grinding.simulate(trials), grinding.simulate(trials, vdf=True)
+
+
+@profiling.timed("simulation")
+@st.cache_data(max_entries=16, show_spinner="Benchmarking the rollup sequencer...")
+def rollup_benchmark(batch_sizes, worker_counts):
+    import numpy as np
+    import pandas as pd
+
+    from simulation import rollup
+
+    runs = rollup.benchmark(batch_sizes, worker_counts)
+    return pd.DataFrame([{
+        'Batch Size': run.batch_size,
+        'Workers': run.workers,
+        'TPS': run.tps,
+        'p50 Batch Latency (ms)': float(np.percentile(run.batch_latency_ms, 50)),
+        'p99 Batch Latency (ms)': float(np.percentile(run.batch_latency_ms, 99)),
+    } for run in runs])
+
+
+def rollup_tps():
+    """Sustained TPS of the default rollup configuration on this host."""
+    return float(rollup_benchmark((ROLLUP_BATCH_SIZE,), (1,))['TPS'].iloc[0])
+
+
+@st.cache_data(max_entries=4)
+def _sweep_table(kind, path, mtime):
+    from simulation import sweep
+
+    return sweep.load_results(kind, path.parent)
+
+
+def precomputed_results(kind):
+    """Table written by ``python -m simulation <kind>``, reloaded whenever the file changes."""
+    from simulation import sweep
+
+    path = sweep.results_path(kind)
+    if not path.exists():
+        return None
+    return _sweep_table(kind, path, path.stat().st_mtime)
+
+
+@profiling.timed("simulation")
+@st.cache_data(max_entries=64, show_spinner="Running simulation...")
+def simulation_point(kind, **params):
+    """One simulation grid point: precomputed sweep results, else the on-disk cache, else a fresh run."""
+    from simulation import sweep
+
+    params = sweep.point_params(kind, **params)
+    row = sweep.lookup(precomputed_results(kind), params)
+    if row is None:
+        # Shared on disk, so other server processes and restarts reuse the run
+        rest = {name: value for name, value in params.items() if name != 'seed'}
+        row = result_cache().get_or_compute(kind, rest, lambda: sweep.run_point(kind, params), seed=params['seed'])
+    return row
+
+
+@st.cache_resource
+def result_cache():
+    from simulation.cache import ResultCache
+
+    return ResultCache()
+
+
+@profiling.timed("data")
+def election_summary(validators, slots):
+    import numpy as np
+
+    # Regional win shares and the latency win-probability curve, without and with VDF
+    row = simulation_point('election', validators=validators, slots=slots)
+    shares = np.asarray(row['region_share']), np.asarray(row['region_share_vdf'])
+    curve = np.asarray(row['curve_latency_ms']), np.asarray(row['curve']), np.asarray(row['curve_vdf'])
+    return shares, curve
+
+
+def geographic_gini(validators=ELECTION_VALIDATORS, slots=ELECTION_SLOTS):
+    """Regional Gini of block production relative to stake, without and with VDF."""
+    row = simulation_point('election', validators=validators, slots=slots)
+    return row['geographic_gini'], row['geographic_gini_vdf']
+
+
+def algorand_gini(validators=ELECTION_VALIDATORS, rounds=SORTITION_ROUNDS):
+    """Regional Gini of Algorand proposer sortition over the same validators."""
+    return simulation_point('sortition', validators=validators, rounds=rounds)['geographic_gini']
+
+
+def stake_trajectories(stake_distribution, validators=ELECTION_VALIDATORS, epochs=STAKE_EPOCHS):
+    """Stake dynamics row: per-epoch Gini and Nakamoto trajectories, without and with VDF."""
+    return simulation_point('stake_dynamics', validators=validators, epochs=epochs,
+                            stake_distribution=stake_distribution)
+
+
+@st.cache_resource
+def job_runner():
+    # One bounded background pool for every session of this server process
+    from simulation.jobs import JobRunner
+
+    return JobRunner()
+
+
+def session_owner():
+    """Stable id of the current browser session, used to cap its background jobs."""
+    if 'session_owner' not in st.session_state:
+        import uuid
+
+        st.session_state.session_owner = uuid.uuid4().hex
+    return st.session_state.session_owner
+
+
+@st.cache_resource
+def memory_ledger():
+    # Budgets every session's stored results in this server process
+    from simulation.session_store import MemoryLedger
+
+    return MemoryLedger()
+
+
+def session_results():
+    """This session's memory-budgeted result store; evicted values must be rebuilt."""
+    if 'session_results' not in st.session_state:
+        st.session_state.session_results = memory_ledger().store(session_owner())
+    return st.session_state.session_results
@@ -0,0 +1,67 @@
+"""Comparison Matrix page."""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from . import profiling
+from .common import comparison_frame
+
+
+@profiling.timed("figure")
+@st.cache_resource(max_entries=64)
+def radar_figure(selected_algorithms):
+    df = comparison_frame()
+    fig = go.Figure()
+    
+    metrics = ['Security Score', 'Decentralization Score', 'Scalability Score', 
+              'Verifiable Fairness', 'Finality Score', 'Energy Efficiency']
+    
+    for algo in selected_algorithms:
+        algo_data = df[df['Algorithm'] == algo].iloc[0]
+        values = [algo_data[m] for m in metrics]
+        values.append(values[0])  # Close the loop
+        
+        fig.add_trace(go.Scatterpolar(
+            r=values,
+            theta=metrics + [metrics[0]],
+            fill='toself',
+            name=algo,
+            line_width=3 if algo == 'Proposed Work' else 1
+        ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 10]
+            )),
+        showlegend=True,
+        height=600
+    )
+    return fig
+
+
+def render():
+    st.header("Comparison Matrix: All Consensus Algorithms")
+    df = comparison_frame()
+    
+    # Display the full dataframe
+    st.dataframe(df, use_container_width=True, hide_index=True)
+    
+    # Radar chart comparison
+    st.subheader("Radar Chart Comparison")
+    
+    selected_algorithms = st.multiselect(
+        "Select algorithms to compare",
+        options=df['Algorithm'].tolist(),
+        default=['Traditional PoS', 'Algorand', 'Ethereum 2.0', 'Proposed Work']
+    )
+    
+    if selected_algorithms:
+        st.plotly_chart(radar_figure(tuple(selected_algorithms)), use_container_width=True)
+    
+    # Key insights
+    st.info("""
+    **Key Insight:** Proposed Work is the ONLY algorithm providing VERIFIABLE FAIRNESS 
+    while maintaining excellence across all other metrics.
+    """)
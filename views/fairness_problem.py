@@ -0,0 +1,117 @@
+"""Fairness Problem page."""
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from simulation import election, geo
+
+from . import charts, profiling
+from .common import ELECTION_SLOTS, ELECTION_VALIDATORS, election_summary, geographic_gini
+
+
+@profiling.timed("figure")
+@st.cache_resource(max_entries=16)
+def region_bar_figure(values, title, color_scale):
+    fig = px.bar(
+        x=election.REGIONS, 
+        y=list(values),
+        title=title,
+        labels={'x': 'Region', 'y': 'Blocks Won (%)'},
+        color=list(values),
+        color_continuous_scale=list(color_scale)
+    )
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+@profiling.timed("figure")
+@st.cache_resource(max_entries=8)
+def win_probability_figure(validators, slots):
+    _, (latency_values, traditional_win_prob, fair_win_prob) = election_summary(validators, slots)
+    
+    fig = go.Figure()
+    fig.add_trace(charts.line_trace(
+        latency_values,
+        traditional_win_prob,
+        mode='lines+markers',
+        name='Traditional PoS',
+        line=dict(color='red', width=2)
+    ))
+    fig.add_trace(charts.line_trace(
+        latency_values,
+        fair_win_prob,
+        mode='lines',
+        name='Proposed Work (with VDF)',
+        line=dict(color='green', width=3, dash='dash')
+    ))
+    
+    fig.update_layout(
+        title="Probability of Winning Next Block vs Latency",
+        xaxis_title="Network Latency (ms)",
+        yaxis_title="Win Probability (%)",
+        yaxis_range=[0, 100]
+    )
+    return fig
+
+
+@profiling.timed("figure")
+@st.cache_resource
+def region_latency_figure():
+    # Mean shortest backbone delay between the cities of each pair of regions
+    fig = px.imshow(
+        geo.region_delays().round(0),
+        x=election.REGIONS,
+        y=election.REGIONS,
+        text_auto=True,
+        color_continuous_scale='OrRd',
+        labels={'color': 'One-way Delay (ms)'},
+        title="Region-to-Region Propagation Delay (ms)"
+    )
+    return fig
+
+
+def render():
+    st.header("Proposed Work The Hidden Problem: Geographic Unfairness")
+    
+    # Monte Carlo leader election: stake-weighted candidates race each slot
+    # with and without a VDF delay
+    (traditional_dist, fair_dist), (latency_values, traditional_win_prob, fair_win_prob) = \
+        election_summary(ELECTION_VALIDATORS, ELECTION_SLOTS)
+
+    plain_gini, vdf_gini = geographic_gini()
+
+    st.subheader("Block Production by Region")
+    st.caption(f"Simulated {ELECTION_SLOTS:,} slots across {ELECTION_VALIDATORS:,} validators spread evenly over six regions.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(f"**Traditional PoS (Gini: {plain_gini:.2f})**")
+        fig1 = region_bar_figure(tuple(traditional_dist), "Blocks Won by Region - Traditional PoS",
+                                 ('lightblue', 'darkblue'))
+        st.plotly_chart(fig1, use_container_width=True)
+        
+    with col2:
+        st.markdown(f"**Proposed Work (Gini: {vdf_gini:.2f})**")
+        fig2 = region_bar_figure(tuple(fair_dist), "Blocks Won by Region - Proposed Work",
+                                 ('lightgreen', 'darkgreen'))
+        st.plotly_chart(fig2, use_container_width=True)
+    
+    st.subheader("Region-to-Region Latency")
+    model = geo.default_model()
+    st.caption(f"Shortest delays over a fibre backbone joining {model.cities} cities, "
+               f"{model.links} links.")
+    st.plotly_chart(region_latency_figure(), use_container_width=True)
+
+    # Latency simulation
+    st.subheader("Proposed Work Network Latency Impact")
+    
+    # Win probability of an eligible validator, binned by its latency
+    st.plotly_chart(win_probability_figure(ELECTION_VALIDATORS, ELECTION_SLOTS), use_container_width=True)
+    
+    st.warning(f"""
+    **In Traditional PoS:** Eligible validators with {latency_values[0]:.0f}ms latency win {traditional_win_prob[0]:.0f}% of their slots vs {traditional_win_prob[-1]:.1f}% at {latency_values[-1]:.0f}ms.  
+    **With VDF:** Win probability stays near {np.median(fair_win_prob):.0f}% regardless of geography, until latency exceeds the post-VDF grace window.
+    """)
@@ -0,0 +1,213 @@
+"""Fairness Witnesses page."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from simulation import alias, significance, witness, witness_store
+
+from . import profiling
+from .common import session_results
+
+# Leader-selection window behind the "Loser Proof" table
+LOSER_WINDOW = 100
+LOSER_SEED = 1000
+# Windows of the same sampler audited behind the table, and the false discovery rate
+LOSER_AUDIT_WINDOWS = 1_000
+FAIRNESS_ALPHA = 0.05
+
+# Validator set and randomness beacon behind the Fairness Witness demo
+CHAIN_SEED = b"verifiable-fairness-demo"
+WITNESS_VALIDATORS = [f"Validator {i:03d}" for i in range(128)]
+WITNESS_STAKES = np.random.default_rng(0).pareto(1.5, len(WITNESS_VALIDATORS)) + 1.0
+AUDIT_BLOCKS = 1_000
+# Squarings of each block's beacon VDF, kept small so blocks are built on demand
+BEACON_ITERATIONS = 256
+# Appends lost to concurrent sessions before giving up
+APPEND_ATTEMPTS = 3
+# The witness log's index only grows where blocks are stored, so any block number is cheap
+MAX_BLOCK = 1_000_000_000
+
+
+@profiling.timed("data")
+@st.cache_data
+def winner_table():
+    winner_data = {
+        'Block': [1000, 1001, 1002, 1003, 1004],
+        'Selected Validator': ['A', 'C', 'B', 'A', 'D'],
+        'Witness Valid': ['✓', '✓', '✓', '✓', '✓']
+    }
+    return pd.DataFrame(winner_data)
+
+
+@profiling.timed("data")
+@st.cache_data(max_entries=16)
+def loser_table(window, seed):
+    # Stake-weighted leader sampling over a window of blocks
+    stakes = np.array([20, 15, 25, 30, 10])
+    leaders = alias.AliasSampler(stakes).sample(window, np.random.default_rng(seed))
+    wins = np.bincount(leaders, minlength=len(stakes))
+    tests = significance.run_tests(wins[None, :], stakes)
+    loser_data = {
+        'Validator': ['B', 'D', 'A', 'C', 'E'],
+        'Stake (%)': stakes,
+        'Expected Wins': stakes / stakes.sum() * window,
+        'Actual Wins': wins,
+        'Adjusted p-value': tests.binomial_q[0],
+        'Fairness Verified': np.where(tests.unfair(FAIRNESS_ALPHA)[0], '✗', '✓')
+    }
+    return pd.DataFrame(loser_data), tests.chi2_p[0], tests.ks_p[0]
+
+
+@profiling.timed("simulation")
+@st.cache_data(max_entries=4)
+def loser_audit(window, windows, seed):
+    # The same stake-weighted sampler over many consecutive windows
+    stakes = np.array([20, 15, 25, 30, 10])
+    leaders = alias.AliasSampler(stakes).sample(window * windows, np.random.default_rng(seed))
+    tests = significance.run_tests(significance.window_counts(leaders, len(stakes), window), stakes)
+    return int(tests.unfair(FAIRNESS_ALPHA).sum()), int((tests.chi2_q < FAIRNESS_ALPHA).sum())
+
+
+@profiling.timed("data")
+@st.cache_data
+def verifier_table():
+    verify_data = {
+        'Verifier': ['User 1', 'User 2', 'User 3', 'User 4', 'User 5'],
+        'Has Secret Key': ['No', 'No', 'No', 'No', 'No'],
+        'Can Verify': ['Yes', 'Yes', 'Yes', 'Yes', 'Yes']
+    }
+    return pd.DataFrame(verify_data)
+
+
+@st.cache_resource
+def witness_log():
+    # One log per chain, shared by every session and kept across restarts
+    return witness_store.WitnessStore(witness_store.STORE_DIR / CHAIN_SEED.hex())
+
+
+@profiling.timed("simulation")
+def stored_witnesses(blocks):
+    """Records of consecutive ``blocks``, building and appending any the log lacks."""
+    log = witness_log()
+    blocks = np.unique(blocks)
+    for attempt in range(APPEND_ATTEMPTS):
+        missing = log.missing(blocks)
+        if not len(missing):
+            break
+        built = witness.build_witnesses(missing, WITNESS_STAKES, CHAIN_SEED)
+        outputs, proofs = witness.beacon_vdfs(built['seed'], BEACON_ITERATIONS)
+        try:
+            log.append(built, outputs, proofs)
+        except witness_store.BlocksStoredError:
+            # Another session stored some of them first
+            if attempt == APPEND_ATTEMPTS - 1:
+                raise
+    return log.range(int(blocks[0]), int(blocks[-1]) + 1)
+
+
+def block_record(block_num):
+    record = witness_log().get(block_num)
+    if record is None:
+        record = stored_witnesses(np.array([block_num]))[0]
+    return record
+
+
+def vdfs_verified(records):
+    """Whether each stored record's beacon VDF output checks against its proof."""
+    log = witness_log()
+    return np.fromiter((witness.verify_beacon_vdf(r['seed'], r['vdf_output'], log.proof(r), BEACON_ITERATIONS)
+                        for r in records), dtype=bool, count=len(records))
+
+
+def render():
+    st.header("The Innovation: Fairness Witnesses")
+    
+    st.markdown("""
+    A **Fairness Witness** is a publicly verifiable, cryptographically binding proof that:
+    """)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.success("###  Winner Proof")
+        st.write("Validator was legitimately selected as leader")
+        
+        st.dataframe(winner_table(), use_container_width=True)
+        
+    with col2:
+        st.success("###  Loser Proof")
+        st.write("Validators lost fairly (selection was unbiased)")
+        
+        table, chi2_p, ks_p = loser_table(LOSER_WINDOW, LOSER_SEED)
+        st.dataframe(table.style.format({'Expected Wins': '{:.0f}', 'Adjusted p-value': '{:.3f}'}),
+                     use_container_width=True)
+        flagged, windows_flagged = loser_audit(LOSER_WINDOW, LOSER_AUDIT_WINDOWS, LOSER_SEED)
+        st.caption(f"Binomial tails, Benjamini–Hochberg adjusted. Window: χ² p = {chi2_p:.3f}, "
+                   f"KS p = {ks_p:.3f}. Across {LOSER_AUDIT_WINDOWS:,} windows, {flagged:,} of "
+                   f"{LOSER_AUDIT_WINDOWS * len(table):,} validator-windows and {windows_flagged:,} windows "
+                   f"are flagged at a {FAIRNESS_ALPHA:.0%} false discovery rate.")
+        
+    with col3:
+        st.success("###  Public Verification")
+        st.write("Anyone can verify without secret keys")
+        
+        st.dataframe(verifier_table(), use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Fairness Witness verification demo
+    st.subheader("Try It: Verify a Fairness Witness")
+    
+    block_num = st.number_input("Block Number", min_value=1, max_value=MAX_BLOCK, value=4242)
+    stored = block_record(block_num)
+    record = witness_store.as_witnesses(np.asarray(stored)[None])[0]
+    selected_validator = st.selectbox("Selected Validator", WITNESS_VALIDATORS, index=int(record['winner']))
+    
+    if st.button("Verify Fairness"):
+        winner = WITNESS_VALIDATORS[int(record['winner'])]
+        valid = witness.verify_witness(record, WITNESS_STAKES, CHAIN_SEED) and vdfs_verified([stored])[0]
+        digest = witness.witness_digest(record)
+        if valid and selected_validator == winner:
+            st.success(f"""
+            ### Verification Result for Block #{block_num}
+            
+            -  Winner ({selected_validator}) proof: **VALID**
+            -  All {len(WITNESS_VALIDATORS) - 1} other validators lost fairly: **VERIFIED**
+            -  Beacon VDF output ({BEACON_ITERATIONS} squarings): **VERIFIED**
+            -  Randomness source: Unbiased (VRF + VDF)
+            -  No manipulation detected
+            -  Public verification successful
+            
+            **Fairness Witness:** `0x{digest[:4]}...{digest[-4:]}` (attached to block)  
+            **Loser Merkle Root:** `0x{bytes(record['loser_root']).hex()}`
+            """)
+        elif valid:
+            st.error(f"""
+            ### Verification Result for Block #{block_num}
+            
+            -  Claimed winner ({selected_validator}): **REJECTED**
+            -  The witness selects **{winner}**; {selected_validator} lost fairly
+            
+            **Fairness Witness:** `0x{digest[:4]}...{digest[-4:]}` (attached to block)
+            """)
+        else:
+            st.error(f"Fairness Witness for block #{block_num} failed verification.")
+    
+    # Batch audit of the blocks leading up to the selected one
+    results = session_results()
+    if st.button(f"Audit Previous {AUDIT_BLOCKS:,} Blocks"):
+        blocks = np.arange(max(1, block_num - AUDIT_BLOCKS + 1), block_num + 1)
+        records = stored_witnesses(blocks)
+        start = time.perf_counter()
+        verified = witness.verify_witnesses(witness_store.as_witnesses(records), WITNESS_STAKES, CHAIN_SEED)
+        verified &= vdfs_verified(records)
+        # Kept per session, so the outcome stays on screen until another block is audited
+        results['witness_audit'] = (block_num, verified, time.perf_counter() - start)
+    audit = results.get('witness_audit')
+    if audit is not None and audit[0] == block_num:
+        _, verified, elapsed = audit
+        st.metric("Witnesses Verified", f"{int(verified.sum()):,} / {len(verified):,}",
+                  delta=f"{len(verified) / elapsed:,.0f} blocks/s")
@@ -0,0 +1,102 @@
+"""Live Chain page."""
+
+import streamlit as st
+
+from simulation import election, geo, live
+
+from . import charts, profiling
+from .common import session_results
+
+LIVE_VALIDATORS = 2_000
+LIVE_HISTORY = 600
+REFRESH_SECONDS = 1.0
+
+
+@profiling.timed("simulation")
+@st.cache_resource(max_entries=4)
+def live_validators(validators, stake_distribution):
+    # Placement is shared by every session watching the same configuration
+    return geo.make_validators(validators, stake_distribution)
+
+
+def live_state(stake_distribution, window):
+    """This session's stream and window, restarted when the configuration changes or was evicted."""
+    config = (stake_distribution, window)
+    results = session_results()
+    state = results.get('live')
+    if state is None or state[0] != config:
+        region, stake, latency_ms = live_validators(LIVE_VALIDATORS, stake_distribution)
+        state = (config, live.stream(region, stake, latency_ms, slots_per_step=100),
+                 live.LiveWindow(region, stake, window=window, history=LIVE_HISTORY))
+        results['live'] = state
+    return state[1], state[2]
+
+
+def gini_figure(window):
+    import plotly.graph_objects as go
+
+    slots = window.history['slot'].values()
+    fig = go.Figure()
+    fig.add_trace(charts.line_trace(slots, window.history['gini'].values(), mode='lines',
+                                    name='Traditional PoS', line=dict(color='red', width=2)))
+    fig.add_trace(charts.line_trace(slots, window.history['gini_vdf'].values(), mode='lines',
+                                    name='Proposed Work (with VDF)', line=dict(color='green', width=2)))
+    fig.update_layout(title="Rolling Geographic Gini", xaxis_title="Slot", yaxis_title="Gini",
+                      yaxis_range=[0, 1])
+    return fig
+
+
+def share_figure(window):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=election.REGIONS, y=window.region_share(), name='Traditional PoS',
+                         marker_color='red'))
+    fig.add_trace(go.Bar(x=election.REGIONS, y=window.region_share(vdf=True), name='Proposed Work (with VDF)',
+                         marker_color='green'))
+    fig.add_trace(go.Scatter(x=election.REGIONS, y=window.stake_share * 100, mode='markers',
+                             name='Stake Share', marker=dict(color='black', symbol='line-ew-open', size=30)))
+    fig.update_layout(title="Blocks Won by Region (Rolling Window)", yaxis_title="Blocks Won (%)",
+                      barmode='group')
+    return fig
+
+
+def render():
+    st.header("Live Chain: Rolling Fairness")
+    st.markdown(f"""
+    Slots are produced continuously by {LIVE_VALIDATORS:,} validators placed in cities worldwide.
+    Only the most recent window of slots is kept, so the view can stay open indefinitely.
+    """)
+
+    c1, c2, c3 = st.columns(3)
+    running = c1.toggle("Running", value=True)
+    stake_distribution = c2.selectbox("Stake Distribution", ['uniform', 'exponential', 'pareto'])
+    window = c3.select_slider("Window (slots)", [1_000, 5_000, 10_000, 50_000], value=10_000)
+    slots_per_second = st.slider("Slots per Second", 100, 5_000, 1_000, step=100)
+
+    live_panel(stake_distribution, window, running, slots_per_second)
+
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def live_panel(stake_distribution, window, running, slots_per_second):
+    # Only this fragment reruns on each tick; the rest of the page is untouched
+    stream, window = live_state(stake_distribution, window)
+    if running:
+        with profiling.section("simulation:live_step"):
+            for _ in range(max(1, round(slots_per_second * REFRESH_SECONDS / 100))):
+                window.push(next(stream))
+
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Slot", f"{window.slot:,}")
+    m2.metric("Gini (Traditional)", f"{window.gini():.2f}")
+    m3.metric("Gini (VDF)", f"{window.gini(vdf=True):.2f}")
+    m4.metric("Empty Slots (VDF)", f"{window.empty_slots(vdf=True):,}")
+    n1, n2, n3, n4 = st.columns(4)
+    n1.metric("Nakamoto (Traditional)", window.tracker().nakamoto())
+    n2.metric("Nakamoto (VDF)", window.tracker(vdf=True).nakamoto())
+    n3.metric("KL from Stake (Traditional)", f"{window.tracker().kl_divergence():.3f}")
+    n4.metric("KL from Stake (VDF)", f"{window.tracker(vdf=True).kl_divergence():.3f}")
+
+    col1, col2 = st.columns(2)
+    col1.plotly_chart(share_figure(window), use_container_width=True)
+    col2.plotly_chart(gini_figure(window), use_container_width=True)
@@ -0,0 +1,62 @@
+"""Overview page."""
+
+import streamlit as st
+
+
+def render():
+    st.header("Research Overview")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.info("### The Problem")
+        st.write("""
+        Current Proof-of-Stake (PoS) blockchains claim to select leaders fairly, 
+        but provide no cryptographic proof. Validators with better network connections 
+        gain systematic advantages—a hidden form of centralization.
+        """)
+        
+    with col2:
+        st.info("### The Solution")
+        st.write("""
+        A hybrid **PoS + VDF + BFT + L2** architecture with **Fairness Witnesses**—cryptographic 
+        proofs that make fairness publicly verifiable.
+        """)
+        
+    with col3:
+        st.success("###  The Paradigm Shift")
+        st.write("""
+        From: **"Trust us, it's fair"**  
+        To: **"Here's the proof, verify it yourself"**
+        """)
+    
+    st.markdown("---")
+    
+    st.subheader("Key Contributions")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **1. Fairness Witnesses**
+        -  Winner was legitimately selected
+        -  Losers lost fairly (unbiased process)
+        -  Anyone can verify without secrets
+        -  Cryptographically binding
+        """)
+        
+        st.markdown("""
+        **2. VDF-Based Latency Neutralization**
+        - Eliminates geographic advantage
+        - Reduces Gini coefficient from 0.75 → 0.20
+        - Enables true global decentralization
+        """)
+        
+    with col2:
+        st.markdown("""
+        **3. Complete Trilemma Solution**
+        - **Security**: BFT (≤⅓ fault tolerance)
+        - **Decentralization**: VDF (Gini 0.20)
+        - **Scalability**: L2 Rollups (10,000+ TPS)
+        -  **Verifiable Fairness**: Fairness Witnesses
+        """)
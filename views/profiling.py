@@ -0,0 +1,235 @@
+"""Opt-in instrumentation of page renders, simulations and chart output.
+
+With instrumentation switched on in the sidebar, each script run records a
+tree of timed sections. Sections are:
+
+* the page render;
+* every function decorated with ``timed``, i.e. simulations, data builders
+  and figure builders, including their cache hits;
+* every ``plotly_chart`` / ``dataframe`` call, which covers serialising the
+  element for the browser.
+
+Optionally the whole run is profiled with ``cProfile``, and each section
+records its net and peak allocations with ``tracemalloc``. The report
+lists time and memory per section. It exports a Chrome trace, loadable in
+Perfetto or chrome://tracing, and a ``pstats`` dump.
+
+All state lives in the session, so other sessions pay one dictionary lookup
+per instrumented call. ``tracemalloc`` is process-wide, so allocations made
+by concurrent sessions also show up in the figures. It is started by the
+first session that asks for memory figures and stopped once the last such
+run finishes.
+"""
+
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+
+STATE_KEY = 'instrumentation_run'
+
+# Runs currently tracing allocations, across every session of the process
+_tracing_lock = threading.Lock()
+_tracing_runs = 0
+
+
+@dataclass
+class Section:
+    name: str
+    depth: int
+    start: float
+    seconds: float = 0.0
+    alloc_bytes: int = 0
+    peak_bytes: int = 0
+    base: int = 0
+
+
+@dataclass
+class Run:
+    profile: bool
+    memory: bool
+    origin: float = field(default_factory=time.perf_counter)
+    sections: list = field(default_factory=list)
+    stack: list = field(default_factory=list)
+    profiler: object = None
+    stats: object = None
+    finished: bool = False
+    tracing: bool = False
+
+
+def current_run():
+    """The session's active instrumentation run, or ``None`` when switched off."""
+    try:
+        return st.session_state.get(STATE_KEY)
+    except Exception:
+        # Outside a script run (worker processes, bare imports)
+        return None
+
+
+def _acquire_tracing():
+    global _tracing_runs
+    with _tracing_lock:
+        _tracing_runs += 1
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+def _release_tracing():
+    global _tracing_runs
+    with _tracing_lock:
+        _tracing_runs -= 1
+        if _tracing_runs == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def start_run(enabled, profile=False, memory=False):
+    """Begin recording this script run if instrumentation is enabled."""
+    # A run interrupted before it finished still holds the profiler and tracing
+    finish_run()
+    if not enabled:
+        st.session_state[STATE_KEY] = None
+        return
+    run = Run(profile, memory)
+    if memory:
+        _acquire_tracing()
+        run.tracing = True
+    if profile:
+        run.profiler = cProfile.Profile()
+        run.profiler.enable()
+    st.session_state[STATE_KEY] = run
+
+
+def finish_run():
+    """Stop profiling and tracing; the run's records stay available to the report."""
+    run = current_run()
+    if run is None or run.finished:
+        return
+    run.finished = True
+    if run.profiler is not None:
+        run.profiler.disable()
+        run.stats = pstats.Stats(run.profiler)
+        run.profiler = None
+    if run.tracing:
+        run.tracing = False
+        _release_tracing()
+
+
+@contextmanager
+def section(name):
+    """Time the enclosed block as a section of the current run."""
+    run = current_run()
+    if run is None or run.finished:
+        yield
+        return
+
+    record = Section(name, len(run.stack), time.perf_counter())
+    run.sections.append(record)
+    if run.memory:
+        record.base, peak = tracemalloc.get_traced_memory()
+        # Peaks are tracked per section, so fold the global peak so far into
+        # the enclosing sections before resetting it
+        for outer in run.stack:
+            outer.peak_bytes = max(outer.peak_bytes, peak - outer.base)
+        tracemalloc.reset_peak()
+    run.stack.append(record)
+    try:
+        yield
+    finally:
+        run.stack.pop()
+        record.seconds = time.perf_counter() - record.start
+        if run.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            record.alloc_bytes = current - record.base
+            for open_section in (*run.stack, record):
+                open_section.peak_bytes = max(open_section.peak_bytes, peak - open_section.base)
+            tracemalloc.reset_peak()
+
+
+def timed(category):
+    """Decorator recording each call as a ``category:function`` section."""
+    def decorate(fn):
+        name = f"{category}:{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with section(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _instrument_element(method):
+    original = getattr(DeltaGenerator, method)
+    if getattr(original, '_instrumented', False):
+        return
+
+    @functools.wraps(original)
+    def wrapper(self, *args, **kwargs):
+        with section(f"element:{method}"):
+            return original(self, *args, **kwargs)
+    wrapper._instrumented = True
+    setattr(DeltaGenerator, method, wrapper)
+
+
+# Chart and table output is where figures are serialised for the browser
+for _method in ('plotly_chart', 'dataframe'):
+    _instrument_element(_method)
+
+
+def chrome_trace(run):
+    """The run's sections in Chrome trace-event format."""
+    events = [{
+        'name': s.name, 'ph': 'X', 'pid': os.getpid(), 'tid': 0,
+        'ts': (s.start - run.origin) * 1e6, 'dur': s.seconds * 1e6,
+        'args': {'alloc_bytes': s.alloc_bytes, 'peak_bytes': s.peak_bytes},
+    } for s in run.sections]
+    return json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'})
+
+
+def pstats_dump(stats):
+    """Binary ``pstats`` dump, readable with ``pstats.Stats(path)`` or snakeviz."""
+    with tempfile.NamedTemporaryFile(suffix='.prof') as f:
+        stats.dump_stats(f.name)
+        return f.read()
+
+
+def render_report():
+    """Per-section breakdown and trace downloads for the current run."""
+    run = current_run()
+    if run is None:
+        return
+    totals = {}
+    for s in run.sections:
+        row = totals.setdefault(s.name, {'Section': '  ' * s.depth + s.name, 'Calls': 0, 'Total (ms)': 0.0,
+                                         'Alloc (KiB)': 0.0, 'Peak (KiB)': 0.0})
+        row['Calls'] += 1
+        row['Total (ms)'] += s.seconds * 1000
+        row['Alloc (KiB)'] += s.alloc_bytes / 1024
+        row['Peak (KiB)'] = max(row['Peak (KiB)'], s.peak_bytes / 1024)
+    rows = list(totals.values())
+    if not run.memory:
+        for row in rows:
+            del row['Alloc (KiB)'], row['Peak (KiB)']
+
+    with st.sidebar.expander("Instrumentation Report", expanded=True):
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+        st.download_button("Download Chrome Trace", chrome_trace(run), file_name="trace.json",
+                           mime="application/json")
+        if run.stats is not None:
+            text = io.StringIO()
+            run.stats.stream = text
+            run.stats.sort_stats('cumulative').print_stats(15)
+            st.code(text.getvalue(), language=None)
+            st.download_button("Download cProfile Stats", pstats_dump(run.stats), file_name="profile.prof",
+                               mime="application/octet-stream")
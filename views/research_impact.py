@@ -0,0 +1,72 @@
+"""Research Impact page."""
+
+import streamlit as st
+
+
+def render():
+    st.header("Research Impact")
+    
+    st.markdown("""
+    ### The Paradigm Shift
+    
+    From: **"Trust us, it's fair"**  
+    To: **"Here's the proof, verify it yourself"**
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.success("### Proposed Work True Decentralization")
+        st.write("""
+        - Global validator inclusion
+        - Geographic diversity (Gini: 0.20)
+        - No data center advantage
+        """)
+        
+    with col2:
+        st.success("### Stronger Security")
+        st.write("""
+        - Grinding attacks prevented (8% success)
+        - Manipulation detectable
+        - Economic attacks mitigated
+        """)
+    
+    st.markdown("---")
+    
+    st.subheader("Enabling New Use Cases")
+    
+    use_cases = {
+        "Financial Systems": "Require provable fairness for regulatory compliance",
+        "Voting Protocols": "Need verifiable unbiased selection",
+        "Regulated DeFi": "Auditability and transparency requirements",
+        "Global Participation": "No geographic barriers to entry"
+    }
+    
+    for use_case, description in use_cases.items():
+        st.markdown(f"**{use_case}:** {description}")
+    
+    st.markdown("---")
+    
+    st.subheader("Publications and Progress")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.info("**Completed** ")
+        st.write("""
+        - Theoretical framework
+        - Algorithm design
+        - Fairness Witness specification
+        - Security proofs
+        """)
+        
+    with col2:
+        st.info("**In Progress** ")
+        st.write("""
+        - Testnet deployment
+        - Performance optimization
+        - Formal verification
+        """)
+    
+    st.markdown("---")
+    st.caption("© 2025 - PhD Research on Verifiable Fairness in PoS Consensus")
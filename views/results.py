@@ -0,0 +1,140 @@
+"""Results page."""
+
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from . import charts, profiling
+from .common import (ROLLUP_BATCH_SIZE, STAKE_EPOCHS, comparison_frame, geographic_gini, grinding_results,
+                     rollup_benchmark, rollup_tps, stake_trajectories)
+
+
+@profiling.timed("figure")
+@st.cache_resource(max_entries=32)
+def gauge_figure(value, title, axis_max, steps, threshold):
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = value,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': title},
+        gauge = {
+            'axis': {'range': [0, axis_max]},
+            'bar': {'color': "green"},
+            'steps': [{'range': [low, high], 'color': color} for low, high, color in steps],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': threshold
+            }
+        }
+    ))
+    fig.update_layout(height=200)
+    return fig
+
+
+@profiling.timed("figure")
+@st.cache_resource(max_entries=8)
+def comparison_bar_figure(comparison_metric):
+    df = comparison_frame()
+    fig = px.bar(
+        df.sort_values(comparison_metric, ascending=comparison_metric in ['Geographic Gini', 'Grinding Attack %']),
+        x='Algorithm',
+        y=comparison_metric,
+        color='Algorithm',
+        title=f"{comparison_metric} by Algorithm",
+        color_discrete_map={'Proposed Work': 'green'}
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+
+@profiling.timed("figure")
+@st.cache_resource(max_entries=8)
+def trajectory_figure(stake_distribution, measure, title):
+    row = stake_trajectories(stake_distribution)
+    fig = go.Figure()
+    fig.add_trace(charts.line_trace(row['epoch'], row[measure], mode='lines', name='Traditional PoS',
+                                    line=dict(color='red', width=2)))
+    fig.add_trace(charts.line_trace(row['epoch'], row[f'{measure}_vdf'], mode='lines',
+                                    name='Proposed Work (with VDF)', line=dict(color='green', width=2)))
+    fig.update_layout(title=title, xaxis_title="Epoch", yaxis_title=title)
+    return fig
+
+
+def render():
+    st.header("📈 Quantitative Results")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        # Regional block shares against stake shares in the leader-election Monte Carlo
+        plain_gini, vdf_gini = geographic_gini()
+        st.metric("Geographic Fairness (Gini)", f"{vdf_gini:.2f}", delta=f"{vdf_gini - plain_gini:+.2f}",
+                  delta_color="inverse")
+        st.caption(f"Traditional PoS: {plain_gini:.2f}")
+        
+        gini_fig = gauge_figure(round(vdf_gini, 3), "Gini Coefficient", 1,
+                                ((0, 0.3, "lightgreen"), (0.3, 0.6, "yellow"), (0.6, 1, "red")), round(plain_gini, 3))
+        st.plotly_chart(gini_fig, use_container_width=True)
+        
+    with col2:
+        # Monte Carlo of a withholding/grinding adversary, without and with a VDF
+        plain, with_vdf = grinding_results()
+        low, high = with_vdf.confidence_interval()
+        st.metric("Grinding Attack Success", f"{with_vdf.rate:.1%}",
+                  delta=f"{(with_vdf.rate - plain.rate) * 100:+.1f} pp", delta_color="inverse")
+        st.caption(f"Traditional PoS: {plain.rate:.1%} · 95% CI {low:.2%}–{high:.2%} "
+                   f"over {with_vdf.trials:,} trials")
+        
+        attack_fig = gauge_figure(round(with_vdf.rate * 100, 1), "Attack Success Rate (%)", 100,
+                                  ((0, 20, "lightgreen"), (20, 50, "yellow"), (50, 100, "red")),
+                                  round(plain.rate * 100, 1))
+        st.plotly_chart(attack_fig, use_container_width=True)
+        
+    with col3:
+        # Measured on this host by the rollup sequencer benchmark
+        tps = rollup_tps()
+        st.metric("Scalability", f"{tps:,.0f} TPS", delta=f"{tps - 1500:+,.0f}")
+        st.caption(f"Traditional PoS: 1,500 TPS · measured at batch size {ROLLUP_BATCH_SIZE:,}")
+        
+        tps_fig = gauge_figure(round(tps / 1000, 1), "Throughput (thousands TPS)", max(60, -(-tps // 10_000) * 10),
+                               ((0, 10, "red"), (10, 30, "yellow"), (30, 60, "lightgreen")), 1.5)
+        st.plotly_chart(tps_fig, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Bar chart comparison
+    st.subheader("Performance Comparison")
+    
+    comparison_metric = st.selectbox(
+        "Select metric to compare",
+        ['Geographic Gini', 'Grinding Attack %', 'TPS (thousands)']
+    )
+    
+    st.plotly_chart(comparison_bar_figure(comparison_metric), use_container_width=True)
+
+    with st.expander("Rollup Throughput Benchmark"):
+        st.caption("Transactions are batched, applied to 65,536 account balances and committed to a "
+                   "Merkle state root per batch, with the tree sharded over worker processes.")
+        b1, b2 = st.columns(2)
+        batch_sizes = b1.multiselect("Batch Sizes", [500, 2_000, 8_000, 32_000], default=[500, 2_000, 8_000])
+        worker_counts = b2.multiselect("Workers", [1, 2, 4, 8], default=[1])
+        if batch_sizes and worker_counts and st.button("Run Benchmark"):
+            table = rollup_benchmark(tuple(sorted(batch_sizes)), tuple(sorted(worker_counts)))
+            st.dataframe(table.style.format({'TPS': '{:,.0f}', 'p50 Batch Latency (ms)': '{:.1f}',
+                                             'p99 Batch Latency (ms)': '{:.1f}'}),
+                         hide_index=True, use_container_width=True)
+
+    with st.expander("Decentralization Over Time"):
+        st.caption(f"Stake evolves over {STAKE_EPOCHS:,} epochs as rewards compound, validators are slashed and "
+                   "churn. Proposer rewards follow each protocol's regional win advantage.")
+        stake_distribution = st.selectbox("Initial Stake Distribution", ['uniform', 'exponential', 'pareto'],
+                                          key='trajectory_stake_distribution')
+        if st.button("Run Stake Dynamics"):
+            t1, t2, t3 = st.columns(3)
+            t1.plotly_chart(trajectory_figure(stake_distribution, 'geographic_gini', "Geographic Gini"),
+                            use_container_width=True)
+            t2.plotly_chart(trajectory_figure(stake_distribution, 'stake_gini', "Stake Gini"),
+                            use_container_width=True)
+            t3.plotly_chart(trajectory_figure(stake_distribution, 'nakamoto', "Nakamoto Coefficient"),
+                            use_container_width=True)
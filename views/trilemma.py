@@ -0,0 +1,90 @@
+"""Blockchain Trilemma page."""
+
+import plotly.graph_objects as go
+import streamlit as st
+from plotly.subplots import make_subplots
+
+from . import profiling
+
+
+@profiling.timed("figure")
+@st.cache_resource
+def trilemma_figure():
+    # Create a radar chart for the trilemma
+    fig = make_subplots(rows=1, cols=2, specs=[[{'type': 'scatterpolar'}, {'type': 'table'}]])
+    
+    # Add Bitcoin
+    fig.add_trace(go.Scatterpolar(
+        r=[9, 9, 2, 2],
+        theta=['Security', 'Decentralization', 'Scalability', 'Security'],
+        fill='toself',
+        name='Bitcoin (PoW)',
+        line_color='gold',
+        opacity=0.7
+    ), row=1, col=1)
+    
+    # Add Solana
+    fig.add_trace(go.Scatterpolar(
+        r=[7, 5, 10, 7],
+        theta=['Security', 'Decentralization', 'Scalability', 'Security'],
+        fill='toself',
+        name='Solana (PoH)',
+        line_color='purple',
+        opacity=0.7
+    ), row=1, col=1)
+    
+    # Add Proposed Work
+    fig.add_trace(go.Scatterpolar(
+        r=[9, 9, 9, 9],
+        theta=['Security', 'Decentralization', 'Scalability', 'Security'],
+        fill='toself',
+        name='Proposed Work',
+        line_color='green',
+        line_width=3
+    ), row=1, col=1)
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 10]
+            )),
+        showlegend=True,
+        height=500
+    )
+    
+    # Add comparison table
+    trilemma_data = [
+        ["Algorithm", "Security", "Decentralization", "Scalability", "Trade-off"],
+        ["Bitcoin", " High", " High", "Proposed Work Low (7 TPS)", "Sacrifices scalability"],
+        ["Solana", "Proposed Work Medium", "Proposed Work Low (Gini 0.70)", " High (65K TPS)", "Sacrifices decentralization"],
+        ["Ethereum", "Proposed Work Medium", "Proposed Work Medium", "Proposed Work Medium", "Compromises all three"],
+        ["Proposed Work", " High", " High", " High", "No trade-off"]
+    ]
+    
+    fig.add_trace(go.Table(
+        header=dict(values=trilemma_data[0],
+                   fill_color='paleturquoise',
+                   align='left'),
+        cells=dict(values=list(zip(*trilemma_data[1:])),
+                  fill_color='lavender',
+                  align='left')
+    ), row=1, col=2)
+
+    return fig
+
+
+def render():
+    st.header("The Blockchain Trilemma")
+    
+    st.markdown("""
+    *"No blockchain can simultaneously achieve optimal security, decentralization, and scalability."*  
+    — Vitalik Buterin, 2017
+    """)
+    
+    st.plotly_chart(trilemma_figure(), use_container_width=True)
+    
+    st.info("""
+    **Key Insight:** Traditional blockchains optimize two dimensions at the expense of the third.  
+    ★ **Proposed Work** achieves balance across all three dimensions while adding verifiable fairness.
+    """)
@@ -0,0 +1,299 @@
+"""VDF Simulation page."""
+
+import time
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from simulation import geo, testbed, vdf
+from simulation.jobs import JobLimitError
+
+from . import charts, profiling
+from .common import job_runner, session_owner, session_results, simulation_point
+
+
+# Gossip network behind the propagation section; nodes split evenly into the
+# slider-latency classes
+NETWORK_NODES = 2_000
+NETWORK_BLOCKS = 200
+
+# Slots per end-to-end testbed run
+TESTBED_SLOTS = 5
+
+
+@profiling.timed("simulation")
+@st.cache_resource(show_spinner="Calibrating squarings per second...")
+def squaring_rate():
+    # Host property, shared by every session
+    return vdf.calibrate()
+
+
+# Slider-keyed figures: moving one slider rebuilds only the charts that depend on it
+@profiling.timed("figure")
+@st.cache_resource(max_entries=256)
+def propagation_figure(fast_latency, slow_latency):
+    # Create timeline visualization
+    timeline_data = {
+        'Node': ['Fast Node', 'Slow Node'],
+        'Time to See Block (ms)': [fast_latency, slow_latency],
+        'Time to Respond (ms)': [fast_latency + 50, slow_latency + 50]
+    }
+    timeline_df = pd.DataFrame(timeline_data)
+    
+    return px.bar(timeline_df, x='Node', y='Time to See Block (ms)', 
+                  color='Node', title="Block Propagation Time",
+                  color_discrete_map={'Fast Node': 'blue', 'Slow Node': 'red'})
+
+
+@profiling.timed("figure")
+@st.cache_resource(max_entries=256)
+def vdf_stack_figure(fast_latency, slow_latency, vdf_time):
+    vdf_data = {
+        'Node': ['Fast Node', 'Slow Node'],
+        'VDF Time (ms)': [vdf_time * 1000, vdf_time * 1000],
+        'Network Latency (ms)': [fast_latency, slow_latency],
+        'Total Time (ms)': [vdf_time * 1000 + fast_latency, vdf_time * 1000 + slow_latency]
+    }
+    
+    return px.bar(vdf_data, x='Node', y=['VDF Time (ms)', 'Network Latency (ms)'],
+                  title="VDF + Latency (Stacked)",
+                  color_discrete_map={'VDF Time (ms)': 'green', 'Network Latency (ms)': 'orange'})
+
+
+@profiling.timed("data")
+def network_summary(fast_latency, slow_latency, vdf_time):
+    row = simulation_point('network', nodes=NETWORK_NODES, blocks=NETWORK_BLOCKS, fast_latency=fast_latency,
+                           slow_latency=slow_latency, vdf_time=float(vdf_time))
+    rows = []
+    for node_class in ('fast', 'slow'):
+        for measure, label in (('see', 'Time to See Block'), ('respond', 'Time to Respond'),
+                               ('respond_vdf', 'Time to Respond (VDF)')):
+            rows.append({'Node Class': node_class.capitalize(), 'Measure': label,
+                         **{f"p{q} (ms)": row[f"{node_class}_{measure}_p{q}"] for q in (50, 90, 99)}})
+    return pd.DataFrame(rows)
+
+
+@profiling.timed("figure")
+@st.cache_resource(max_entries=64)
+def see_distribution_figure(fast_latency, slow_latency, vdf_time):
+    import plotly.graph_objects as go
+
+    # Binned in the simulation, so the payload is one bar per bin whatever the run size
+    row = simulation_point('network', nodes=NETWORK_NODES, blocks=NETWORK_BLOCKS, fast_latency=fast_latency,
+                           slow_latency=slow_latency, vdf_time=float(vdf_time))
+    fig = go.Figure()
+    for node_class, color in (('fast', 'blue'), ('slow', 'red')):
+        fig.add_trace(charts.histogram_trace(row['see_hist_edges_ms'], row[f"{node_class}_see_hist"],
+                                             name=f"{node_class.capitalize()} Nodes", marker_color=color,
+                                             opacity=0.6))
+    fig.update_layout(title="Time to See Block Distribution", barmode='overlay',
+                      xaxis_title="Time to See Block (ms)", yaxis_title="Node-Blocks")
+    return fig
+
+
+def render():
+    st.header("Proposed Work VDF Simulation: Neutralizing Latency Advantage")
+    
+    st.markdown("""
+    **Verifiable Delay Function (VDF)** - Forces minimum computation time, making network latency irrelevant.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Without VDF (Traditional PoS)")
+        
+        # Simulate fast node
+        fast_latency = st.slider("Fast Node Latency (ms)", 10, 200, 50, key="fast")
+        slow_latency = st.slider("Slow Node Latency (ms)", 100, 500, 300, key="slow")
+        
+        fast_advantage = (slow_latency - fast_latency) / slow_latency * 100
+        
+        st.plotly_chart(propagation_figure(fast_latency, slow_latency), use_container_width=True)
+        
+        st.metric("Fast Node Advantage", f"{fast_advantage:.1f}%", delta="Unfair")
+        
+    with col2:
+        st.subheader("With VDF (Proposed Work)")
+        
+        vdf_time = st.slider("VDF Computation Time (seconds)", 1, 10, 5)
+        
+        # With VDF, latency becomes irrelevant
+        fast_total = vdf_time * 1000 + fast_latency
+        slow_total = vdf_time * 1000 + slow_latency
+        time_diff = ((slow_total - fast_total) / slow_total) * 100
+        
+        st.plotly_chart(vdf_stack_figure(fast_latency, slow_latency, vdf_time), use_container_width=True)
+        
+        st.metric("Time Difference", f"{time_diff:.1f}%", delta="Negligible")
+        
+        if time_diff < 5:
+            st.success(" VDF successfully neutralized latency advantage!")
+        else:
+            st.warning("Proposed Work Increase VDF time to fully neutralize latency")
+    
+    st.subheader("Gossip Network Simulation")
+    st.markdown(f"""
+    Blocks gossiped from random proposers over a {NETWORK_NODES:,}-validator network: half the nodes
+    have the fast latency and 1 Gbit/s links, half the slow latency and 50 Mbit/s links.
+    """)
+    table = network_summary(fast_latency, slow_latency, vdf_time)
+    st.dataframe(table.style.format({'p50 (ms)': '{:,.0f}', 'p90 (ms)': '{:,.0f}', 'p99 (ms)': '{:,.0f}'}),
+                 hide_index=True, use_container_width=True)
+
+    median = table.set_index(['Node Class', 'Measure'])['p50 (ms)']
+    n1, n2 = st.columns(2)
+    for column, measure, title in ((n1, 'Time to Respond', "Median Fast Advantage (No VDF)"),
+                                   (n2, 'Time to Respond (VDF)', "Median Fast Advantage (VDF)")):
+        fast, slow = median['Fast', measure], median['Slow', measure]
+        column.metric(title, f"{(slow - fast) / slow * 100:.1f}%")
+    st.plotly_chart(see_distribution_figure(fast_latency, slow_latency, vdf_time), use_container_width=True)
+
+    # Real VDF: repeated squaring in the RSA-2048 group, calibrated so the
+    # slider's seconds map to squarings on this host
+    scheme = st.radio("Proof Scheme", ["Wesolowski", "Pietrzak"], horizontal=True)
+
+    # Start simulation button; the VDF runs in the shared background pool so
+    # this session keeps rendering while it computes
+    if st.button("Run VDF Computation Simulation", disabled=st.session_state.vdf_running):
+        T = vdf.iterations_for(vdf_time, squaring_rate())
+        try:
+            st.session_state.vdf_job = job_runner().submit(
+                vdf.run, f"slot-{time.time_ns()}".encode(), T, scheme.lower(),
+                owner=session_owner(), label=f"{scheme}, {T:,} squarings")
+        except JobLimitError as exc:
+            st.warning(str(exc))
+        else:
+            st.session_state.vdf_running = True
+            st.session_state.vdf_progress = 0
+
+    handle = st.session_state.get('vdf_job')
+    if handle is not None:
+        if st.session_state.vdf_running:
+            vdf_job_status()
+        else:
+            show_vdf_result(handle)
+
+    st.subheader("End-to-End Testbed")
+    st.markdown(f"""
+    Validator nodes run as asyncio tasks in one process. Messages between them are delayed by
+    city-to-city latency with jitter, and every slot runs the real VDF followed by prevote and
+    precommit rounds. Runs {TESTBED_SLOTS} slots with the VDF time above.
+    """)
+    nodes = st.select_slider("Testbed Nodes", [25, 50, 100, 200, 400], value=100)
+    # Otherwise one evaluation per slot stands in for every node's identical one
+    each_node = st.checkbox("Evaluate the VDF on every node", disabled=nodes > testbed.EACH_NODE_MAX,
+                            help=f"Up to {testbed.EACH_NODE_MAX} nodes. Evaluations beyond this host's "
+                                 "cores queue, so slot times include waiting for a core.")
+    # A box ticked at fewer nodes stays ticked when disabled
+    each_node = each_node and nodes <= testbed.EACH_NODE_MAX
+    testbed_handle = st.session_state.get('testbed_job')
+    running = testbed_handle is not None and not testbed_handle.done()
+    if st.button("Run Testbed", disabled=running):
+        try:
+            st.session_state.testbed_job = job_runner().submit(
+                testbed.run, nodes, TESTBED_SLOTS, float(vdf_time), each_node=each_node,
+                owner=session_owner(), label=f"{nodes} nodes, {TESTBED_SLOTS} slots")
+        except JobLimitError as exc:
+            st.warning(str(exc))
+        else:
+            running = True
+            session_results().pop('testbed', None)
+    if running:
+        testbed_job_status()
+        return
+    if testbed_handle is not None and testbed_handle.status == 'done':
+        # Kept against this session's memory budget rather than pinned by the job handle
+        session_results()['testbed'] = testbed_handle.result()
+        del st.session_state.testbed_job
+    elif testbed_handle is not None:
+        show_testbed_failure(testbed_handle)
+        return
+    result = session_results().get('testbed')
+    if result is not None:
+        show_testbed_result(result)
+
+
+@st.fragment(run_every=0.5)
+def vdf_job_status():
+    handle = st.session_state.vdf_job
+    if handle.done():
+        # Full rerun drops this polling fragment and renders the result
+        st.session_state.vdf_running = False
+        st.rerun()
+
+    st.session_state.vdf_progress = int(handle.progress() * 100)
+    if handle.status == 'queued':
+        text = f"Queued behind other simulations ({handle.label})"
+    elif st.session_state.vdf_progress < 100:
+        text = f"Computing VDF ({handle.label})"
+    else:
+        text = f"Generating and verifying proof ({handle.label})"
+    st.progress(st.session_state.vdf_progress, text=text)
+    if st.button("Cancel VDF Computation"):
+        handle.cancel()
+
+
+def show_vdf_result(handle):
+    if handle.status == 'cancelled':
+        st.info(f"VDF computation cancelled at {handle.progress():.0%}.")
+        return
+    if handle.status == 'failed':
+        st.error(f"VDF computation failed: {handle.future.exception()}")
+        return
+
+    run = handle.result()
+    scheme = run.scheme.capitalize()
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Evaluation Time", f"{run.eval_seconds:.2f} s")
+    m2.metric("Proof Generation", f"{run.prove_seconds:.2f} s")
+    m3.metric("Verification Time", f"{run.verify_seconds * 1000:.1f} ms")
+    m4.metric("Verify Speedup", f"{run.speedup:,.0f}×")
+
+    if run.valid:
+        st.success(f"VDF computation complete! All nodes finished together after {run.eval_seconds:.2f} seconds "
+                   f"({run.T:,} squarings); anyone can verify the {scheme} proof in {run.verify_seconds * 1000:.1f} ms.")
+    else:
+        st.error(f"{scheme} proof failed verification.")
+
+
+@st.fragment(run_every=0.5)
+def testbed_job_status():
+    handle = st.session_state.testbed_job
+    if handle.done():
+        st.rerun()
+    text = "Queued behind other simulations" if handle.status == 'queued' else "Running testbed"
+    st.progress(int(handle.progress() * 100), text=f"{text} ({handle.label})")
+    if st.button("Cancel Testbed"):
+        handle.cancel()
+
+
+def show_testbed_failure(handle):
+    if handle.status == 'cancelled':
+        st.info("Testbed run cancelled.")
+    else:
+        st.error(f"Testbed run failed: {handle.future.exception()}")
+
+
+def show_testbed_result(result):
+    import numpy as np
+    import plotly.graph_objects as go
+
+    lag_p99 = float(np.percentile(result.loop_lag_ms, 99)) if len(result.loop_lag_ms) else 0.0
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Median Slot Time", f"{np.median(result.slot_s):.2f} s")
+    m2.metric("VDF Evaluation", f"{np.median(result.vdf_s):.2f} s")
+    m3.metric("Messages per Second", f"{result.messages_per_second:,.0f}")
+    m4.metric("Event Loop Lag (p99)", f"{lag_p99:.0f} ms")
+
+    region_lag = result.region_lag_ms()
+    fig = go.Figure(go.Bar(x=geo.REGIONS, y=region_lag, marker_color='green'))
+    fig.update_layout(title="Commit Delay Behind the First Commit, by Region", yaxis_title="Delay (ms)")
+    st.plotly_chart(fig, use_container_width=True)
+    spread = region_lag.max() - region_lag.min()
+    st.caption(f"The regional spread of {spread:.0f} ms is {spread / 10 / np.median(result.slot_s):.1f}% "
+               f"of the median slot time.")
+    if lag_p99 > 100:
+        st.warning("The event loop lagged by over 100 ms at times, so this host was CPU-bound and slot "
+                   "times include scheduling delay. Try fewer nodes.")